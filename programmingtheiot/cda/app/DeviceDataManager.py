@@ -20,6 +20,7 @@ from programmingtheiot.cda.connection.MqttClientConnector import MqttClientConne
 from programmingtheiot.cda.system.ActuatorAdapterManager import ActuatorAdapterManager
 from programmingtheiot.cda.system.SensorAdapterManager import SensorAdapterManager
 from programmingtheiot.cda.system.SystemPerformanceManager import SystemPerformanceManager
+from programmingtheiot.cda.system.TelemetryDeadbandFilter import TelemetryDeadbandFilter
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 
@@ -33,6 +34,7 @@ from programmingtheiot.common.ITelemetryDataListener import ITelemetryDataListen
 from programmingtheiot.data.DataUtil import DataUtil
 from programmingtheiot.data.ActuatorData import ActuatorData
 from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
 from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
 
 from programmingtheiot.cda.connection.AsyncCoapClientConnector import AsyncCoapClientConnector
@@ -67,6 +69,17 @@ class DeviceDataManager(IDataMessageListener):
 		# NOTE: this can also be retrieved from the configuration file
 		self.enableActuation = True
 		
+		self.enableBatchUpstream = \
+			self.configUtil.getBoolean(\
+				section=ConfigConst.CONSTRAINED_DEVICE, key=ConfigConst.ENABLE_BATCH_UPSTREAM_KEY)
+		
+		self.enableDeadbandFilter = \
+			self.configUtil.getBoolean(\
+				section=ConfigConst.CONSTRAINED_DEVICE, key=ConfigConst.ENABLE_DEADBAND_FILTER_KEY)
+		
+		# suppresses unchanged readings between sensor analysis and upstream transmission
+		self.deadbandFilter = TelemetryDeadbandFilter(self.configUtil) if self.enableDeadbandFilter else None
+		
 		self.sysPerfMgr = None
 		self.sensorAdapterMgr = None
 		self.actuatorAdapterMgr = None
@@ -202,12 +215,12 @@ class DeviceDataManager(IDataMessageListener):
 			# store the data in the cache
 			self.actuatorResponseCache[data.getName()] = data
 			
-			# convert ActuatorData to JSON and get the msg resource
-			actuatorMsg = DataUtil().actuatorDataToJson(data)
+			# get the msg resource
 			resourceName = ResourceNameEnum.CDA_ACTUATOR_RESPONSE_RESOURCE
 			
-			# delegate to the transmit function any potential upstream comm's
-			self._handleUpstreamTransmission(resource=resourceName, msg=actuatorMsg)
+			# delegate to the transmit function any potential upstream comm's,
+			# which will convert ActuatorData to each transport's payload format
+			self._handleUpstreamTransmission(resource=resourceName, data=data)
 			
 			return True
 		else:
@@ -233,11 +246,14 @@ class DeviceDataManager(IDataMessageListener):
 			# TODO: Optionally, implement `_handleSensorDataAnalysis()` to handle internal analytics
 			self._handleSensorDataAnalysis(data = data)
 			
-			# Convert the `SensorData` instance to JSON
-			jsonData = DataUtil().sensorDataToJson(data = data)
+			if self.deadbandFilter and not self.deadbandFilter.isForwarded(data):
+				logging.debug("Sensor data within deadband. Not sent upstream: %s", data.getName())
+				
+				return True
 			
-			# Pass the resource and newly generated JSON data to `_handleUpstreamTransmission()`
-			self._handleUpstreamTransmission(resource = ResourceNameEnum.CDA_SENSOR_MSG_RESOURCE, msg = jsonData)
+			# Pass the resource and `SensorData` instance to `_handleUpstreamTransmission()`,
+			# which will convert it to each transport's payload format (e.g. JSON)
+			self._handleUpstreamTransmission(resource = ResourceNameEnum.CDA_SENSOR_MSG_RESOURCE, data = data)
 			
 			return True
 		else:
@@ -245,6 +261,50 @@ class DeviceDataManager(IDataMessageListener):
 			
 			return False
 	
+	def handleSensorMessages(self, dataList: list = None) -> bool:
+		"""
+		This callback method will be invoked by the sensor adapter manager once per
+		poll cycle, with all readings of that cycle. Each reading is analyzed, and
+		the readings are then sent upstream as individual SensorData messages (see
+		ResourceNameEnum.CDA_SENSOR_MSG_RESOURCE). If 'enableBatchUpstream' is set,
+		they're instead sent as a single SensorDataBatch envelope (see
+		ResourceNameEnum.CDA_SENSOR_BATCH_MSG_RESOURCE) - serialized once per
+		payload format, with one transport call per transport.
+		
+		@param dataList The list of incoming SensorData messages.
+		@return boolean
+		"""
+		if not dataList:
+			logging.warning("Incoming sensor data batch is invalid (empty). Ignoring.")
+			
+			return False
+		
+		# a single reading is sent as a regular sensor message
+		if len(dataList) == 1:
+			return self.handleSensorMessage(data = dataList[0])
+		
+		logging.info("Incoming sensor data batch received (from sensor manager): %r readings", len(dataList))
+		
+		for data in dataList:
+			self._handleSensorDataAnalysis(data = data)
+		
+		if self.deadbandFilter:
+			dataList = self.deadbandFilter.filterSensorData(dataList)
+			
+			if not dataList:
+				logging.debug("Sensor data batch within deadband. Not sent upstream.")
+				
+				return True
+		
+		if self.enableBatchUpstream and len(dataList) > 1:
+			self._handleUpstreamTransmission( \
+				resource = ResourceNameEnum.CDA_SENSOR_BATCH_MSG_RESOURCE, data = SensorDataBatch.fromSensorDataList(dataList))
+		else:
+			for data in dataList:
+				self._handleUpstreamTransmission(resource = ResourceNameEnum.CDA_SENSOR_MSG_RESOURCE, data = data)
+		
+		return True
+	
 	def handleSystemPerformanceMessage(self, data: SystemPerformanceData) -> bool:
 		"""
 		This callback method will be invoked by the system performance manager that just
@@ -356,19 +416,42 @@ class DeviceDataManager(IDataMessageListener):
 			# task implementations, and not this function
 			self.handleActuatorCommandMessage(ad)
 		
-	def _handleUpstreamTransmission(self, resource = None, msg: str = None):
+	def _getUpstreamPayload(self, client, msg: str, data, payloads: dict):
+		if data is None:
+			return msg
+		
+		payloadFormat = client.getPayloadFormat()
+		
+		if payloadFormat not in payloads:
+			if isinstance(data, SensorDataBatch):
+				payloads[payloadFormat] = DataUtil().sensorDataBatchToPayload(data, payloadFormat)
+			else:
+				payloads[payloadFormat] = DataUtil().iotDataToPayload(data, payloadFormat)
+		
+		return payloads[payloadFormat]
+	
+	def _handleUpstreamTransmission(self, resource = None, msg: str = None, data = None):
+		"""
+		Sends 'msg' - or if 'data' is set, its payload - upstream using each
+		enabled transport. The payload for 'data' (a BaseIotData instance,
+		or a SensorDataBatch envelope) is generated using each transport's
+		configured payload format (JSON or binary), and only once per format.
+		"""
 		logging.info("Upstream transmission invoked. Checking comm's integration.")
 		
+		# caches the generated payload for each payload format
+		payloads = {}
+		
 		# NOTE: If using MQTT, the following will attempt to publish the message to the broker
 		if self.mqttClient:
-			if self.mqttClient.publishMessage(resource = resource, msg = msg):
+			if self.mqttClient.publishMessage(resource = resource, msg = self._getUpstreamPayload(self.mqttClient, msg, data, payloads)):
 				logging.debug("Published incoming data to resource (MQTT): %s", str(resource))
 			else:
 				logging.warning("Failed to publish incoming data to resource (MQTT): %s", str(resource))
 		
 		# NOTE: If using CoAP, the following will attempt to PUT the message to the server
 		if self.coapClient:
-			if self.coapClient.sendPutRequest(resource = resource, payload = msg):
+			if self.coapClient.sendPutRequest(resource = resource, payload = self._getUpstreamPayload(self.coapClient, msg, data, payloads)):
 				logging.debug("Put incoming message data to resource (CoAP): %s", str(resource))
 			else:
 				logging.warning("Failed to put incoming message data to resource (CoAP): %s", str(resource))
\ No newline at end of file
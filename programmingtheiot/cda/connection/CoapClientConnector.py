@@ -47,6 +47,7 @@ class CoapClientConnector(IRequestResponseClient):
 		
 		self.host = self.config.getProperty(ConfigConst.COAP_GATEWAY_SERVICE, ConfigConst.HOST_KEY, ConfigConst.DEFAULT_HOST)
 		self.port = self.config.getInteger(ConfigConst.COAP_GATEWAY_SERVICE, ConfigConst.PORT_KEY, ConfigConst.DEFAULT_COAP_PORT)
+		self.payloadFormat = self.config.getProperty(ConfigConst.COAP_GATEWAY_SERVICE, ConfigConst.PAYLOAD_FORMAT_KEY, ConfigConst.JSON_PAYLOAD_FORMAT)
 				
 		self.includeDebugLogDetail = True
 		self.uriPath = f"coap://{self.host}:{self.port}/"
@@ -67,6 +68,15 @@ class CoapClientConnector(IRequestResponseClient):
 		
 		logging.info(f"CoAP client will connect to: {self.uriPath}")
 	
+	def getPayloadFormat(self) -> str:
+		"""
+		Returns the payload format to use when sending data with this client,
+		as configured via ConfigConst.PAYLOAD_FORMAT_KEY.
+		
+		@return str Either ConfigConst.JSON_PAYLOAD_FORMAT or ConfigConst.BINARY_PAYLOAD_FORMAT.
+		"""
+		return self.payloadFormat
+	
 	def sendDiscoveryRequest(self, timeout: int = IRequestResponseClient.DEFAULT_TIMEOUT) -> bool:
 		logging.info("Discovering remote resources...")
 		
@@ -123,6 +133,8 @@ class CoapClientConnector(IRequestResponseClient):
 			request.token = generate_random_token(2)
 			request.payload = payload
 			
+			self._setContentType(request, payload)
+			
 			if not enableCON:
 				request.type = defines.Types["NON"]
 			
@@ -142,6 +154,8 @@ class CoapClientConnector(IRequestResponseClient):
 			request.token = generate_random_token(2)
 			request.payload = payload
 			
+			self._setContentType(request, payload)
+			
 			if not enableCON:
 				request.type = defines.Types["NON"]
 						
@@ -267,7 +281,7 @@ class CoapClientConnector(IRequestResponseClient):
 				logging.info(f"ActuatorData received: {jsonData}")
 				
 				try:
-					ad = DataUtil().jsonToActuatorData(jsonData)
+					ad = DataUtil().payloadToActuatorData(jsonData, lenient = True)
 					
 					if self.dataMsgListener:
 						self.dataMsgListener.handleActuatorCommandMessage(ad)
@@ -287,6 +301,11 @@ class CoapClientConnector(IRequestResponseClient):
 		
 		logging.info(f"POST response received: {response.payload}")
 	
+	def _setContentType(self, request, payload):
+		# binary payloads are sent as bytes; JSON payloads are left as-is
+		if isinstance(payload, (bytes, bytearray)):
+			request.content_type = defines.Content_types["application/octet-stream"]
+	
 	def _onPutResponse(self, response):
 		if not response:
 			logging.warning("PUT response invalid. Ignoring.")
@@ -318,7 +337,7 @@ class HandleActuatorEvent():
 			
 			if self.listener:
 				try:
-					data = DataUtil().jsonToActuatorData(jsonData = jsonData)
+					data = DataUtil().payloadToActuatorData(jsonData, lenient = True)
 					self.listener.handleActuatorCommandMessage(data = data)
 
 				except:
@@ -44,7 +44,8 @@ class IPubSubClient():
 		and log a message, and return False.
 		
 		@param resource The topic Enum containing the topic value to publish the message to.
-		@param msg The message to publish. This is expected to be well-formed JSON.
+		@param msg The message to publish. This is expected to be well-formed JSON,
+		or a binary payload (bytes) if the client's payload format is binary.
 		@param qos The QoS level. This is expected to be 0 - 2. Default is DEFAULT_QOS.
 		@return bool True on success; False otherwise.
 		"""
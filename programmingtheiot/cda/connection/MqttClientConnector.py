@@ -61,6 +61,10 @@ class MqttClientConnector(IPubSubClient):
 		self.config.getInteger( \
 			ConfigConst.MQTT_GATEWAY_SERVICE, ConfigConst.DEFAULT_QOS_KEY, ConfigConst.DEFAULT_QOS)
 	
+		self.payloadFormat = \
+		self.config.getProperty( \
+			ConfigConst.MQTT_GATEWAY_SERVICE, ConfigConst.PAYLOAD_FORMAT_KEY, ConfigConst.JSON_PAYLOAD_FORMAT)
+	
 		self.mqttClient = None
 		
 		
@@ -95,6 +99,7 @@ class MqttClientConnector(IPubSubClient):
 		logging.info('\tMQTT Broker Host: ' + self.host)
 		logging.info('\tMQTT Broker Port: ' + str(self.port))
 		logging.info('\tMQTT Keep Alive:  ' + str(self.keepAlive))
+		logging.info('\tMQTT Payload Fmt: ' + self.payloadFormat)
 
 	def connectClient(self) -> bool:
 		if not self.mqttClient:
@@ -132,6 +137,15 @@ class MqttClientConnector(IPubSubClient):
 		
 		return False
 		
+	def getPayloadFormat(self) -> str:
+		"""
+		Returns the payload format to use when publishing data with this client,
+		as configured via ConfigConst.PAYLOAD_FORMAT_KEY.
+		
+		@return str Either ConfigConst.JSON_PAYLOAD_FORMAT or ConfigConst.BINARY_PAYLOAD_FORMAT.
+		"""
+		return self.payloadFormat
+	
 	def onConnect(self, client, userdata, flags, rc):
 		logging.info('[Callback] Connected to MQTT broker. Result code: ' + str(rc))
 	
@@ -170,8 +184,9 @@ class MqttClientConnector(IPubSubClient):
 	
 		if self.dataMsgListener:
 			try:
-				# assumes all data is encoded using UTF-8 (between GDA and CDA)
-				actuatorData = DataUtil().jsonToActuatorData(msg.payload.decode('utf-8'))
+				# assumes JSON data is encoded using UTF-8 (between GDA and CDA);
+				# binary payloads are detected automatically
+				actuatorData = DataUtil().payloadToActuatorData(msg.payload)
 			
 				self.dataMsgListener.handleActuatorCommandMessage(actuatorData)
 			except:
@@ -202,6 +217,41 @@ class MqttClientConnector(IPubSubClient):
 		# as it will return before the publish may successfully complete
 		return True
 	
+	def publishCachedPayloads(self, resource: ResourceNameEnum = None, payloadCache = None, startIndex: int = 0, count: int = None, qos: int = ConfigConst.DEFAULT_QOS) -> int:
+		"""
+		Publishes pre-rendered payloads from a SensorDataPayloadCache, e.g. for
+		replay and load tests. All payloads share one time stamp (rendered once
+		per call), so each message is just a template fill and a send.
+		
+		@param resource The resource (topic) to publish to.
+		@param payloadCache The SensorDataPayloadCache to publish from.
+		@param startIndex The index of the first payload (wraps around).
+		@param count The number of messages to publish. Defaults to all payloads.
+		@param qos The QoS level for all messages.
+		@return int The number of messages published.
+		"""
+		if not resource:
+			logging.warning('No topic specified. Cannot publish cached payloads.')
+			return 0
+		
+		if not payloadCache:
+			logging.warning('No payload cache specified. Cannot publish cached payloads to topic: ' + resource.value)
+			return 0
+		
+		if qos < 0 or qos > 2:
+			qos = ConfigConst.DEFAULT_QOS
+		
+		if count is None:
+			count = payloadCache.getPayloadCount()
+		
+		topic = resource.value
+		timeStamp = payloadCache.renderTimeStamp()
+		
+		for index in range(startIndex, startIndex + count):
+			self.mqttClient.publish(topic = topic, payload = payloadCache.getPayload(index, timeStamp), qos = qos)
+		
+		return count
+	
 	def subscribeToTopic(self, resource: ResourceNameEnum = None, callback = None, qos: int = ConfigConst.DEFAULT_QOS) -> bool:
 		# check validity of resource (topic)
 		if not resource:
@@ -45,6 +45,12 @@ class GetSystemPerformanceResourceHandler(Resource, ISystemPerformanceDataListen
 				key = ConfigConst.POLL_CYCLES_KEY, \
 				defaultVal = ConfigConst.DEFAULT_POLL_CYCLES)
 		
+		self.payloadFormat = \
+			ConfigUtil().getProperty( \
+				section = ConfigConst.COAP_GATEWAY_SERVICE, \
+				key = ConfigConst.PAYLOAD_FORMAT_KEY, \
+				defaultVal = ConfigConst.JSON_PAYLOAD_FORMAT)
+		
 		self.dataUtil = DataUtil()
 		self.sysPerfData = SystemPerformanceData()
 		
@@ -66,11 +72,21 @@ class GetSystemPerformanceResourceHandler(Resource, ISystemPerformanceDataListen
 				response.code = defines.Codes.EMPTY.number
 				self.sysPerfData = SystemPerformanceData()
 				
-			jsonData = DataUtil().systemPerformanceDataToJson(self.sysPerfData)
-			
-			logging.info("Latest SystemPerformanceData JSON: " + jsonData)
+			# clients may request the binary format via the Accept option
+			if request.accept == defines.Content_types["application/octet-stream"] or \
+				(request.accept is None and self.payloadFormat == ConfigConst.BINARY_PAYLOAD_FORMAT):
+				binaryData = self.dataUtil.iotDataToBinary(self.sysPerfData)
+				
+				logging.info("Latest SystemPerformanceData binary payload: %d bytes", len(binaryData))
+				
+				response.payload = (defines.Content_types["application/octet-stream"], binaryData)
+			else:
+				jsonData = self.dataUtil.systemPerformanceDataToJson(self.sysPerfData)
+				
+				logging.info("Latest SystemPerformanceData JSON: " + jsonData)
+				
+				response.payload = (defines.Content_types["application/json"], jsonData)
 			
-			response.payload = (defines.Content_types["application/json"], jsonData)
 			response.max_age = self.pollCycles
 	
 			# 'changed' will be discussed in a later exercise
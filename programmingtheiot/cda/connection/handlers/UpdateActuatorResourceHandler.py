@@ -45,16 +45,19 @@ class UpdateActuatorResourceHandler():
 			# Check payload
 			# Check content-type (should be JSON)
 			requestPayload = request.get_payload()
-			actuatorCmdData = self.dataUtil.jsonToActuatorData(requestPayload)
+			actuatorCmdData = self.dataUtil.payloadToActuatorData(requestPayload, lenient = True)
 
-			response.payload = self._createResponse(response = response, data = actuatorCmdData)
+			# respond using the same payload format as the request
+			response.payload = self._createResponse( \
+				response = response, data = actuatorCmdData, \
+				useBinary = self.dataUtil.isBinaryPayload(requestPayload))
 			response.max_age = self.pollCycles
 			
 			logging.info("UpdateActuatorResourceHandler::render_PUT_advanced - Actuator command processed.")
 
 		return self, response
 
-	def _createResponse(self, response = None, data: ActuatorData = None) -> str:
+	def _createResponse(self, response = None, data: ActuatorData = None, useBinary: bool = False) -> tuple:
 		actuatorResponseData = self.dataMsgListener.handleActuatorCommandMessage(data)
 
 		if not actuatorResponseData:
@@ -67,6 +70,13 @@ class UpdateActuatorResourceHandler():
 		else:
 			response.code = defines.Codes.CHANGED.number
 
+		if useBinary:
+			binaryData = self.dataUtil.iotDataToBinary(actuatorResponseData)
+			
+			logging.info("Actuator Response Data binary payload: %d bytes", len(binaryData))
+			
+			return (defines.Content_types["application/octet-stream"], binaryData)
+		
 		# TODO: validate the data and convert to JSON
 
 		# return the JSON data
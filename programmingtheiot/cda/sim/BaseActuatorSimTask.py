@@ -40,6 +40,23 @@ class BaseActuatorSimTask():
 		"""
 		pass
 	
+	def getName(self) -> str:
+		return self.name
+	
+	def getTypeID(self) -> int:
+		return self.typeID
+	
+	def setName(self, name: str):
+		"""
+		Sets the name of this task, and of its actuator responses. If
+		invalid, no action is taken.
+		
+		@param name The name as a string.
+		"""
+		if name:
+			self.name = name
+			self.latestActuatorResponse.setName(name)
+	
 	def getSimpleName(self) -> str:
 		# Always return something usable
 		return getattr(self, "simpleName", None) or type(self).__name__
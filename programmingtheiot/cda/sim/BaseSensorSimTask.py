@@ -11,23 +11,46 @@
 # 
 
 import logging
-import random
+
+import numpy as calcLib
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 from programmingtheiot.data.SensorData import SensorData
 from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataSet
+from programmingtheiot.cda.sim.SensorDataGenerator import createSeedSequence
 
 
 class BaseSensorSimTask():
 	"""
 	Shell representation of class for student implementation.
 	
+	If 'reuseSensorData' is enabled, generateTelemetry() alternates between
+	two SensorData instances owned by this task instead of creating a new
+	instance each call. A returned instance is only valid until the call
+	after next, when it will be overwritten. Consumers that need to retain
+	a reading beyond that must take a snapshot via SensorData.copy().
+	
+	Random values are drawn from this task's own PCG64 random number
+	generator, so a task created with an explicit 'seed' generates the
+	same sequence of values on every run, independent of other tasks.
+	
+	If 'useTimeIndex' is enabled (and a data set is set), generateTelemetry()
+	replays the data set by wall clock time (see SensorDataSet.getDataEntryAtTime())
+	instead of advancing one data entry per call, so the replayed curve is
+	independent of the poll rate and of skipped ticks.
+	
+	Each task can declare its own poll cycle and phase offset (see
+	setPollCycle()), which SensorAdapterManager uses to schedule it.
+	
 	"""
 
 	DEFAULT_MIN_VAL = ConfigConst.DEFAULT_VAL
 	DEFAULT_MAX_VAL = 100.0
 	
-	def __init__(self, name: str = ConfigConst.NOT_SET, typeID: int = ConfigConst.DEFAULT_SENSOR_TYPE, dataSet: SensorDataSet = None, minVal: float = DEFAULT_MIN_VAL, maxVal: float = DEFAULT_MAX_VAL):
+	# number of random values drawn from the generator at a time
+	RANDOM_BLOCK_SIZE = 1024
+	
+	def __init__(self, name: str = ConfigConst.NOT_SET, typeID: int = ConfigConst.DEFAULT_SENSOR_TYPE, dataSet: SensorDataSet = None, minVal: float = DEFAULT_MIN_VAL, maxVal: float = DEFAULT_MAX_VAL, reuseSensorData: bool = False, seed = None, useTimeIndex: bool = False):
 
 		logging.info("BaseSensorSimTask: Initializing for dataset: %s", dataSet)	
 		self.dataSet = dataSet
@@ -39,11 +62,35 @@ class BaseSensorSimTask():
 		self.useRandomizer = True
 	
 		self.latestSensorData = None
+		
+		# double buffer - the previous reading remains valid for one more call
+		self.reuseSensorData = reuseSensorData
+		self.sensorDataBuffers = None
+		self.sensorDataBufferIndex = 0
+		
+		if self.reuseSensorData:
+			self.sensorDataBuffers = ( \
+				SensorData(typeID = self.getTypeID(), name = self.getName()), \
+				SensorData(typeID = self.getTypeID(), name = self.getName()))
 	
-		if not self.dataSet:
-			self.useRandomizer = True
-			self.minVal = minVal
-			self.maxVal = maxVal
+		# see SensorDataGenerator.spawnSeeds() for creating independent task seeds
+		self.rng = calcLib.random.Generator(calcLib.random.PCG64(createSeedSequence(seed)))
+		self.randomValues = None
+		self.randomValueIndex = 0
+		
+		self.minVal = minVal
+		self.maxVal = maxVal
+		
+		# a data set is replayed rather than randomized - one entry per call, or
+		# by wall clock time if 'useTimeIndex' is set
+		if self.dataSet is not None:
+			self.useRandomizer = False
+		
+		self.useTimeIndex = useTimeIndex
+		
+		# None means the SensorAdapterManager default poll cycle
+		self.pollCycleSecs = None
+		self.phaseOffsetSecs = 0.0
 	
 	def generateTelemetry(self) -> SensorData:
 		"""
@@ -51,8 +98,12 @@ class BaseSensorSimTask():
 		should be implemented by sub-class.
 		
 		A local reference to SensorData can be contained in this base class.
+		
+		NOTE: If 'reuseSensorData' is enabled, the returned instance is owned by
+		this task and will be overwritten by the call after next. Use
+		SensorData.copy() to retain it.
 		"""
-		sensorData = SensorData(typeID = self.getTypeID(), name = self.getName())
+		sensorData = self._getSensorDataInstance()
 		sensorVal = ConfigConst.DEFAULT_VAL
 	
 		if self.useRandomizer:
@@ -64,9 +115,13 @@ class BaseSensorSimTask():
 			logging.info("MAX VALUE IS: %f", self.minVal)
 			
 			## NOTE: Using RANDOM and uniform here to get float values!!!
-			sensorVal = random.uniform(self.minVal, self.maxVal)
+			sensorVal = self.minVal + self._getNextRandomValue() * (self.maxVal - self.minVal)
 			logging.info("BaseSensorSimTask: Generating telemetry for sensor: %s, value: %f", self.getName(), sensorVal)
 			logging.info("BaseSensorSimTask: Using randomizer? %s", self.useRandomizer)
+		elif self.useTimeIndex:
+			# no per-tick bookkeeping - missed or coalesced ticks don't distort the curve
+			sensorVal = self.dataSet.getDataEntryAtTime()
+			logging.info("BaseSensorSimTask: Generating telemetry for sensor: %s, value: %f", self.getName(), sensorVal)
 		else:
 			logging.info("WE ARE GEETTING IN HERE!!!!!!!!!!!!!!!!!!!!!!!!!!11!")
 			sensorVal = self.dataSet.getDataEntry(index = self.dataSetIndex)
@@ -102,4 +157,61 @@ class BaseSensorSimTask():
 		return self.name
 	
 	def getTypeID(self) -> int:
-		return self.typeID
\ No newline at end of file
+		return self.typeID
+	
+	def setName(self, name: str):
+		"""
+		Sets the name of this task, and of the SensorData it generates
+		from now on. If invalid, no action is taken.
+		
+		@param name The name as a string.
+		"""
+		if name:
+			self.name = name
+			
+			if self.sensorDataBuffers:
+				for sensorData in self.sensorDataBuffers:
+					sensorData.setName(name)
+	
+	def getPollCycleSecs(self) -> float:
+		return self.pollCycleSecs
+	
+	def getPhaseOffsetSecs(self) -> float:
+		return self.phaseOffsetSecs
+	
+	def setPollCycle(self, pollCycleSecs: float = None, phaseOffsetSecs: float = 0.0):
+		"""
+		Sets the period at which this task should be polled, and the delay
+		of its first poll (e.g. to spread the polls of tasks with the same
+		poll cycle).
+		
+		@param pollCycleSecs The poll cycle in seconds. If None (or not greater
+		than 0), the scheduler's default poll cycle applies.
+		@param phaseOffsetSecs The phase offset in seconds.
+		"""
+		self.pollCycleSecs = pollCycleSecs if pollCycleSecs and pollCycleSecs > 0 else None
+		self.phaseOffsetSecs = max(phaseOffsetSecs or 0.0, 0.0)
+	
+	def _getNextRandomValue(self) -> float:
+		# scalar draws from the generator are comparatively slow, so draw
+		# uniform values in [0, 1) a block at a time - the sequence is the same
+		if self.randomValues is None or self.randomValueIndex >= self.RANDOM_BLOCK_SIZE:
+			self.randomValues = self.rng.random(self.RANDOM_BLOCK_SIZE).tolist()
+			self.randomValueIndex = 0
+		
+		val = self.randomValues[self.randomValueIndex]
+		self.randomValueIndex += 1
+		
+		return val
+	
+	def _getSensorDataInstance(self) -> SensorData:
+		if not self.sensorDataBuffers:
+			return SensorData(typeID = self.getTypeID(), name = self.getName())
+		
+		self.sensorDataBufferIndex ^= 1
+		
+		sensorData = self.sensorDataBuffers[self.sensorDataBufferIndex]
+		sensorData.statusCode = ConfigConst.DEFAULT_STATUS
+		sensorData.hasError = False
+		
+		return sensorData
@@ -24,12 +24,15 @@ class HumiditySensorSimTask(BaseSensorSimTask):
 	Shell representation of class for student implementation.
 	
 	"""
-	def __init__(self, dataSet = None):
+	def __init__(self, dataSet = None, reuseSensorData: bool = False, seed = None, useTimeIndex: bool = False):
 		super( \
 			HumiditySensorSimTask, self).__init__( \
 				name = ConfigConst.HUMIDITY_SENSOR_NAME, \
 				typeID = ConfigConst.HUMIDITY_SENSOR_TYPE, \
 				dataSet = dataSet, \
 				minVal = SensorDataGenerator.LOW_NORMAL_ENV_HUMIDITY, \
-				maxVal = SensorDataGenerator.HI_NORMAL_ENV_HUMIDITY)
+				maxVal = SensorDataGenerator.HI_NORMAL_ENV_HUMIDITY, \
+				reuseSensorData = reuseSensorData, \
+				seed = seed, \
+				useTimeIndex = useTimeIndex)
 			
\ No newline at end of file
@@ -23,12 +23,15 @@ class PressureSensorSimTask(BaseSensorSimTask):
 	
 	"""
 
-	def __init__(self, dataSet = None):
+	def __init__(self, dataSet = None, reuseSensorData: bool = False, seed = None, useTimeIndex: bool = False):
 		super( \
 			PressureSensorSimTask, self).__init__( \
 				name = ConfigConst.PRESSURE_SENSOR_NAME, \
 				typeID = ConfigConst.PRESSURE_SENSOR_TYPE, \
 				dataSet = dataSet, \
 				minVal = SensorDataGenerator.LOW_NORMAL_ENV_PRESSURE, \
-				maxVal = SensorDataGenerator.HI_NORMAL_ENV_PRESSURE)
+				maxVal = SensorDataGenerator.HI_NORMAL_ENV_PRESSURE, \
+				reuseSensorData = reuseSensorData, \
+				seed = seed, \
+				useTimeIndex = useTimeIndex)
 	
\ No newline at end of file
@@ -11,6 +11,107 @@ import logging
 import math
 import numpy as calcLib
 
+def createSeedSequence(seed = None):
+	"""
+	Creates the seed sequence for a simulator random number generator.
+	
+	@param seed An int, an existing calcLib.random.SeedSequence (returned as-is)
+	or None, in which case fresh entropy is used.
+	@return calcLib.random.SeedSequence The seed sequence.
+	"""
+	if isinstance(seed, calcLib.random.SeedSequence):
+		return seed
+	
+	return calcLib.random.SeedSequence(seed)
+
+def downsampleLttb(xValues, yValues, targetPoints: int):
+	"""
+	Downsamples a series using Largest-Triangle-Three-Buckets (LTTB), which
+	keeps the visual shape of the series (including peaks) far better than
+	plain decimation. The first and last points are always kept, and each
+	bucket in between contributes the point forming the largest triangle with
+	the previously selected point and the average of the next bucket.
+	
+	@param xValues The 1-D array of x values (in ascending order).
+	@param yValues The 1-D array of y values.
+	@param targetPoints The number of points to keep. If less than 3, or not less
+	than the number of points, the series is returned as-is.
+	@return tuple The downsampled x and y arrays.
+	"""
+	xValues = calcLib.asarray(xValues, dtype = calcLib.float64)
+	yValues = calcLib.asarray(yValues, dtype = calcLib.float64)
+	
+	count = yValues.size
+	
+	if targetPoints < 3 or targetPoints >= count:
+		return xValues, yValues
+	
+	bucketCount = targetPoints - 2
+	
+	# bucket 'i' spans [edges[i], edges[i + 1]) - the last 'bucket' is the last point
+	edges = calcLib.arange(bucketCount + 1) * (count - 2) // bucketCount + 1
+	edges = calcLib.append(edges, count)
+	
+	# all bucket averages at once, via cumulative sums
+	bucketSizes = calcLib.diff(edges)
+	xSums = calcLib.concatenate(([0.0], calcLib.cumsum(xValues)))
+	ySums = calcLib.concatenate(([0.0], calcLib.cumsum(yValues)))
+	xAvgs = (xSums[edges[1:]] - xSums[edges[:-1]]) / bucketSizes
+	yAvgs = (ySums[edges[1:]] - ySums[edges[:-1]]) / bucketSizes
+	
+	indexes = calcLib.empty(targetPoints, dtype = calcLib.int64)
+	indexes[0] = 0
+	indexes[-1] = count - 1
+	
+	selected = 0
+	
+	for i in range(0, bucketCount):
+		start = edges[i]
+		end = edges[i + 1]
+		
+		xA = xValues[selected]
+		yA = yValues[selected]
+		
+		# twice the triangle area - the factor doesn't matter for argmax()
+		areas = calcLib.abs((xA - xAvgs[i + 1]) * (yValues[start:end] - yA) - (xA - xValues[start:end]) * (yAvgs[i + 1] - yA))
+		
+		selected = start + int(areas.argmax())
+		indexes[i + 1] = selected
+	
+	return xValues[indexes], yValues[indexes]
+
+def downsampleMinMax(xValues, yValues, targetPoints: int):
+	"""
+	Downsamples a series by keeping the min and max point of each bucket (in
+	their original order), so no peak is ever lost. Fully vectorized, and
+	faster than LTTB, but visually noisier.
+	
+	@param xValues The 1-D array of x values (in ascending order).
+	@param yValues The 1-D array of y values.
+	@param targetPoints The (max) number of points to keep - two per bucket. If
+	less than 2, or not less than the number of points, the series is returned as-is.
+	@return tuple The downsampled x and y arrays.
+	"""
+	xValues = calcLib.asarray(xValues)
+	yValues = calcLib.asarray(yValues)
+	
+	count = yValues.size
+	bucketCount = targetPoints // 2
+	
+	if bucketCount < 1 or targetPoints >= count:
+		return xValues, yValues
+	
+	bucketSize = -(-count // bucketCount)
+	
+	# pad the last bucket with the last value, so all buckets are equal sized
+	buckets = calcLib.pad(yValues, (0, bucketCount * bucketSize - count), mode = 'edge').reshape(bucketCount, bucketSize)
+	offsets = calcLib.arange(bucketCount) * bucketSize
+	
+	indexes = calcLib.concatenate((offsets + buckets.argmin(axis = 1), offsets + buckets.argmax(axis = 1)))
+	indexes = calcLib.unique(calcLib.minimum(indexes, count - 1))
+	
+	return xValues[indexes], yValues[indexes]
+
 class SensorDataGenerator(object):
 	"""
 	This is a simple sine wave generator utility class that supports
@@ -50,6 +151,7 @@ class SensorDataGenerator(object):
 	MAX_MONITOR_PRESSURE = 50000.0
 	
 	DEFAULT_DATA_POINTS = 60 * MAX_HOURS
+	DEFAULT_CHUNK_SIZE = 3600
 	
 	NO_NOISE = 0
 	MIN_NOISE = 1
@@ -66,7 +168,14 @@ class SensorDataGenerator(object):
 	DEFAULT_HUMIDITY_CURVE = BELL_CURVE
 	DEFAULT_PRESSURE_CURVE = INVERSE_CURVE
 	
-	def __init__(self, epochOffsetSeconds: float = 0.0, useCurrentTime: bool = True, alignGeneratorToDay: bool = True):
+	LTTB_DOWNSAMPLE = 'lttb'
+	MIN_MAX_DOWNSAMPLE = 'minmax'
+	
+	DEFAULT_GRAPH_WIDTH = 1280
+	DEFAULT_GRAPH_HEIGHT = 720
+	DEFAULT_GRAPH_DPI = 100
+	
+	def __init__(self, epochOffsetSeconds: float = 0.0, useCurrentTime: bool = True, alignGeneratorToDay: bool = True, seed = None):
 		"""
 		Constructor.
 		
@@ -80,12 +189,99 @@ class SensorDataGenerator(object):
 		generator logic will be aligned to create a single sine wave for
 		a day - meaning the 24 hr start and end values will be approximately
 		the same.
+		@param seed The seed for this generator's random number generator (used
+		for noise). Can be an int, a calcLib.random.SeedSequence (e.g. one returned
+		by spawnSeeds()) or None (default), in which case fresh entropy is used and
+		the generated data won't be reproducible.
 		"""
 		self.epochOffsetSeconds = epochOffsetSeconds
 		self.useCurrentTime = useCurrentTime
 		self.alignGeneratorToDay = alignGeneratorToDay
 		self.dayDenominator = (1 - (calcLib.pi / 10)) + calcLib.pi
 		
+		self.seed = seed
+		self.seedSequence = createSeedSequence(seed)
+		self.rng = calcLib.random.Generator(calcLib.random.PCG64(self.seedSequence))
+		
+	def isSeeded(self) -> bool:
+		"""
+		Checks if this generator was created with an explicit seed, i.e. if
+		the data sets it generates are reproducible.
+		
+		@return bool True if seeded; False otherwise.
+		"""
+		return self.seed is not None
+		
+	def spawnSeeds(self, count: int = 1) -> list:
+		"""
+		Spawns independent child seed sequences from this generator's seed.
+		These can be passed to other generators or sensor sim tasks (e.g. one
+		per parallel worker), and will yield non-overlapping random streams
+		that are reproducible for a given seed.
+		
+		@param count The number of child seed sequences to spawn.
+		@return list The list of calcLib.random.SeedSequence instances.
+		"""
+		return self.seedSequence.spawn(count)
+		
+	def spawn(self, count: int = 1) -> list:
+		"""
+		Creates independent child generators with the same settings as this
+		generator, each using its own child seed sequence (see spawnSeeds()).
+		
+		@param count The number of child generators to create.
+		@return list The list of SensorDataGenerator instances.
+		"""
+		return [ \
+			SensorDataGenerator( \
+				epochOffsetSeconds = self.epochOffsetSeconds, useCurrentTime = self.useCurrentTime, \
+				alignGeneratorToDay = self.alignGeneratorToDay, seed = seedSequence) \
+			for seedSequence in self.spawnSeeds(count)]
+		
+	def createEnvironmentHumidityChannelSpec(self, name: str = None, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_ENV_HUMIDITY, maxValue: float = MAX_ENV_HUMIDITY):
+		"""
+		Creates the channel spec for environment humidity simulation, as used by
+		generateDailyEnvironmentHumidityDataSet(), e.g. for generateMultiChannelDataSet().
+		minValue and maxValue are validated the same way.
+		
+		@param: name The optional channel name (e.g. the sensor name).
+		@return SensorChannelSpec The channel spec.
+		"""
+		return self._createChannelSpec(name, self.DEFAULT_HUMIDITY_CURVE, noiseLevel, minValue, maxValue, self.MIN_ENV_HUMIDITY, self.MAX_ENV_HUMIDITY)
+		
+	def createEnvironmentPressureChannelSpec(self, name: str = None, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_ENV_PRESSURE, maxValue: float = MAX_ENV_PRESSURE):
+		"""
+		Creates the channel spec for environment pressure simulation, as used by
+		generateDailyEnvironmentPressureDataSet(), e.g. for generateMultiChannelDataSet().
+		minValue and maxValue are validated the same way.
+		
+		@param: name The optional channel name (e.g. the sensor name).
+		@return SensorChannelSpec The channel spec.
+		"""
+		return self._createChannelSpec(name, self.DEFAULT_PRESSURE_CURVE, noiseLevel, minValue, maxValue, self.MIN_ENV_PRESSURE, self.MAX_ENV_PRESSURE)
+		
+	def createIndoorTemperatureChannelSpec(self, name: str = None, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_INDOOR_TEMP, maxValue: float = MAX_INDOOR_TEMP):
+		"""
+		Creates the channel spec for indoor temperature simulation, as used by
+		generateDailyIndoorTemperatureDataSet(), e.g. for generateMultiChannelDataSet().
+		minValue and maxValue are validated the same way.
+		
+		@param: name The optional channel name (e.g. the sensor name).
+		@return SensorChannelSpec The channel spec.
+		"""
+		return self._createChannelSpec(name, self.DEFAULT_TEMP_CURVE, noiseLevel, minValue, maxValue, self.MIN_ENV_TEMP, self.MAX_ENV_TEMP)
+		
+	def createMonitorTemperatureChannelSpec(self, name: str = None, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_MONITOR_TEMP, maxValue: float = MAX_MONITOR_TEMP):
+		"""
+		Creates the channel spec for monitor temperature simulation, as used by
+		generateDailyMonitorTemperatureDataSet(), e.g. for generateMultiChannelDataSet().
+		minValue and maxValue are validated the same way.
+		
+		@param: name The optional channel name (e.g. the sensor name).
+		@return SensorChannelSpec The channel spec.
+		"""
+		return self._createChannelSpec(name, self.DEFAULT_TEMP_CURVE, noiseLevel, minValue, maxValue, self.MIN_MONITOR_TEMP, self.MAX_MONITOR_TEMP)
+		
 	def generateDailyEnvironmentHumidityDataSet(self, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_ENV_HUMIDITY, maxValue: float = MAX_ENV_HUMIDITY, useSeconds: bool = False):
 		"""
 		Generates a time-series data set for indoor temperature simulation over a 24-hour period.
@@ -104,10 +300,7 @@ class SensorDataGenerator(object):
 		@return SensorDataSet The sensor data set containing both time entries and data
 		values for those time entries.
 		"""
-		if maxValue < self.MIN_ENV_HUMIDITY or maxValue > self.MAX_ENV_HUMIDITY: maxValue = self.MAX_ENV_HUMIDITY
-		if minValue < self.MIN_ENV_HUMIDITY or minValue >= maxValue: minValue = maxValue - 1
-		
-		return self.generateDailySensorDataSet(curveType = self.DEFAULT_HUMIDITY_CURVE, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds)
+		return self._generateDailyChannelDataSet(self.createEnvironmentHumidityChannelSpec(noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue), useSeconds = useSeconds)
 		
 	def generateDailyEnvironmentPressureDataSet(self, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_ENV_PRESSURE, maxValue: float = MAX_ENV_PRESSURE, useSeconds: bool = False):
 		"""
@@ -127,10 +320,7 @@ class SensorDataGenerator(object):
 		@return SensorDataSet The sensor data set containing both time entries and data
 		values for those time entries.
 		"""
-		if maxValue < self.MIN_ENV_PRESSURE or maxValue > self.MAX_ENV_PRESSURE: maxValue = self.MAX_ENV_PRESSURE
-		if minValue < self.MIN_ENV_PRESSURE or minValue >= maxValue: minValue = maxValue - 1
-		
-		return self.generateDailySensorDataSet(curveType = self.DEFAULT_PRESSURE_CURVE, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds)
+		return self._generateDailyChannelDataSet(self.createEnvironmentPressureChannelSpec(noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue), useSeconds = useSeconds)
 		
 	def generateDailyIndoorTemperatureDataSet(self, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_INDOOR_TEMP, maxValue: float = MAX_INDOOR_TEMP, useSeconds: bool = False):
 		"""
@@ -150,10 +340,7 @@ class SensorDataGenerator(object):
 		@return SensorDataSet The sensor data set containing both time entries and data
 		values for those time entries.
 		"""
-		if maxValue < self.MIN_ENV_TEMP or maxValue > self.MAX_ENV_TEMP: maxValue = self.MAX_ENV_TEMP
-		if minValue < self.MIN_ENV_TEMP or minValue >= maxValue: minValue = maxValue - 1
-		
-		return self.generateDailySensorDataSet(curveType = self.DEFAULT_TEMP_CURVE, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds)
+		return self._generateDailyChannelDataSet(self.createIndoorTemperatureChannelSpec(noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue), useSeconds = useSeconds)
 		
 	def generateDailyMonitorTemperatureDataSet(self, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_MONITOR_TEMP, maxValue: float = MAX_MONITOR_TEMP, useSeconds: bool = False):
 		"""
@@ -173,10 +360,7 @@ class SensorDataGenerator(object):
 		@return SensorDataSet The sensor data set containing both time entries and data
 		values for those time entries.
 		"""
-		if maxValue < self.MIN_MONITOR_TEMP or maxValue > self.MAX_MONITOR_TEMP: maxValue = self.MAX_MONITOR_TEMP
-		if minValue < self.MIN_MONITOR_TEMP or minValue >= maxValue: minValue = maxValue - 1
-		
-		return self.generateDailySensorDataSet(curveType = self.DEFAULT_TEMP_CURVE, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds)
+		return self._generateDailyChannelDataSet(self.createMonitorTemperatureChannelSpec(noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue), useSeconds = useSeconds)
 		
 	def generateDailySensorDataSet(self, curveType: int = FULL_WAVE, noiseLevel: int = DEFAULT_NOISE, minValue: float = DEFAULT_MIN_VALUE, maxValue: float = DEFAULT_MAX_VALUE, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, useSeconds = False):
 		"""
@@ -208,47 +392,15 @@ class SensorDataGenerator(object):
 		@return SensorDataSet The sensor data set containing both time entries and data
 		values for those time entries.
 		"""
-		# validate noise level - ensure it's between 1 and 100
-		if noiseLevel < self.NO_NOISE: noiseLevel = self.NO_NOISE
-		if noiseLevel > self.MAX_NOISE: noiseLevel = self.MAX_NOISE
-		
-		# validate min and max values
-		if maxValue < minValue: maxValue = minValue
-		if minValue > maxValue: minValue = maxValue
-		
-		# validate start and end hours
-		if startHour < self.MIN_HOURS or minValue > self.MAX_HOURS: startHour = self.MIN_HOURS
-		if endHour < 0 or endHour > self.MAX_HOURS: endHour = self.MAX_HOURS
-		
-		# calc total data points to be generated
-		totalDataPoints = (endHour - startHour) * 60
-		
-		if useSeconds: totalDataPoints = totalDataPoints * 60
-		if totalDataPoints == 0: totalDataPoints = 1
+		noiseLevel, minValue, maxValue, startHour, endHour, totalDataPoints = \
+			self._validateDataSetParams(noiseLevel, minValue, maxValue, startHour, endHour, useSeconds)
 		
 		# create evenly spaced number of 'totalDataPoints' between 'startHour' and 'endHour'
 		timeEntries = calcLib.linspace(start = startHour, stop = endHour, num = totalDataPoints)
 		
 		# generate the distribution data for each point - quick ramp up curve
 		# followed by a more gradual ramp down
-		if self.alignGeneratorToDay:
-			if curveType > 0:
-				denominator = (curveType + self.dayDenominator)
-			elif curveType == 0:
-				denominator = self.dayDenominator
-			else:
-				denominator = abs(curveType) * self.dayDenominator
-				
-			dataValuesClean = calcLib.sin(timeEntries / denominator)
-		else:
-			if curveType > 0:
-				denominator = curveType
-			elif curveType == 0:
-				denominator = 1
-			else:
-				denominator = 1 / abs(curveType)
-				
-			dataValuesClean = calcLib.sin(timeEntries / denominator)
+		dataValuesClean = calcLib.sin(timeEntries / self._getCurveDenominator(curveType))
 		
 		# re-scale array with 'minValue' as floor and 'maxValue' as ceiling
 		scaledValuesClean = calcLib.interp(dataValuesClean, (dataValuesClean.min(), dataValuesClean.max()), (minValue, maxValue))
@@ -259,13 +411,8 @@ class SensorDataGenerator(object):
 			# get the mean value, generate base10 log and calculate noise numerator
 			meanValue = calcLib.mean(scaledValuesClean)
 			
-			# calc order of magnitude of mean value - this is necessary to ensure
-			# the generated noisyness aligns with the magnitude of the values
-			meanMag = int(math.log10(meanValue))
-			noiseScale = ((noiseLevel / 100) * ((10 ** meanMag) / 10))
-			noisyTemp = calcLib.random.normal(0, noiseScale, len(scaledValuesClean))
-			
-			logging.debug("Noise=%f; Noise Scale=%f; Mean Magnitude=%f" % (noiseLevel, noiseScale, meanMag))
+			noiseScale = self._getNoiseScale(noiseLevel, meanValue)
+			noisyTemp = self.rng.normal(0, noiseScale, len(scaledValuesClean))
 			
 			# update the data set to add in noise with clean values
 			scaledValuesNoisy = (scaledValuesClean + noisyTemp)
@@ -276,6 +423,238 @@ class SensorDataGenerator(object):
 		
 		return dataSet
 		
+	def generateDailySensorDataChunks(self, curveType: int = FULL_WAVE, noiseLevel: int = DEFAULT_NOISE, minValue: float = DEFAULT_MIN_VALUE, maxValue: float = DEFAULT_MAX_VALUE, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, useSeconds = False, chunkSize: int = DEFAULT_CHUNK_SIZE):
+		"""
+		Generator version of generateDailySensorDataSet(). Rather than creating
+		the entire data set up front, this yields the time entries and data
+		entries in chunks of (at most) 'chunkSize' entries, so memory use is
+		bounded by the chunk size rather than the length of the data set.
+		
+		The curve, scaling and noise semantics are identical to those of
+		generateDailySensorDataSet(), and the phase is continuous across chunks -
+		concatenating all chunks yields the same time entries and (without noise)
+		the same data entries. As the scaling depends on the min and max of the
+		entire curve, a first pass over the curve (also chunked) is made before
+		the first chunk is yielded.
+		
+		@param: chunkSize The maximum number of entries per chunk. Defaults to DEFAULT_CHUNK_SIZE.
+		See generateDailySensorDataSet() for all other parameters.
+		@return A generator yielding (time entries, data entries) tuples of 1-D arrays.
+		"""
+		noiseLevel, minValue, maxValue, startHour, endHour, totalDataPoints = \
+			self._validateDataSetParams(noiseLevel, minValue, maxValue, startHour, endHour, useSeconds)
+		
+		chunkSize = max(int(chunkSize), 1)
+		denominator = self._getCurveDenominator(curveType)
+		
+		# same time entries as calcLib.linspace(), computed per chunk
+		step = (endHour - startHour) / (totalDataPoints - 1) if totalDataPoints > 1 else 0
+		
+		def getTimeEntries(startIndex: int, endIndex: int):
+			timeEntries = calcLib.arange(startIndex, endIndex, dtype = calcLib.float64)
+			timeEntries *= step
+			timeEntries += startHour
+			
+			if endIndex == totalDataPoints and totalDataPoints > 1:
+				timeEntries[-1] = endHour
+			
+			return timeEntries
+		
+		# first pass - min, max and sum of the clean curve
+		cleanMin = calcLib.inf
+		cleanMax = -calcLib.inf
+		cleanSum = 0.0
+		
+		for startIndex in range(0, totalDataPoints, chunkSize):
+			dataValuesClean = calcLib.sin(getTimeEntries(startIndex, min(startIndex + chunkSize, totalDataPoints)) / denominator)
+			
+			cleanMin = min(cleanMin, dataValuesClean.min())
+			cleanMax = max(cleanMax, dataValuesClean.max())
+			cleanSum += dataValuesClean.sum()
+		
+		noiseScale = 0.0
+		
+		if noiseLevel != self.NO_NOISE:
+			# interp() is linear, so the mean of the scaled curve is the scaled mean
+			meanValue = calcLib.interp(cleanSum / totalDataPoints, (cleanMin, cleanMax), (minValue, maxValue))
+			noiseScale = self._getNoiseScale(noiseLevel, meanValue)
+		
+		for startIndex in range(0, totalDataPoints, chunkSize):
+			timeEntries = getTimeEntries(startIndex, min(startIndex + chunkSize, totalDataPoints))
+			dataValues = calcLib.interp(calcLib.sin(timeEntries / denominator), (cleanMin, cleanMax), (minValue, maxValue))
+			
+			if noiseLevel != self.NO_NOISE:
+				dataValues += self.rng.normal(0, noiseScale, timeEntries.size)
+			
+			yield timeEntries, dataValues
+	
+	def generateMultiChannelDataSet(self, channelSpecs: list = None, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, useSeconds = False):
+		"""
+		Generates a multi-channel time-series data set. All channels share a
+		single time base, and are generated together as one 2-D array (one
+		row per channel), using the same curve, scaling and noise semantics
+		as generateDailySensorDataSet().
+		
+		This is much faster than calling generateDailySensorDataSet() once per
+		channel when many channels are needed (e.g. for fleet simulation).
+		
+		@param channelSpecs The list of SensorChannelSpec instances, one per channel.
+		@param: startHour The beginning hour. See generateDailySensorDataSet().
+		@param: endHour The ending hour. See generateDailySensorDataSet().
+		@param: useSeconds Defaults to False. If True, the data set will be generated using
+		second-level granularity.
+		@return SensorDataSet The multi-channel sensor data set, with data entries
+		of shape (channel count, time entry count).
+		"""
+		if not channelSpecs:
+			raise ValueError("At least one channel spec is required.")
+		
+		timeEntries = self.generateTimeEntries(startHour = startHour, endHour = endHour, useSeconds = useSeconds)
+		totalDataPoints = timeEntries.size
+		
+		# one entry per channel for each channel parameter
+		curveTypes  = calcLib.array([spec.curveType for spec in channelSpecs], dtype = calcLib.float64)
+		noiseLevels = calcLib.clip([spec.noiseLevel for spec in channelSpecs], self.NO_NOISE, self.MAX_NOISE)
+		minValues   = calcLib.array([spec.minValue for spec in channelSpecs], dtype = calcLib.float64)
+		maxValues   = calcLib.maximum([spec.maxValue for spec in channelSpecs], minValues)
+		
+		if self.alignGeneratorToDay:
+			denominators = calcLib.where( \
+				curveTypes > 0, curveTypes + self.dayDenominator, \
+				calcLib.where(curveTypes == 0, 1, calcLib.abs(curveTypes)) * self.dayDenominator)
+		else:
+			with calcLib.errstate(divide = 'ignore'):
+				denominators = calcLib.where( \
+					curveTypes > 0, curveTypes, \
+					calcLib.where(curveTypes == 0, 1, 1 / calcLib.abs(curveTypes)))
+		
+		# the clean curve only depends on the denominator, so compute each
+		# distinct curve once, normalized to [0, 1]
+		uniqueDenominators, channelCurves = calcLib.unique(denominators, return_inverse = True)
+		
+		curves = calcLib.sin(timeEntries / uniqueDenominators[:, None])
+		curveMins = curves.min(axis = 1, keepdims = True)
+		curveSpans = curves.max(axis = 1, keepdims = True) - curveMins
+		
+		curves -= curveMins
+		
+		# flat curves (e.g. a single data point) map to the ceiling, as with calcLib.interp()
+		with calcLib.errstate(divide = 'ignore', invalid = 'ignore'):
+			curves = calcLib.where(curveSpans > 0, curves / curveSpans, 1.0)
+		
+		# re-scale each channel with 'minValue' as floor and 'maxValue' as ceiling -
+		# this is equivalent to calling calcLib.interp() per channel
+		valueSpans = maxValues - minValues
+		
+		dataValues = curves[channelCurves]
+		dataValues *= valueSpans[:, None]
+		dataValues += minValues[:, None]
+		
+		noisyRows = calcLib.flatnonzero(noiseLevels != self.NO_NOISE)
+		
+		if noisyRows.size > 0:
+			# order of magnitude of each channel's mean value - see generateDailySensorDataSet();
+			# the mean is derived from the normalized curve, rather than the scaled values
+			meanValues = curves.mean(axis = 1)[channelCurves[noisyRows]] * valueSpans[noisyRows] + minValues[noisyRows]
+			
+			with calcLib.errstate(divide = 'ignore', invalid = 'ignore'):
+				meanMags = calcLib.nan_to_num(calcLib.trunc(calcLib.log10(meanValues)), nan = 0.0, posinf = 0.0, neginf = 0.0)
+			
+			noiseScales = (noiseLevels[noisyRows] / 100) * ((10 ** meanMags) / 10)
+			
+			noise = self.rng.standard_normal((noisyRows.size, totalDataPoints))
+			noise *= noiseScales[:, None]
+			
+			if noisyRows.size == len(channelSpecs):
+				dataValues += noise
+			else:
+				dataValues[noisyRows] += noise
+		
+		dataSet = SensorDataSet(epochOffsetSeconds = self.epochOffsetSeconds, useCurrentTime = self.useCurrentTime, timeEntries = timeEntries)
+		dataSet.setDataEntries(dataValues, channelNames = [spec.name for spec in channelSpecs])
+		
+		return dataSet
+	
+	def generateTimeEntries(self, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, useSeconds = False):
+		"""
+		Generates the evenly spaced time entries (in hours) used by
+		generateMultiChannelDataSet() - one per minute (or second) between
+		'startHour' and 'endHour'.
+		
+		@param: startHour The beginning hour. See generateDailySensorDataSet().
+		@param: endHour The ending hour. See generateDailySensorDataSet().
+		@param: useSeconds Defaults to False. If True, one entry per second.
+		@return The 1-D array of time entries.
+		"""
+		startHour, endHour, totalDataPoints = self._validateHours(startHour, endHour, useSeconds)
+		
+		return calcLib.linspace(start = startHour, stop = endHour, num = totalDataPoints)
+	
+	def _createChannelSpec(self, name: str, curveType: int, noiseLevel: int, minValue: float, maxValue: float, rangeMin: float, rangeMax: float):
+		# keep the floor and ceiling within the sensor's range, and the floor below the ceiling
+		if maxValue < rangeMin or maxValue > rangeMax: maxValue = rangeMax
+		if minValue < rangeMin or minValue >= maxValue: minValue = maxValue - 1
+		
+		return SensorChannelSpec(name = name, curveType = curveType, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue)
+	
+	def _generateDailyChannelDataSet(self, channelSpec, useSeconds: bool = False):
+		return self.generateDailySensorDataSet( \
+			curveType = channelSpec.curveType, noiseLevel = channelSpec.noiseLevel, \
+			minValue = channelSpec.minValue, maxValue = channelSpec.maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds)
+	
+	def _getCurveDenominator(self, curveType: int) -> float:
+		if self.alignGeneratorToDay:
+			if curveType > 0:
+				return (curveType + self.dayDenominator)
+			elif curveType == 0:
+				return self.dayDenominator
+			else:
+				return abs(curveType) * self.dayDenominator
+		else:
+			if curveType > 0:
+				return curveType
+			elif curveType == 0:
+				return 1
+			else:
+				return 1 / abs(curveType)
+	
+	def _getNoiseScale(self, noiseLevel: int, meanValue: float) -> float:
+		# calc order of magnitude of mean value - this is necessary to ensure
+		# the generated noisyness aligns with the magnitude of the values
+		meanMag = int(math.log10(meanValue))
+		noiseScale = ((noiseLevel / 100) * ((10 ** meanMag) / 10))
+		
+		logging.debug("Noise=%f; Noise Scale=%f; Mean Magnitude=%f" % (noiseLevel, noiseScale, meanMag))
+		
+		return noiseScale
+	
+	def _validateDataSetParams(self, noiseLevel: int, minValue: float, maxValue: float, startHour: int, endHour: int, useSeconds: bool):
+		# validate noise level - ensure it's between 1 and 100
+		if noiseLevel < self.NO_NOISE: noiseLevel = self.NO_NOISE
+		if noiseLevel > self.MAX_NOISE: noiseLevel = self.MAX_NOISE
+		
+		# validate min and max values
+		if maxValue < minValue: maxValue = minValue
+		if minValue > maxValue: minValue = maxValue
+		
+		startHour, endHour, totalDataPoints = self._validateHours(startHour, endHour, useSeconds)
+		
+		return noiseLevel, minValue, maxValue, startHour, endHour, totalDataPoints
+	
+	def _validateHours(self, startHour: int, endHour: int, useSeconds: bool):
+		# validate start and end hours
+		if startHour < self.MIN_HOURS or startHour > self.MAX_HOURS: startHour = self.MIN_HOURS
+		if endHour < 0 or endHour > self.MAX_HOURS: endHour = self.MAX_HOURS
+		if startHour > endHour: startHour = endHour
+		
+		# calc total data points to be generated
+		totalDataPoints = (endHour - startHour) * 60
+		
+		if useSeconds: totalDataPoints = totalDataPoints * 60
+		if totalDataPoints == 0: totalDataPoints = 1
+		
+		return startHour, endHour, totalDataPoints
+	
 	def generateOnScreenGraph(self, dataSet = None, chartTitle: str = "Sample Data", chartXLabel: str = "X Axis", chartYLabel: str = "Y Axis"):
 		"""
 		A simple graph generator using the title info passed in
@@ -301,9 +680,94 @@ class SensorDataGenerator(object):
 		plotter.grid(True, which = 'both')
 		plotter.show()
 		
+	def generateGraphFile(self, dataSet = None, fileName: str = None, chartTitle: str = "Sample Data", chartXLabel: str = "X Axis", chartYLabel: str = "Y Axis", widthPixels: int = DEFAULT_GRAPH_WIDTH, heightPixels: int = DEFAULT_GRAPH_HEIGHT, downsampleMethod: str = LTTB_DOWNSAMPLE):
+		"""
+		Headless version of generateOnScreenGraph(), which writes the graph to
+		an image file (PNG, SVG, or any other format supported by matplotlib,
+		based on the file extension). No window manager is needed, as the Agg
+		backend is used directly.
+		
+		As the chart can't show more detail than its pixel width, the data set is
+		downsampled to about one point per pixel column before plotting - for a
+		week of second-level data, that's ~1,000 points instead of ~600,000.
+		
+		@param dataSet The SensorDataSet instance. For a multi-channel data set,
+		each channel is plotted as a separate line.
+		@param fileName The name of the image file to write.
+		@param chartTitle The string representing the title of the chart.
+		@param chartXLabel The string to use for the X Label.
+		@param chartYLabel The string to use for the Y Label.
+		@param widthPixels The width of the image, in pixels.
+		@param heightPixels The height of the image, in pixels.
+		@param downsampleMethod LTTB_DOWNSAMPLE (default), MIN_MAX_DOWNSAMPLE, or
+		None to plot every point.
+		"""
+		# only import MatPlotLib if this method is called
+		from matplotlib.backends.backend_agg import FigureCanvasAgg
+		from matplotlib.figure import Figure
+		
+		timeEntries = dataSet.getTimeEntries()
+		dataEntries = dataSet.getDataEntries()
+		
+		figure = Figure(figsize = (widthPixels / self.DEFAULT_GRAPH_DPI, heightPixels / self.DEFAULT_GRAPH_DPI), dpi = self.DEFAULT_GRAPH_DPI)
+		FigureCanvasAgg(figure)
+		
+		axes = figure.add_subplot()
+		
+		# roughly the width of the plot area
+		targetPoints = int(widthPixels * 0.8)
+		
+		for channelEntries in (dataEntries if dataEntries.ndim == 2 else (dataEntries,)):
+			if downsampleMethod == self.LTTB_DOWNSAMPLE:
+				xValues, yValues = downsampleLttb(timeEntries, channelEntries, targetPoints)
+			elif downsampleMethod == self.MIN_MAX_DOWNSAMPLE:
+				xValues, yValues = downsampleMinMax(timeEntries, channelEntries, targetPoints * 2)
+			else:
+				xValues, yValues = timeEntries, channelEntries
+			
+			axes.plot(xValues, yValues)
+		
+		axes.set_title(chartTitle)
+		axes.set_ylabel(chartYLabel)
+		axes.set_xlabel(chartXLabel)
+		axes.grid(True, which = 'both')
+		
+		figure.savefig(fileName)
+		
+		logging.info("Wrote graph: %s", fileName)
+		
 
 from time import time, ctime
 
+class SensorChannelSpec():
+	"""
+	Specification for a single channel generated by
+	SensorDataGenerator.generateMultiChannelDataSet().
+	
+	"""
+	
+	__slots__ = ('name', 'curveType', 'noiseLevel', 'minValue', 'maxValue')
+	
+	def __init__( \
+		self, name: str = None, curveType: int = SensorDataGenerator.FULL_WAVE, \
+		noiseLevel: int = SensorDataGenerator.DEFAULT_NOISE, \
+		minValue: float = SensorDataGenerator.DEFAULT_MIN_VALUE, \
+		maxValue: float = SensorDataGenerator.DEFAULT_MAX_VALUE):
+		"""
+		Constructor.
+		
+		@param name The optional channel name (e.g. the sensor name).
+		@param curveType The type of curve - see SensorDataGenerator.generateDailySensorDataSet().
+		@param noiseLevel Any positive integer between 0 (no noise) and 100 (max noise).
+		@param minValue The minimum value, or floor, of the data.
+		@param maxValue The maximum value, or ceiling, of the data.
+		"""
+		self.name       = name
+		self.curveType  = curveType
+		self.noiseLevel = noiseLevel
+		self.minValue   = minValue
+		self.maxValue   = maxValue
+
 class SensorDataSet():
 	"""
 	Class definition of the data structure that will hold the time entries and
@@ -313,9 +777,23 @@ class SensorDataSet():
 	and data entries are from the same data generation set or of equivalent length.
 	It is expected that this class will be used to store numpy generated data
 	using one of the functions embedded above.
+	
+	A multi-channel data set (see SensorDataGenerator.generateMultiChannelDataSet())
+	stores its data entries as a 2-D array with one row per channel, all sharing
+	the same time entries. Use getChannelDataSet() to retrieve a single channel.
+	
+	A compact data set (see toCompact()) stores its evenly spaced time entries
+	as a (start, step, count) time axis, computing them on access, and may
+	store its data entries as float32 rather than float64.
 	"""
 	
-	def __init__(self, epochOffsetSeconds: float = 0.0, timeEntries = None, dataEntries = None, useCurrentTime: bool = True):
+	# max absolute error allowed when converting data entries to float32
+	DEFAULT_FLOAT32_TOLERANCE = 0.001
+	
+	# time entries are in hours (see SensorDataGenerator)
+	TIME_ENTRY_UNIT_SECONDS = 3600
+	
+	def __init__(self, epochOffsetSeconds: float = 0.0, timeEntries = None, dataEntries = None, useCurrentTime: bool = True, timeAxis: tuple = None):
 		"""
 		Constructor.
 		
@@ -329,6 +807,8 @@ class SensorDataSet():
 		@param useCurrentTime If True (default), the current time (since Epoch) will be used as
 		the starting time, regardless of the startTime parameter. If False, an attempt will be
 		made to use startTime as the starting time
+		@param timeAxis The optional (start, step, count) tuple of an evenly spaced time axis.
+		If set, it's used instead of timeEntries (see setTimeAxis()).
 		"""
 		self.currentTime = time()
 		
@@ -340,12 +820,19 @@ class SensorDataSet():
 				logging.warning("Offset seconds since epoch not a float. Using current time instead.")
 		
 		self.currentTimeStamp = ctime(self.currentTime)
+		self.channelNames = None
+		self.timeAxis = None
+		self.timeEntries = None
+		self.dataEntries = None
 		
 		logging.info("Current time set to: " + self.currentTimeStamp)
 			
 		self.setTimeEntries(timeEntries)
 		self.setDataEntries(dataEntries)
 		
+		if timeAxis:
+			self.setTimeAxis(*timeAxis)
+		
 	def getCurrentTime(self) -> float:
 		"""
 		Returns the current time in seconds.
@@ -370,9 +857,24 @@ class SensorDataSet():
 		one index for each time offset from from the configured start time
 		(e.g. hour '0') to the configured end time (e.g. hour '24') in the
 		configured increments (e.g. minutes).
+		
+		NOTE: For a compact data set, a new array is computed on each call.
 		"""
+		if self.timeAxis:
+			start, step, count = self.timeAxis
+			
+			return calcLib.arange(count, dtype = calcLib.float64) * step + start
+		
 		return self.timeEntries
 	
+	def getTimeAxis(self) -> tuple:
+		"""
+		Returns the (start, step, count) tuple of a compact data set's time axis, or None.
+		
+		@return tuple
+		"""
+		return self.timeAxis
+	
 	def getTimeEntry(self, index: int = 0) -> float:
 		"""
 		Returns the float value at 'index' in the time entries array.
@@ -380,6 +882,14 @@ class SensorDataSet():
 		
 		@return float
 		"""
+		if self.timeAxis:
+			start, step, count = self.timeAxis
+			
+			if index < 0 or index > count - 1:
+				index = 0
+			
+			return start + index * step
+		
 		if index < 0 or index > self.timeEntries.size - 1:
 			index = 0
 		
@@ -401,15 +911,162 @@ class SensorDataSet():
 		if index < 0 or index > self.dataEntries.size - 1:
 			index = 0
 		
+		# float32 entries are returned as float, as with float64 entries
+		if self.dataEntries.dtype != calcLib.float64 and self.dataEntries.ndim == 1:
+			return float(self.dataEntries[index])
+		
 		return self.dataEntries[index]
 	
+	def getDataEntryAtTime(self, epochSeconds: float = None):
+		"""
+		Returns the data value at the given epoch time, linearly interpolated
+		between the two nearest data entries. The first time entry corresponds
+		to this data set's current time (see getCurrentTime()), and the time
+		entries are expected to be evenly spaced - only the first and last
+		entries are used, so the lookup is O(1) regardless of the data set size.
+		
+		As with index based replay, the data set repeats once its last time
+		entry is reached.
+		
+		@param epochSeconds The epoch time in seconds. Defaults to the current time.
+		@return float The interpolated value (or, for a multi-channel data set,
+		the array of interpolated values, one per channel).
+		"""
+		if epochSeconds is None:
+			epochSeconds = time()
+		
+		count = self.getDataEntryCount()
+		
+		if self.timeAxis:
+			step = self.timeAxis[1]
+		else:
+			step = (self.timeEntries[-1] - self.timeEntries[0]) / (count - 1) if count > 1 else 0.0
+		
+		if count < 2 or step <= 0:
+			val = self.dataEntries[..., 0]
+		else:
+			position = ((epochSeconds - self.currentTime) / self.TIME_ENTRY_UNIT_SECONDS / step) % (count - 1)
+			index = int(position)
+			
+			val0 = self.dataEntries[..., index]
+			val = val0 + (self.dataEntries[..., index + 1] - val0) * (position - index)
+		
+		return float(val) if self.dataEntries.ndim == 1 else val
+	
 	def getDataEntryCount(self) -> int:
 		"""
-		Returns the number of data entries in the data entry array.
+		Returns the number of data entries in the data entry array. For
+		a multi-channel data set, this is the number of entries per channel.
+		
+		@return int
+		"""
+		return self.dataEntries.shape[-1]
+	
+	def getChannelCount(self) -> int:
+		"""
+		Returns the number of channels in this data set.
+		
+		@return int
+		"""
+		return self.dataEntries.shape[0] if self.dataEntries.ndim == 2 else 1
+	
+	def getChannelNames(self) -> list:
+		"""
+		Returns the list of channel names for a multi-channel data set, or None.
+		
+		@return list
+		"""
+		return self.channelNames
+	
+	def getChannelDataSet(self, channel = 0):
+		"""
+		Returns a single-channel SensorDataSet for the given channel of
+		this data set. The time entries and data entries are views onto
+		this data set's arrays - no data is copied.
+		
+		@param channel The channel index, or channel name.
+		@return SensorDataSet
+		"""
+		if self.dataEntries.ndim != 2:
+			return self
+		
+		if isinstance(channel, str):
+			channel = self.channelNames.index(channel)
+		
+		return SensorDataSet( \
+			epochOffsetSeconds = self.currentTime, useCurrentTime = False, \
+			timeEntries = self.timeEntries, dataEntries = self.dataEntries[channel], timeAxis = self.timeAxis)
+	
+	def getStorageSize(self) -> int:
+		"""
+		Returns the number of bytes used to store the time entries and data
+		entries of this data set (shared arrays are counted in full).
 		
 		@return int
 		"""
-		return self.dataEntries.size
+		storageSize = self.dataEntries.nbytes if self.dataEntries is not None else 0
+		
+		if self.timeEntries is not None:
+			storageSize += self.timeEntries.nbytes
+		
+		return storageSize
+	
+	def isCompact(self) -> bool:
+		"""
+		Checks if this data set's time entries are stored as a time axis.
+		
+		@return bool
+		"""
+		return self.timeAxis is not None
+	
+	def toCompact(self, useFloat32: bool = True, tolerance: float = DEFAULT_FLOAT32_TOLERANCE):
+		"""
+		Returns a compact copy of this data set. Evenly spaced time entries are
+		replaced by a (start, step, count) time axis, and - if 'useFloat32' is
+		enabled and the conversion doesn't lose more than 'tolerance' - data
+		entries are stored as float32. Otherwise, the existing arrays are shared.
+		
+		@param useFloat32 If True (default), store data entries as float32 if precision allows.
+		@param tolerance The max absolute error allowed when converting data entries to float32.
+		@return SensorDataSet The compact data set.
+		"""
+		timeAxis = self.timeAxis
+		timeEntries = None
+		
+		if not timeAxis and self.timeEntries is not None:
+			timeAxis = self._getEvenTimeAxis(self.timeEntries)
+			
+			if not timeAxis:
+				timeEntries = self.timeEntries
+		
+		dataEntries = self.dataEntries
+		
+		if useFloat32 and dataEntries is not None and dataEntries.dtype == calcLib.float64:
+			compactEntries = dataEntries.astype(calcLib.float32)
+			
+			if calcLib.all(calcLib.abs(compactEntries - dataEntries) <= tolerance):
+				dataEntries = compactEntries
+			else:
+				logging.info("Data entries exceed float32 tolerance of %r. Keeping float64.", tolerance)
+		
+		dataSet = SensorDataSet( \
+			epochOffsetSeconds = self.currentTime, useCurrentTime = False, \
+			timeEntries = timeEntries, timeAxis = timeAxis)
+		dataSet.setDataEntries(dataEntries, channelNames = self.channelNames)
+		
+		return dataSet
+	
+	def setTimeAxis(self, start: float, step: float, count: int):
+		"""
+		Setter for an evenly spaced time axis, replacing the time entries array.
+		The time entry at 'index' is computed as start + index * step.
+		
+		@param: start The first time entry.
+		@param: step The difference between consecutive time entries.
+		@param: count The number of time entries.
+		"""
+		self.timeAxis = (float(start), float(step), int(count))
+		self.timeEntries = None
 	
 	def setTimeEntries(self, timeEntries):
 		"""
@@ -420,20 +1077,36 @@ class SensorDataSet():
 		"""
 		if not timeEntries is None:
 			# data generator uses a single dimension array, so it's safe to flatten
-			self.timeEntries = timeEntries.flatten()
-			logging.info("timeEntries tuple. Array Size: %s  ND Size: %s  Dimensions: %s  Shape: %s  Type: %s", self.timeEntries.size, timeEntries.size, timeEntries.ndim, timeEntries.shape, timeEntries.dtype)
+			# (ravel only copies if necessary, so channels can share time entries)
+			self.timeEntries = timeEntries.ravel()
+			self.timeAxis = None
+			logging.debug("timeEntries tuple. Array Size: %s  ND Size: %s  Dimensions: %s  Shape: %s  Type: %s", self.timeEntries.size, timeEntries.size, timeEntries.ndim, timeEntries.shape, timeEntries.dtype)
 		
-	def setDataEntries(self, dataEntries):
+	def setDataEntries(self, dataEntries, channelNames: list = None):
 		"""
 		Setter for data entry values.
 		
 		@param: dataEntries The ndarray tuple (actually a single dim array) containing data values
-		that should correspond to timeEntries - element by element.
+		that should correspond to timeEntries - element by element. For a multi-channel
+		data set, this is a 2-D array with one row per channel.
+		@param: channelNames The optional list of channel names for a multi-channel data set.
 		"""
 		if not dataEntries is None:
-			# data generator uses a single dimension array, so it's safe to flatten
-			self.dataEntries = dataEntries.flatten()
-			logging.info("dataEntries tuple. Array Size: %s  ND Size: %s  Dimensions: %s  Shape: %s  Type: %s", self.dataEntries.size, dataEntries.size, dataEntries.ndim, dataEntries.shape, dataEntries.dtype)
+			# data generator uses a single dimension array per channel, so it's safe to flatten
+			self.dataEntries = dataEntries if dataEntries.ndim == 2 else dataEntries.ravel()
+			self.channelNames = list(channelNames) if channelNames else None
+			logging.debug("dataEntries tuple. Array Size: %s  ND Size: %s  Dimensions: %s  Shape: %s  Type: %s", self.dataEntries.size, dataEntries.size, dataEntries.ndim, dataEntries.shape, dataEntries.dtype)
+	
+	def _getEvenTimeAxis(self, timeEntries) -> tuple:
+		count = timeEntries.size
+		start = float(timeEntries[0]) if count > 0 else 0.0
+		step = (float(timeEntries[-1]) - start) / (count - 1) if count > 1 else 0.0
+		
+		# only evenly spaced time entries (e.g. from calcLib.linspace()) can be replaced
+		if count > 0 and calcLib.allclose(calcLib.arange(count) * step + start, timeEntries, rtol = 0.0, atol = 1e-9):
+			return (start, step, count)
+		
+		return None
 		
 def main():
 	"""
@@ -0,0 +1,120 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# You may find it more helpful to your design to adjust the
+# functionality, constants and interfaces (if there are any)
+# provided within in order to meet the needs of your specific
+# Programming the Internet of Things project.
+#
+
+import logging
+
+from datetime import datetime, timezone
+from json.encoder import encode_basestring_ascii
+
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataSet
+from programmingtheiot.data.DataUtil import DataUtil
+from programmingtheiot.data.SensorData import SensorData
+
+class SensorDataPayloadCache():
+	"""
+	Pre-rendered compact JSON SensorData payloads for replaying a SensorDataSet,
+	e.g. for load tests.
+
+	All payloads are rendered up front, in bulk: the data entries are formatted
+	in a single vectorized pass and combined with the fixed parts of a template
+	SensorData instance. Only the (volatile) time stamp is left open, so getting
+	a payload at publish time is a single bytes concatenation - no SensorData
+	instance and no JSON encoding per message.
+
+	The payloads are identical to those of DataUtil.iotDataToCompactJsonBytes()
+	for a SensorData instance with the same properties.
+
+	"""
+
+	TEMPLATE_FIELDS = (ConfigConst.TIMESTAMP_PROP, ConfigConst.VALUE_PROP)
+
+	def __init__(self, dataSet: SensorDataSet = None, sensorData: SensorData = None):
+		"""
+		Constructor.
+
+		@param dataSet The single-channel data set to render payloads for (use
+		SensorDataSet.getChannelDataSet() for a multi-channel data set).
+		@param sensorData The template SensorData instance carrying all other
+		properties (name, type ID, location, etc.). If None, a default SensorData
+		instance is used.
+		"""
+		# float32 (compact) data entries are widened, as DataUtil renders them as float
+		dataEntries = calcLib.asarray(dataSet.getDataEntries(), dtype = calcLib.float64)
+
+		if dataEntries.ndim != 1:
+			raise ValueError("Only single-channel data sets are supported. Use getChannelDataSet().")
+
+		parts, fieldNames = \
+			DataUtil().iotDataToCompactJsonTemplate(data = sensorData or SensorData(), fieldNames = self.TEMPLATE_FIELDS)
+
+		if fieldNames != self.TEMPLATE_FIELDS:
+			raise ValueError("Unexpected template field order: %s" % (fieldNames,))
+
+		self.payloadPrefix = parts[0].encode('ascii')
+
+		# same formatting as DataUtil (shortest round-trip repr, JSON names for non-finite values)
+		valueStrs = dataEntries.astype(str)
+
+		if not calcLib.all(calcLib.isfinite(dataEntries)):
+			valueStrs[calcLib.isnan(dataEntries)] = 'NaN'
+			valueStrs[calcLib.isposinf(dataEntries)] = 'Infinity'
+			valueStrs[calcLib.isneginf(dataEntries)] = '-Infinity'
+
+		payloadSuffixes = calcLib.char.add(calcLib.char.add(parts[1], valueStrs), parts[2])
+
+		# everything is ASCII-escaped, so the cast to bytes is exact
+		self.payloadSuffixes = payloadSuffixes.astype(calcLib.bytes_).tolist()
+
+		logging.info("Pre-rendered %r SensorData payloads.", len(self.payloadSuffixes))
+
+	def getPayloadCount(self) -> int:
+		"""
+		Returns the number of pre-rendered payloads (one per data entry).
+
+		@return int
+		"""
+		return len(self.payloadSuffixes)
+
+	def getPayload(self, index: int = 0, timeStamp: bytes = None) -> bytes:
+		"""
+		Returns the payload for the data entry at 'index', filled in with the
+		given time stamp.
+
+		@param index The data entry index. Wraps around if out of range.
+		@param timeStamp The rendered JSON time stamp (see renderTimeStamp()). If
+		None, the current time is used. For bulk publishing, render the time
+		stamp once and pass it in.
+		@return bytes The compact JSON payload.
+		"""
+		if timeStamp is None:
+			timeStamp = self.renderTimeStamp()
+
+		return self.payloadPrefix + timeStamp + self.payloadSuffixes[index % len(self.payloadSuffixes)]
+
+	def renderTimeStamp(self, epochSeconds: float = None) -> bytes:
+		"""
+		Renders a time stamp as a JSON string value, in the same ISO 8601
+		format as BaseIotData.getTimeStamp().
+
+		@param epochSeconds The epoch time in seconds. Defaults to the current time.
+		@return bytes The JSON time stamp value (including quotes).
+		"""
+		if epochSeconds is None:
+			timeStampDt = datetime.now(timezone.utc)
+		else:
+			timeStampDt = datetime.fromtimestamp(epochSeconds, timezone.utc)
+
+		return encode_basestring_ascii(timeStampDt.isoformat()).encode('ascii')
@@ -0,0 +1,176 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# You may find it more helpful to your design to adjust the
+# functionality, constants and interfaces (if there are any)
+# provided within in order to meet the needs of your specific
+# Programming the Internet of Things project.
+#
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+import numpy as calcLib
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataSet
+
+class SensorDataSetCache():
+	"""
+	On-disk cache for generated sensor data sets.
+
+	Each data set is stored as a set of .npy files in the cache directory,
+	named after a hash of the generator parameters and seed. Cached data sets
+	are opened as read-only memory-mapped arrays, so startup skips the
+	generation cost, and multiple processes on the same host share the
+	same pages rather than each holding a private copy.
+
+	Only data sets from seeded generators (see SensorDataGenerator.isSeeded())
+	are cached, as unseeded data sets aren't reproducible. The cache key
+	includes the current state of the generator's random number generator,
+	so a hit only returns the data the generator would produce next. On a
+	hit, the generator's state is advanced to where generating the data
+	set would have left it, so later draws don't depend on the cache.
+
+	"""
+
+	# bump this if the generated data changes for the same parameters
+	CACHE_VERSION = 1
+
+	TIME_ENTRIES_SUFFIX  = '.time.npy'
+	DATA_ENTRIES_SUFFIX  = '.data.npy'
+	CHANNEL_NAMES_SUFFIX = '.names.npy'
+	RNG_STATE_SUFFIX     = '.rng.json'
+
+	def __init__(self, cachePath: str = None):
+		"""
+		Constructor.
+
+		@param cachePath The directory in which to store cached data sets.
+		Will be created if it doesn't exist.
+		"""
+		self.cachePath = cachePath
+
+	def getCacheKey(self, dataGenerator: SensorDataGenerator, channelSpecs: list, startHour: int, endHour: int, useSeconds: bool) -> str:
+		"""
+		Returns the cache key for a multi-channel data set - a hash of all
+		parameters the generated data depends on, including the current
+		state of the generator's random number generator.
+
+		@return str The cache key (hex digest).
+		"""
+		params = { \
+			'version': self.CACHE_VERSION, \
+			'numpy': calcLib.__version__, \
+			'rngState': dataGenerator.rng.bit_generator.state, \
+			'alignGeneratorToDay': dataGenerator.alignGeneratorToDay, \
+			'startHour': startHour, \
+			'endHour': endHour, \
+			'useSeconds': bool(useSeconds), \
+			'channels': [ \
+				[str(spec.name), int(spec.curveType), int(spec.noiseLevel), float(spec.minValue), float(spec.maxValue)] \
+				for spec in channelSpecs]}
+
+		return hashlib.sha256(json.dumps(params, sort_keys = True).encode('utf-8')).hexdigest()
+
+	def getMultiChannelDataSet(self, dataGenerator: SensorDataGenerator, channelSpecs: list = None, startHour: int = SensorDataGenerator.MIN_HOURS, endHour: int = SensorDataGenerator.MAX_HOURS, useSeconds = False) -> SensorDataSet:
+		"""
+		Returns the multi-channel data set from the cache if available, or
+		generates it via SensorDataGenerator.generateMultiChannelDataSet() and
+		stores it in the cache.
+
+		@param dataGenerator The generator to use on a cache miss.
+		See SensorDataGenerator.generateMultiChannelDataSet() for all other parameters.
+		@return SensorDataSet The multi-channel sensor data set. If loaded from (or
+		stored in) the cache, its arrays are read-only memory-mapped arrays.
+		"""
+		if not self.cachePath or not dataGenerator.isSeeded():
+			return dataGenerator.generateMultiChannelDataSet( \
+				channelSpecs = channelSpecs, startHour = startHour, endHour = endHour, useSeconds = useSeconds)
+
+		fileNameBase = os.path.join(self.cachePath, self.getCacheKey(dataGenerator, channelSpecs, startHour, endHour, useSeconds))
+
+		dataSet = self._loadDataSet(dataGenerator, fileNameBase)
+
+		if dataSet:
+			return dataSet
+
+		dataSet = dataGenerator.generateMultiChannelDataSet( \
+			channelSpecs = channelSpecs, startHour = startHour, endHour = endHour, useSeconds = useSeconds)
+
+		if self._saveDataSet(dataSet, dataGenerator, fileNameBase):
+			# re-open, so this process shares the cached pages as well
+			return self._loadDataSet(dataGenerator, fileNameBase) or dataSet
+
+		return dataSet
+
+	def _loadDataSet(self, dataGenerator: SensorDataGenerator, fileNameBase: str) -> SensorDataSet:
+		dataFileName = fileNameBase + self.DATA_ENTRIES_SUFFIX
+
+		# the data entries are written last, so a partially stored data set is ignored
+		if not os.path.exists(dataFileName):
+			return None
+
+		try:
+			timeEntries  = calcLib.load(fileNameBase + self.TIME_ENTRIES_SUFFIX, mmap_mode = 'r')
+			dataEntries  = calcLib.load(dataFileName, mmap_mode = 'r')
+			channelNames = calcLib.load(fileNameBase + self.CHANNEL_NAMES_SUFFIX).tolist()
+
+			with open(fileNameBase + self.RNG_STATE_SUFFIX, 'r') as rngStateFile:
+				rngState = json.load(rngStateFile)
+		except (OSError, ValueError) as e:
+			logging.warning("Failed to load cached data set. Ignoring: %s - %s", fileNameBase, e)
+			return None
+
+		# leave the generator where generating the data set would have left it
+		dataGenerator.rng.bit_generator.state = rngState
+
+		logging.info("Loaded cached data set: %s", dataFileName)
+
+		dataSet = SensorDataSet( \
+			epochOffsetSeconds = dataGenerator.epochOffsetSeconds, useCurrentTime = dataGenerator.useCurrentTime, \
+			timeEntries = timeEntries)
+		dataSet.setDataEntries(dataEntries, channelNames = channelNames)
+
+		return dataSet
+
+	def _saveDataSet(self, dataSet: SensorDataSet, dataGenerator: SensorDataGenerator, fileNameBase: str) -> bool:
+		try:
+			os.makedirs(self.cachePath, exist_ok = True)
+
+			rngState = json.dumps(dataGenerator.rng.bit_generator.state).encode('utf-8')
+
+			self._saveFile(fileNameBase + self.RNG_STATE_SUFFIX, lambda dataFile: dataFile.write(rngState))
+
+			self._saveArray(fileNameBase + self.CHANNEL_NAMES_SUFFIX, calcLib.array(dataSet.getChannelNames() or [], dtype = str))
+			self._saveArray(fileNameBase + self.TIME_ENTRIES_SUFFIX, dataSet.getTimeEntries())
+			self._saveArray(fileNameBase + self.DATA_ENTRIES_SUFFIX, dataSet.getDataEntries())
+		except OSError as e:
+			logging.warning("Failed to store data set in cache: %s - %s", fileNameBase, e)
+			return False
+
+		logging.info("Stored data set in cache: %s", fileNameBase + self.DATA_ENTRIES_SUFFIX)
+
+		return True
+
+	def _saveArray(self, fileName: str, array):
+		self._saveFile(fileName, lambda dataFile: calcLib.save(dataFile, array))
+
+	def _saveFile(self, fileName: str, writeData):
+		# write to a temp file and rename, so other processes never see a partial file
+		fd, tempFileName = tempfile.mkstemp(dir = self.cachePath, suffix = '.tmp')
+
+		try:
+			with os.fdopen(fd, 'wb') as tempFile:
+				writeData(tempFile)
+
+			os.replace(tempFileName, fileName)
+		except:
+			os.remove(tempFileName)
+			raise
@@ -0,0 +1,129 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# You may find it more helpful to your design to adjust the
+# functionality, constants and interfaces (if there are any)
+# provided within in order to meet the needs of your specific
+# Programming the Internet of Things project.
+#
+
+import logging
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as calcLib
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataSet
+
+class SensorFleetGenerator():
+	"""
+	Bulk data set generation for large simulated sensor fleets (thousands
+	of channels), spread across a pool of worker processes.
+
+	The channel specs are split into fixed-size blocks. Each block is
+	generated via SensorDataGenerator.generateMultiChannelDataSet() in a
+	worker process, which writes its rows directly into a shared memory
+	block - only the (small) channel specs are pickled, never the arrays.
+
+	Each block draws its noise from its own child seed of the generator
+	(see SensorDataGenerator.spawnSeeds()), so for a seeded generator the
+	result is reproducible regardless of the number of worker processes.
+
+	"""
+
+	DEFAULT_BLOCK_SIZE = 256
+
+	def __init__(self, dataGenerator: SensorDataGenerator = None, maxWorkers: int = None, blockSize: int = DEFAULT_BLOCK_SIZE):
+		"""
+		Constructor.
+
+		@param dataGenerator The generator whose settings (and seed) to use. If
+		None, a default (unseeded) SensorDataGenerator is used.
+		@param maxWorkers The max number of worker processes. Defaults to the
+		number of CPUs. If 1, all blocks are generated in this process.
+		@param blockSize The number of channels generated per worker task.
+		"""
+		self.dataGenerator = dataGenerator if dataGenerator else SensorDataGenerator()
+		self.maxWorkers    = maxWorkers if maxWorkers else (os.cpu_count() or 1)
+		self.blockSize     = max(int(blockSize), 1)
+
+	def generateFleetDataSet(self, channelSpecs: list = None, startHour: int = SensorDataGenerator.MIN_HOURS, endHour: int = SensorDataGenerator.MAX_HOURS, useSeconds = False) -> SensorDataSet:
+		"""
+		Generates a multi-channel data set for all channel specs, with the same
+		semantics (and result shape) as SensorDataGenerator.generateMultiChannelDataSet().
+
+		@param channelSpecs The list of SensorChannelSpec instances, one per channel.
+		See SensorDataGenerator.generateMultiChannelDataSet() for all other parameters.
+		@return SensorDataSet The multi-channel sensor data set.
+		"""
+		if not channelSpecs:
+			raise ValueError("At least one channel spec is required.")
+
+		timeEntries = self.dataGenerator.generateTimeEntries(startHour = startHour, endHour = endHour, useSeconds = useSeconds)
+		shape = (len(channelSpecs), timeEntries.size)
+
+		blockStarts = range(0, len(channelSpecs), self.blockSize)
+		blockSeeds = self.dataGenerator.spawnSeeds(len(blockStarts))
+
+		generatorParams = (self.dataGenerator.alignGeneratorToDay, startHour, endHour, useSeconds)
+
+		sharedMem = shared_memory.SharedMemory(create = True, size = max(shape[0] * shape[1] * calcLib.dtype(calcLib.float64).itemsize, 1))
+
+		try:
+			tasks = [ \
+				(sharedMem.name, shape, blockStart, channelSpecs[blockStart:blockStart + self.blockSize], blockSeed, generatorParams) \
+				for blockStart, blockSeed in zip(blockStarts, blockSeeds)]
+
+			workerCount = min(self.maxWorkers, len(tasks))
+
+			logging.info("Generating fleet data set: channels = %r | blocks = %r | workers = %r", shape[0], len(tasks), workerCount)
+
+			if workerCount <= 1:
+				for task in tasks:
+					_generateFleetBlock(*task)
+			else:
+				with ProcessPoolExecutor(max_workers = workerCount) as executor:
+					# list() re-raises the first worker exception, if any
+					list(executor.map(_generateFleetBlock, *zip(*tasks)))
+
+			# a single copy out of shared memory, so its lifetime isn't tied to the data set
+			dataEntries = calcLib.ndarray(shape, dtype = calcLib.float64, buffer = sharedMem.buf).copy()
+		finally:
+			sharedMem.close()
+			sharedMem.unlink()
+
+		dataSet = SensorDataSet( \
+			epochOffsetSeconds = self.dataGenerator.epochOffsetSeconds, useCurrentTime = self.dataGenerator.useCurrentTime, \
+			timeEntries = timeEntries)
+		dataSet.setDataEntries(dataEntries, channelNames = [spec.name for spec in channelSpecs])
+
+		return dataSet
+
+def _generateFleetBlock(sharedMemName: str, shape: tuple, blockStart: int, channelSpecs: list, seed, generatorParams: tuple):
+	"""
+	Worker task - generates the rows for one block of channel specs, and
+	writes them into the shared memory block.
+
+	"""
+	alignGeneratorToDay, startHour, endHour, useSeconds = generatorParams
+
+	dataGenerator = SensorDataGenerator(alignGeneratorToDay = alignGeneratorToDay, seed = seed)
+	dataSet = dataGenerator.generateMultiChannelDataSet( \
+		channelSpecs = channelSpecs, startHour = startHour, endHour = endHour, useSeconds = useSeconds)
+
+	sharedMem = shared_memory.SharedMemory(name = sharedMemName)
+
+	try:
+		dataEntries = calcLib.ndarray(shape, dtype = calcLib.float64, buffer = sharedMem.buf)
+		dataEntries[blockStart:blockStart + len(channelSpecs)] = dataSet.getDataEntries()
+
+		# release the view before closing, as exported buffers can't be closed
+		del dataEntries
+	finally:
+		sharedMem.close()
@@ -0,0 +1,272 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# You may find it more helpful to your design to adjust the
+# functionality, constants and interfaces (if there are any)
+# provided within in order to meet the needs of your specific
+# Programming the Internet of Things project.
+#
+
+import codecs
+import json
+import logging
+import os
+import re
+
+import numpy as calcLib
+
+from programmingtheiot.data.SensorData import SensorData
+
+class SimTestDataReader():
+	"""
+	Streaming reader for simulated test data files, such as those in
+	the simTestData directory (e.g. PIOT_SimulatedTestData_IndoorTemperature.json).
+	These files contain a single JSON object with one list of SensorData
+	entries, each carrying an additional 'timeOffsetSeconds' property.
+
+	Entries are parsed one at a time from a fixed-size read buffer, so
+	memory use doesn't grow with the file size. Entries are expected to
+	be ordered by time offset.
+
+	To support seeking, a sparse index of (time offset, byte offset) pairs
+	is collected on the first complete read and saved as a sidecar file
+	next to the data file (see getIndexFileName()). Subsequent calls to
+	readSensorData() with a start offset use the index to jump close to
+	the requested entry, and only parse the entries after that point.
+
+	"""
+
+	SENSOR_DATA_LIST_KEY = 'sensorDataList'
+	TIME_OFFSET_KEY      = 'timeOffsetSeconds'
+
+	INDEX_FILE_SUFFIX = '.idx.npz'
+	INDEX_STRIDE      = 64
+	INDEX_DTYPE       = calcLib.dtype([(TIME_OFFSET_KEY, calcLib.float64), ('byteOffset', calcLib.int64)])
+
+	DEFAULT_CHUNK_SIZE = 64 * 1024
+
+	_LIST_START_PATTERN = re.compile(r'"' + SENSOR_DATA_LIST_KEY + r'"\s*:\s*\[')
+	_SEPARATOR_PATTERN  = re.compile(r'[\s,]*')
+
+	def __init__(self, fileName: str = None, chunkSize: int = DEFAULT_CHUNK_SIZE, useIndexFile: bool = True):
+		"""
+		Constructor.
+
+		@param fileName The name (path) of the simulated test data file.
+		@param chunkSize The number of bytes to read from the file at a time.
+		@param useIndexFile If True (default), the seek index will be loaded
+		from - and saved to - the sidecar index file. If False, the index
+		will be kept in memory only.
+		"""
+		self.fileName     = fileName
+		self.chunkSize    = max(chunkSize, 1024)
+		self.useIndexFile = useIndexFile
+
+		self.index       = None
+		self.jsonDecoder = json.JSONDecoder()
+
+		self.propertyNames = SensorData.getPropertyNames()
+
+	def getIndexFileName(self) -> str:
+		"""
+		Returns the name (path) of the sidecar index file.
+
+		@return str The index file name.
+		"""
+		return self.fileName + self.INDEX_FILE_SUFFIX
+
+	def hasIndex(self) -> bool:
+		"""
+		Checks if the seek index is available, loading it from the sidecar
+		index file if necessary. An index file will be ignored if the data
+		file has changed since it was created.
+
+		@return bool True if the index is available; False otherwise.
+		"""
+		if self.index is None and self.useIndexFile:
+			self.index = self._loadIndex()
+
+		return self.index is not None
+
+	def buildIndex(self) -> bool:
+		"""
+		Reads the entire file once to build the seek index (and save it,
+		if enabled). This isn't required, as the index is also built
+		the first time the file is read from start to finish.
+
+		@return bool True if the index was built; False otherwise.
+		"""
+		for _ in self.readSensorData():
+			pass
+
+		return self.index is not None
+
+	def readSensorData(self, startOffsetSeconds: float = None):
+		"""
+		Generator that yields each entry in the file as a tuple of its time
+		offset (in seconds) and a new SensorData instance.
+
+		@param startOffsetSeconds If set, entries with a time offset less than
+		this value will be skipped. If the seek index is available, the reader
+		will start close to the first requested entry rather than at the
+		beginning of the file.
+		"""
+		startByteOffset = None
+		indexEntries = None
+
+		if not self.hasIndex():
+			# first read - collect the index (only saved if the end is reached)
+			indexEntries = []
+		elif startOffsetSeconds is not None:
+			startByteOffset = self._findByteOffset(startOffsetSeconds)
+
+		for count, (byteOffset, entry) in enumerate(self._readEntries(startByteOffset)):
+			timeOffset = float(entry.pop(self.TIME_OFFSET_KEY, 0.0))
+
+			if indexEntries is not None and count % self.INDEX_STRIDE == 0:
+				indexEntries.append((timeOffset, byteOffset))
+
+			if startOffsetSeconds is not None and timeOffset < startOffsetSeconds:
+				continue
+
+			yield timeOffset, self._createSensorData(entry)
+
+		# only reached if the file was read to the end
+		if indexEntries is not None:
+			self.index = calcLib.array(indexEntries, dtype = self.INDEX_DTYPE)
+
+			if self.useIndexFile:
+				self._saveIndex()
+
+	def _createSensorData(self, entry: dict) -> SensorData:
+		sd = SensorData()
+
+		for name in self.propertyNames:
+			if name in entry:
+				setattr(sd, name, entry[name])
+
+		return sd
+
+	def _findByteOffset(self, startOffsetSeconds: float) -> int:
+		# last indexed entry at or before the requested offset
+		pos = calcLib.searchsorted(self.index[self.TIME_OFFSET_KEY], startOffsetSeconds, side = 'right') - 1
+
+		if pos < 0:
+			return None
+
+		return int(self.index['byteOffset'][pos])
+
+	def _getSourceStats(self):
+		stat = os.stat(self.fileName)
+
+		return calcLib.array([stat.st_size, stat.st_mtime_ns], dtype = calcLib.int64)
+
+	def _loadIndex(self):
+		indexFileName = self.getIndexFileName()
+
+		if not os.path.exists(indexFileName):
+			return None
+
+		try:
+			with calcLib.load(indexFileName) as indexFile:
+				if calcLib.array_equal(indexFile['sourceStats'], self._getSourceStats()):
+					logging.info("Loaded seek index: %s", indexFileName)
+					return indexFile['entries']
+
+			logging.info("Seek index is out of date. Ignoring: %s", indexFileName)
+		except (OSError, ValueError, KeyError) as e:
+			logging.warning("Failed to load seek index. Ignoring: %s - %s", indexFileName, e)
+
+		return None
+
+	def _saveIndex(self):
+		indexFileName = self.getIndexFileName()
+
+		try:
+			with open(indexFileName, 'wb') as indexFile:
+				calcLib.savez(indexFile, entries = self.index, sourceStats = self._getSourceStats())
+
+			logging.info("Saved seek index: %s", indexFileName)
+		except OSError as e:
+			logging.warning("Failed to save seek index. Keeping it in memory only: %s - %s", indexFileName, e)
+
+	def _readEntries(self, startByteOffset: int = None):
+		"""
+		Generator that yields each entry in the SensorData list as a tuple of
+		its byte offset within the file and its dict. Only one read buffer
+		(plus any partially read entry) is held in memory at a time.
+		"""
+		decoder = codecs.getincrementaldecoder('utf-8')()
+
+		with open(self.fileName, 'rb') as dataFile:
+			if startByteOffset is not None:
+				dataFile.seek(startByteOffset)
+				bufByteOffset = startByteOffset
+				buf = ''
+			else:
+				bufByteOffset, buf = self._seekToListStart(dataFile, decoder)
+
+			# 'bufByteOffset' is the byte offset (in the file) of buf[basePos]
+			basePos = 0
+			pos = 0
+			isEof = False
+
+			while True:
+				pos = self._SEPARATOR_PATTERN.match(buf, pos).end()
+
+				if pos < len(buf):
+					if buf[pos] == ']':
+						return
+
+					try:
+						entry, end = self.jsonDecoder.raw_decode(buf, pos)
+					except json.JSONDecodeError:
+						# most likely a partially read entry
+						if isEof:
+							raise
+					else:
+						bufByteOffset += self._getByteLength(buf, basePos, pos)
+						basePos = pos
+
+						yield bufByteOffset, entry
+
+						pos = end
+						continue
+				elif isEof:
+					return
+
+				# drop what's been consumed and read the next chunk
+				bufByteOffset += self._getByteLength(buf, basePos, pos)
+
+				chunk = dataFile.read(self.chunkSize)
+				isEof = not chunk
+
+				buf = buf[pos:] + decoder.decode(chunk, final = isEof)
+				basePos = 0
+				pos = 0
+
+	def _seekToListStart(self, dataFile, decoder):
+		buf = ''
+
+		while True:
+			match = self._LIST_START_PATTERN.search(buf)
+
+			if match:
+				end = match.end()
+
+				return self._getByteLength(buf, 0, end), buf[end:]
+
+			chunk = dataFile.read(self.chunkSize)
+
+			if not chunk:
+				raise ValueError("No '" + self.SENSOR_DATA_LIST_KEY + "' list found in: " + self.fileName)
+
+			buf += decoder.decode(chunk)
+
+	def _getByteLength(self, buf: str, start: int, end: int) -> int:
+		text = buf[start:end]
+
+		return len(text) if text.isascii() else len(text.encode('utf-8'))
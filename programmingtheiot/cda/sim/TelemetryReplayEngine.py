@@ -0,0 +1,214 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# You may find it more helpful to your design to adjust the
+# functionality, constants and interfaces (if there are any)
+# provided within in order to meet the needs of your specific
+# Programming the Internet of Things project.
+#
+
+import csv
+import heapq
+import logging
+import time
+
+from datetime import datetime, timezone
+
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.IDataMessageListener import IDataMessageListener
+from programmingtheiot.cda.sim.SimTestDataReader import SimTestDataReader
+from programmingtheiot.data.SensorData import SensorData
+
+class TelemetryReplayEngine():
+	"""
+	Replays recorded telemetry into an IDataMessageListener (such as
+	DeviceDataManager) via handleSensorMessage(), preserving the relative
+	spacing of the recorded time offsets - scaled by a speed-up factor.
+
+	Supported sources are the simulated test data JSON files (see
+	SimTestDataReader), CSV captures with 'ts', 'sensor' and 'value' columns
+	(see the sketch in SensorRunner), and any iterable of (time offset, SensorData)
+	tuples. Multiple sources are merged by time offset, so each source must
+	be ordered by time offset.
+
+	replay() returns the achieved throughput and per-stage latency stats:
+	'read' (parsing the next reading from its source), 'lag' (how far behind
+	schedule each reading was dispatched) and 'handle' (the listener call).
+
+	"""
+
+	AS_FAST_AS_POSSIBLE = 0.0
+
+	CSV_TIMESTAMP_COLUMN = 'ts'
+	CSV_NAME_COLUMN      = 'sensor'
+	CSV_VALUE_COLUMN     = 'value'
+
+	STAGE_NAMES = ('read', 'lag', 'handle')
+
+	NS_IN_SECS = 1000000000
+	NS_IN_MILLIS = 1000000
+
+	def __init__(self, speedFactor: float = 1.0, restampData: bool = False):
+		"""
+		Constructor.
+
+		@param speedFactor The replay speed-up factor - e.g. 1.0 (real time, default)
+		or 100.0. AS_FAST_AS_POSSIBLE (0.0) disables pacing.
+		@param restampData If True, each reading's time stamp is set to the time it's
+		dispatched. If False (default), the recorded time stamps are kept.
+		"""
+		self.speedFactor = max(float(speedFactor), self.AS_FAST_AS_POSSIBLE)
+		self.restampData = restampData
+
+		self.dataMsgListener = None
+		self.sources = []
+
+	def addSource(self, source):
+		"""
+		Adds a source of (time offset in seconds, SensorData) tuples, ordered by time offset.
+
+		@param source The iterable source.
+		"""
+		if source is not None:
+			self.sources.append(source)
+
+	def addJsonFile(self, fileName: str):
+		"""
+		Adds a simulated test data JSON file as a source (see SimTestDataReader).
+
+		@param fileName The name (path) of the JSON file.
+		"""
+		# read start to finish, so no seek index is needed
+		self.addSource(SimTestDataReader(fileName, useIndexFile = False).readSensorData())
+
+	def addCsvFile(self, fileName: str):
+		"""
+		Adds a CSV capture as a source. Each row needs an ISO 8601 time stamp
+		('ts'), a sensor name ('sensor') and a value ('value'). Time offsets are
+		relative to the first row.
+
+		@param fileName The name (path) of the CSV file.
+		"""
+		self.addSource(self._readCsvFile(fileName))
+
+	def setDataMessageListener(self, listener: IDataMessageListener = None):
+		"""
+		Sets the listener that replayed readings are passed to.
+
+		@param listener The IDataMessageListener (e.g. DeviceDataManager).
+		"""
+		if listener:
+			self.dataMsgListener = listener
+
+	def replay(self, maxMessages: int = None) -> dict:
+		"""
+		Replays all sources (merged by time offset) into the listener, blocking
+		until done. The sources are consumed.
+
+		@param maxMessages The optional max number of readings to replay.
+		@return dict The replay stats: 'messageCount', 'elapsedSeconds', 'throughput'
+		(messages per second) and, per stage, the mean / p50 / p99 / max latency
+		in milliseconds.
+		"""
+		if not self.dataMsgListener:
+			raise ValueError("No data message listener set. Cannot replay telemetry.")
+
+		readings = heapq.merge(*self.sources, key = lambda reading: reading[0])
+		self.sources = []
+
+		stageNs = {stageName: [] for stageName in self.STAGE_NAMES}
+		readNs = stageNs['read']
+		lagNs = stageNs['lag']
+		handleNs = stageNs['handle']
+
+		speedFactor = self.speedFactor
+		messageCount = 0
+		startOffset = None
+		startTime = time.perf_counter_ns()
+
+		while maxMessages is None or messageCount < maxMessages:
+			readStartTime = time.perf_counter_ns()
+
+			try:
+				timeOffset, sensorData = next(readings)
+			except StopIteration:
+				break
+
+			readEndTime = time.perf_counter_ns()
+			readNs.append(readEndTime - readStartTime)
+
+			if startOffset is None:
+				startOffset = timeOffset
+
+			dispatchTime = readEndTime
+
+			if speedFactor > 0:
+				targetTime = startTime + int((timeOffset - startOffset) * self.NS_IN_SECS / speedFactor)
+
+				if targetTime > readEndTime:
+					time.sleep((targetTime - readEndTime) / self.NS_IN_SECS)
+
+				dispatchTime = time.perf_counter_ns()
+				lagNs.append(max(dispatchTime - targetTime, 0))
+
+			if self.restampData:
+				sensorData.updateTimeStamp()
+
+			self.dataMsgListener.handleSensorMessage(sensorData)
+
+			handleNs.append(time.perf_counter_ns() - dispatchTime)
+			messageCount += 1
+
+		elapsedSeconds = (time.perf_counter_ns() - startTime) / self.NS_IN_SECS
+
+		stats = { \
+			'messageCount': messageCount, \
+			'elapsedSeconds': elapsedSeconds, \
+			'throughput': messageCount / elapsedSeconds if elapsedSeconds > 0 else 0.0}
+
+		for stageName, latencies in stageNs.items():
+			stats[stageName] = self._getLatencyStats(latencies)
+
+		logging.info( \
+			"Replayed telemetry: messages = %r | elapsed = %.3f s | throughput = %.0f msgs/sec | speed-up = %s%s", \
+			messageCount, elapsedSeconds, stats['throughput'], speedFactor if speedFactor > 0 else 'max', \
+			''.join( \
+				"\n\t%-6s latency (ms): mean = %.3f | p50 = %.3f | p99 = %.3f | max = %.3f" % \
+					(stageName, stats[stageName]['mean'], stats[stageName]['p50'], stats[stageName]['p99'], stats[stageName]['max']) \
+				for stageName in self.STAGE_NAMES))
+
+		return stats
+
+	def _getLatencyStats(self, latencies: list) -> dict:
+		if not latencies:
+			return {'mean': 0.0, 'p50': 0.0, 'p99': 0.0, 'max': 0.0}
+
+		latencyMillis = calcLib.array(latencies, dtype = calcLib.float64) / self.NS_IN_MILLIS
+		p50, p99 = calcLib.percentile(latencyMillis, (50, 99))
+
+		return {'mean': float(latencyMillis.mean()), 'p50': float(p50), 'p99': float(p99), 'max': float(latencyMillis.max())}
+
+	def _readCsvFile(self, fileName: str):
+		with open(fileName, 'r', newline = '') as csvFile:
+			startTime = None
+
+			for row in csv.DictReader(csvFile):
+				timeStamp = datetime.fromisoformat(row[self.CSV_TIMESTAMP_COLUMN])
+
+				if timeStamp.tzinfo is None:
+					timeStamp = timeStamp.replace(tzinfo = timezone.utc)
+
+				if startTime is None:
+					startTime = timeStamp
+
+				sensorData = SensorData(name = row.get(self.CSV_NAME_COLUMN) or ConfigConst.NOT_SET)
+				sensorData.setValue(float(row[self.CSV_VALUE_COLUMN]))
+				sensorData.setTimeStamp(row[self.CSV_TIMESTAMP_COLUMN])
+
+				yield (timeStamp - startTime).total_seconds(), sensorData
@@ -25,13 +25,16 @@ class TemperatureSensorSimTask(BaseSensorSimTask):
 	
 	"""
 
-	def __init__(self, dataSet = None):
+	def __init__(self, dataSet = None, reuseSensorData: bool = False, seed = None, useTimeIndex: bool = False):
 		super( \
 			TemperatureSensorSimTask, self).__init__( \
 				name = ConfigConst.TEMP_SENSOR_NAME, \
 				typeID = ConfigConst.TEMP_SENSOR_TYPE, \
 				dataSet = dataSet, \
 				minVal = SensorDataGenerator.LOW_NORMAL_INDOOR_TEMP, \
-				maxVal = SensorDataGenerator.HI_NORMAL_INDOOR_TEMP)
+				maxVal = SensorDataGenerator.HI_NORMAL_INDOOR_TEMP, \
+				reuseSensorData = reuseSensorData, \
+				seed = seed, \
+				useTimeIndex = useTimeIndex)
 			
 	
\ No newline at end of file
@@ -12,8 +12,6 @@
 
 import logging
 
-from importlib import import_module
-
 import programmingtheiot.common.ConfigConst as ConfigConst
 from programmingtheiot.common.ConfigUtil import ConfigUtil
 from programmingtheiot.common.IDataMessageListener import IDataMessageListener
@@ -22,11 +20,17 @@ from programmingtheiot.data.ActuatorData import ActuatorData
 
 from programmingtheiot.cda.sim.HvacActuatorSimTask import HvacActuatorSimTask
 from programmingtheiot.cda.sim.HumidifierActuatorSimTask import HumidifierActuatorSimTask
+from programmingtheiot.cda.system.DeviceTaskRegistry import DeviceTaskRegistry
 
 class ActuatorAdapterManager(object):
 	"""
 	Shell representation of class for student implementation.
 	
+	If 'actuatorPlugins' lists any plugin sections (see DeviceTaskRegistry),
+	the configured actuator tasks replace the default actuator tasks.
+	Actuator commands are dispatched by type ID - and by name, if more than
+	one actuator shares the command's type ID.
+	
 	"""
 	
 	def __init__(self, dataMsgListener: IDataMessageListener = None):
@@ -50,9 +54,21 @@ class ActuatorAdapterManager(object):
 		self.humidifierActuator = None
 		self.hvacActuator       = None
 		self.ledDisplayActuator = None
+		self.actuatorsByType    = {}
+		
+		self.taskRegistry = DeviceTaskRegistry(self.configUtil)
 		
 		# see PIOT-CDA-03-007 description for thoughts on the next line of code
-		self._initEnvironmentalActuationTasks()
+		if self.taskRegistry.hasPlugins(ConfigConst.ACTUATOR_PLUGINS_KEY):
+			actuators = self.taskRegistry.createTasks(ConfigConst.ACTUATOR_PLUGINS_KEY)
+		else:
+			self._initEnvironmentalActuationTasks()
+			
+			actuators = [self.humidifierActuator, self.hvacActuator, self.ledDisplayActuator]
+		
+		for actuator in actuators:
+			if actuator:
+				self.actuatorsByType.setdefault(actuator.getTypeID(), []).append(actuator)
 
 	def sendActuatorCommand(self, data: ActuatorData) -> ActuatorData:
 		if data and not data.isResponseFlagEnabled():
@@ -60,16 +76,12 @@ class ActuatorAdapterManager(object):
 			if data.getLocationID() == self.locationID:
 				logging.info("Actuator command received for location ID %s. Processing...", str(data.getLocationID()))
 				
-				aType = data.getTypeID()
+				actuator = self._getActuator(data)
 				responseData = None
 				
 				# TODO: implement appropriate logging and error handling
-				if aType == ConfigConst.HUMIDIFIER_ACTUATOR_TYPE and self.humidifierActuator:
-					responseData = self.humidifierActuator.updateActuator(data)
-				elif aType == ConfigConst.HVAC_ACTUATOR_TYPE and self.hvacActuator:
-					responseData = self.hvacActuator.updateActuator(data)
-				elif aType == ConfigConst.LED_DISPLAY_ACTUATOR_TYPE and self.ledDisplayActuator:
-					responseData = self.ledDisplayActuator.updateActuator(data)
+				if actuator:
+					responseData = actuator.updateActuator(data)
 				else:
 					logging.warning("No valid actuator type. Ignoring actuation for type: %s", data.getTypeID())
 					
@@ -89,6 +101,24 @@ class ActuatorAdapterManager(object):
 		if listener:
 			self.dataMsgListener = listener
 	
+	def _getActuator(self, data: ActuatorData):
+		actuators = self.actuatorsByType.get(data.getTypeID())
+		
+		if not actuators:
+			return None
+		
+		if len(actuators) == 1:
+			return actuators[0]
+		
+		# several actuators of this type - the command's name selects one
+		for actuator in actuators:
+			if actuator.getName() == data.getName():
+				return actuator
+		
+		logging.warning("No actuator named %s for type: %s", data.getName(), data.getTypeID())
+		
+		return None
+	
 	def _initEnvironmentalActuationTasks(self):
 		if not self.useEmulator:
 			# load the environmental tasks for simulated actuation
@@ -97,18 +127,13 @@ class ActuatorAdapterManager(object):
 			# create the HVAC actuator
 			self.hvacActuator = HvacActuatorSimTask()
 		else:
-			hueModule = import_module('programmingtheiot.cda.emulated.HumidifierEmulatorTask', 'HumidiferEmulatorTask')
-			hueClazz = getattr(hueModule, 'HumidifierEmulatorTask')
-			self.humidifierActuator = hueClazz()
+			# the emulator modules (and pisense) are only imported here
+			self.humidifierActuator = self.taskRegistry.createTask({ConfigConst.PLUGIN_CLASS_KEY: 'HumidifierEmulatorTask'})
 			
 			# create the HVAC actuator emulator
-			hveModule = import_module('programmingtheiot.cda.emulated.HvacEmulatorTask', 'HvacEmulatorTask')
-			hveClazz = getattr(hveModule, 'HvacEmulatorTask')
-			self.hvacActuator = hveClazz()
+			self.hvacActuator = self.taskRegistry.createTask({ConfigConst.PLUGIN_CLASS_KEY: 'HvacEmulatorTask'})
 			
 			# create the LED display actuator emulator
-			leDisplayModule = import_module('programmingtheiot.cda.emulated.LedDisplayEmulatorTask', 'LedDisplayEmulatorTask')
-			leClazz = getattr(leDisplayModule, 'LedDisplayEmulatorTask')
-			self.ledDisplayActuator = leClazz()
+			self.ledDisplayActuator = self.taskRegistry.createTask({ConfigConst.PLUGIN_CLASS_KEY: 'LedDisplayEmulatorTask'})
 
 
@@ -0,0 +1,241 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# You may find it more helpful to your design to adjust the
+# functionality, constants and interfaces (if there are any)
+# provided within in order to meet the needs of your specific
+# Programming the Internet of Things project.
+#
+
+import ast
+import inspect
+import logging
+
+from importlib import import_module
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.ConfigUtil import ConfigUtil
+
+class DeviceTaskRegistry():
+	"""
+	Config-driven registry of sensor and actuator task plugins.
+
+	PiotConfig.props can list any number of plugin instances by section name,
+	via the 'sensorPlugins' and 'actuatorPlugins' keys of the ConstrainedDevice
+	section. Each plugin section names the task class - a registered alias
+	(e.g. 'TemperatureSensorSimTask') or a fully qualified class name - and,
+	optionally, its name, type ID and other constructor parameters:
+
+		[Sensor.Temp01]
+		class   = BaseSensorSimTask
+		name    = TempSensor01
+		typeID  = 1013
+		minVal  = 18.0
+		maxVal  = 24.0
+
+	Parameter values are parsed as Python literals where possible (e.g. 18.0,
+	True, None), and kept as strings otherwise. Parameter names are matched
+	against the constructor case-insensitively, as the config parser lower-cases
+	all keys. Sensor plugins may also set 'pollCycleSecs' and 'pollPhaseSecs'
+	(see BaseSensorSimTask.setPollCycle()).
+
+	Classes with a fixed name (e.g. TemperatureSensorSimTask) get the configured
+	name set after construction, so multiple instances can be told apart. As
+	the sensor and actuator managers key their tasks by name, task names must be
+	unique: createTasks() skips any plugin whose task name is already taken.
+
+	Modules are only imported when a task of one of their classes is created,
+	so e.g. the emulator modules (and pisense) are never imported by sim-only
+	deployments.
+
+	"""
+
+	# class aliases for the built-in tasks - nothing is imported until used
+	DEFAULT_CLASS_ALIASES = { \
+		'BaseSensorSimTask':             'programmingtheiot.cda.sim.BaseSensorSimTask.BaseSensorSimTask', \
+		'HumiditySensorSimTask':         'programmingtheiot.cda.sim.HumiditySensorSimTask.HumiditySensorSimTask', \
+		'PressureSensorSimTask':         'programmingtheiot.cda.sim.PressureSensorSimTask.PressureSensorSimTask', \
+		'TemperatureSensorSimTask':      'programmingtheiot.cda.sim.TemperatureSensorSimTask.TemperatureSensorSimTask', \
+		'BaseActuatorSimTask':           'programmingtheiot.cda.sim.BaseActuatorSimTask.BaseActuatorSimTask', \
+		'HumidifierActuatorSimTask':     'programmingtheiot.cda.sim.HumidifierActuatorSimTask.HumidifierActuatorSimTask', \
+		'HvacActuatorSimTask':           'programmingtheiot.cda.sim.HvacActuatorSimTask.HvacActuatorSimTask', \
+		'HumiditySensorEmulatorTask':    'programmingtheiot.cda.emulated.HumiditySensorEmulatorTask.HumiditySensorEmulatorTask', \
+		'PressureSensorEmulatorTask':    'programmingtheiot.cda.emulated.PressureSensorEmulatorTask.PressureSensorEmulatorTask', \
+		'TemperatureSensorEmulatorTask': 'programmingtheiot.cda.emulated.TemperatureSensorEmulatorTask.TemperatureSensorEmulatorTask', \
+		'HumidifierEmulatorTask':        'programmingtheiot.cda.emulated.HumidifierEmulatorTask.HumidifierEmulatorTask', \
+		'HvacEmulatorTask':              'programmingtheiot.cda.emulated.HvacEmulatorTask.HvacEmulatorTask', \
+		'LedDisplayEmulatorTask':        'programmingtheiot.cda.emulated.LedDisplayEmulatorTask.LedDisplayEmulatorTask'}
+
+	def __init__(self, configUtil: ConfigUtil = None):
+		"""
+		Constructor.
+
+		@param configUtil The config to read plugin sections from. Defaults to
+		the ConfigUtil instance.
+		"""
+		self.configUtil = configUtil if configUtil else ConfigUtil()
+
+		self.classAliases = dict(self.DEFAULT_CLASS_ALIASES)
+		self.classes = {}
+
+	def registerClass(self, alias: str, className: str):
+		"""
+		Registers a class alias. The class isn't imported until a task is created.
+
+		@param alias The alias to use for the 'class' key of plugin sections.
+		@param className The fully qualified class name (module path and class name).
+		"""
+		self.classAliases[alias] = className
+
+	def getClass(self, className: str):
+		"""
+		Returns the class for an alias or fully qualified class name, importing
+		its module on first use.
+
+		@param className The class alias or fully qualified class name.
+		@return The class.
+		"""
+		className = self.classAliases.get(className, className)
+		clazz = self.classes.get(className)
+
+		if clazz is None:
+			moduleName, _, simpleName = className.rpartition('.')
+
+			if not moduleName:
+				raise ValueError("Unknown task class. Use an alias or a fully qualified class name: %s" % className)
+
+			clazz = getattr(import_module(moduleName), simpleName)
+			self.classes[className] = clazz
+
+			logging.info("Loaded task class: %s", className)
+
+		return clazz
+
+	def hasPlugins(self, pluginsKey: str) -> bool:
+		"""
+		Returns True if any plugin sections are listed under 'pluginsKey'.
+
+		@param pluginsKey The ConstrainedDevice key listing the plugin sections
+		(e.g. ConfigConst.SENSOR_PLUGINS_KEY).
+		@return bool
+		"""
+		return len(self.getPluginSections(pluginsKey)) > 0
+
+	def getPluginSections(self, pluginsKey: str) -> list:
+		"""
+		Returns the plugin section names listed (comma separated) under 'pluginsKey'.
+
+		@param pluginsKey The ConstrainedDevice key listing the plugin sections.
+		@return list The section names.
+		"""
+		pluginSections = \
+			self.configUtil.getProperty( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = pluginsKey, defaultVal = '')
+
+		return [sectionName.strip() for sectionName in pluginSections.split(',') if sectionName.strip()]
+
+	def createTasks(self, pluginsKey: str) -> list:
+		"""
+		Creates a task for each plugin section listed under 'pluginsKey'.
+		Misconfigured plugins, and plugins whose task name is already taken,
+		are logged and skipped.
+
+		@param pluginsKey The ConstrainedDevice key listing the plugin sections.
+		@return list The tasks, in the listed order.
+		"""
+		tasks = []
+		taskNames = set()
+
+		for sectionName in self.getPluginSections(pluginsKey):
+			pluginProps = self.configUtil.getSectionProperties(sectionName)
+
+			if not pluginProps:
+				logging.error("Plugin section not found or empty. Skipping: %s", sectionName)
+				continue
+
+			try:
+				task = self.createTask(pluginProps)
+			except Exception as e:
+				logging.error("Failed to create plugin task. Skipping: %s - %s", sectionName, e)
+				continue
+
+			if task.getName() in taskNames:
+				logging.error("Plugin task name already in use. Set a unique '%s'. Skipping: %s - %s", ConfigConst.PLUGIN_NAME_KEY, sectionName, task.getName())
+				continue
+
+			taskNames.add(task.getName())
+			tasks.append(task)
+
+		logging.info("Created %r of %r plugin tasks for: %s", len(tasks), len(self.getPluginSections(pluginsKey)), pluginsKey)
+
+		return tasks
+
+	def createTask(self, pluginProps: dict):
+		"""
+		Creates a task from a plugin definition.
+
+		@param pluginProps The plugin definition - the 'class' and all other
+		keys of a plugin section, with string (or already typed) values.
+		@return The task instance.
+		"""
+		props = {key.lower(): val for key, val in pluginProps.items()}
+
+		className = props.pop(ConfigConst.PLUGIN_CLASS_KEY.lower(), None)
+
+		if not className:
+			raise ValueError("Plugin definition has no '%s' key." % ConfigConst.PLUGIN_CLASS_KEY)
+
+		pollCycleSecs   = self._parseValue(props.pop(ConfigConst.POLL_CYCLES_KEY.lower(), None))
+		phaseOffsetSecs = self._parseValue(props.pop(ConfigConst.POLL_PHASE_KEY.lower(), None))
+
+		clazz = self.getClass(className)
+		args = self._getConstructorArgs(clazz, props)
+		task = clazz(**args)
+
+		taskName = props.get(ConfigConst.PLUGIN_NAME_KEY.lower())
+
+		if taskName and ConfigConst.PLUGIN_NAME_KEY not in args:
+			# fixed-name class - apply the configured name after construction
+			task.setName(str(self._parseValue(taskName)))
+
+		if pollCycleSecs is not None or phaseOffsetSecs is not None:
+			task.setPollCycle(pollCycleSecs = pollCycleSecs, phaseOffsetSecs = phaseOffsetSecs)
+
+		return task
+
+	def _getConstructorArgs(self, clazz, props: dict) -> dict:
+		params = inspect.signature(clazz.__init__).parameters
+		paramNames = {paramName.lower(): paramName for paramName in params if paramName != 'self'}
+		hasVarKeywords = any(param.kind == inspect.Parameter.VAR_KEYWORD for param in params.values())
+
+		args = {}
+
+		for key, val in props.items():
+			paramName = paramNames.get(key)
+
+			if paramName:
+				args[paramName] = self._parseValue(val)
+			elif hasVarKeywords:
+				args[key] = self._parseValue(val)
+			elif key == ConfigConst.PLUGIN_NAME_KEY.lower():
+				# set after construction (see createTask())
+				pass
+			elif key == ConfigConst.PLUGIN_TYPE_ID_KEY.lower():
+				logging.warning("Task class has a fixed type ID. Ignoring '%s': %s", key, clazz.__name__)
+			else:
+				raise ValueError("Unknown parameter for %s: %s" % (clazz.__name__, key))
+
+		return args
+
+	def _parseValue(self, val):
+		if not isinstance(val, str):
+			return val
+
+		try:
+			return ast.literal_eval(val.strip())
+		except (ValueError, SyntaxError):
+			return val.strip()
@@ -11,10 +11,11 @@
 # 
 
 import logging
+import threading
+import time
 
-from importlib import import_module
-
-from apscheduler.schedulers.background import BackgroundScheduler
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 
@@ -22,16 +23,40 @@ from programmingtheiot.common.ConfigUtil import ConfigUtil
 from programmingtheiot.common.IDataMessageListener import IDataMessageListener
 
 from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorDataSetCache import SensorDataSetCache
 from programmingtheiot.cda.sim.HumiditySensorSimTask import HumiditySensorSimTask
 from programmingtheiot.cda.sim.TemperatureSensorSimTask import TemperatureSensorSimTask
 from programmingtheiot.cda.sim.PressureSensorSimTask import PressureSensorSimTask
+from programmingtheiot.cda.system.DeviceTaskRegistry import DeviceTaskRegistry
+from programmingtheiot.cda.system.SensorTaskScheduler import SensorTaskScheduler
+from programmingtheiot.data.SensorData import SensorData
 
 class SensorAdapterManager(object):
 	"""
 	Shell representation of class for student implementation.
 	
+	Each sensor task is polled at its own poll cycle and phase offset (see
+	BaseSensorSimTask.setPollCycle() and the per-sensor poll cycle keys in
+	PiotConfig.props), from a single SensorTaskScheduler timer thread.
+	Sensors without their own poll cycle are polled at 'pollCycleSecs'.
+	
+	If 'sensorPlugins' lists any plugin sections (see DeviceTaskRegistry),
+	the configured sensor tasks replace the default humidity, pressure and
+	temperature tasks.
+	
+	If 'parallelSensorReads' is enabled, sensor reads run on a bounded
+	thread pool, so polling all sensors takes as long as the slowest read
+	rather than the sum of all reads. A read that doesn't complete within
+	'sensorReadTimeoutSecs' (or fails) yields an error-flagged SensorData
+	(status code < 0). A hung sensor isn't read again until its pending
+	read completes, so it can occupy at most one worker.
+	
 	"""
 	
+	# by default, one worker per sensor task (so a hung sensor never delays
+	# another), up to this many workers
+	MAX_DEFAULT_SENSOR_READ_WORKERS = 16
+	
 	def __init__(self):
 		
 		self.configUtil = ConfigUtil()
@@ -48,22 +73,72 @@ class SensorAdapterManager(object):
 			self.configUtil.getProperty( \
 				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.DEVICE_LOCATION_ID_KEY, defaultVal = ConfigConst.NOT_SET)
 			
+		self.reuseSensorData = \
+			self.configUtil.getBoolean( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.REUSE_SENSOR_DATA_KEY)
+			
+		# None (not set) means fresh entropy, i.e. not reproducible
+		self.simSeed = \
+			self.configUtil.getInteger( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.SIM_SEED_KEY, defaultVal = None)
+			
+		self.simDataCachePath = \
+			self.configUtil.getProperty( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.SIM_DATA_CACHE_PATH_KEY)
+			
+		self.compactSimData = \
+			self.configUtil.getBoolean( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.COMPACT_SIM_DATA_KEY)
+			
+		self.useSimTimeIndex = \
+			self.configUtil.getBoolean( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.USE_SIM_TIME_INDEX_KEY)
+			
+		self.parallelSensorReads = \
+			self.configUtil.getBoolean( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.PARALLEL_SENSOR_READS_KEY)
+			
+		self.sensorReadTimeout = \
+			self.configUtil.getFloat( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.SENSOR_READ_TIMEOUT_KEY, defaultVal = ConfigConst.DEFAULT_SENSOR_READ_TIMEOUT)
+			
+		self.maxSensorReadWorkers = \
+			self.configUtil.getInteger( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.MAX_SENSOR_READ_WORKERS_KEY, defaultVal = 0)
+			
 		if self.pollRate <= 0:
 			self.pollRate = ConfigConst.DEFAULT_POLL_CYCLES
 			
-		# technically we only need 1 instance - important to set coalesce
-		# to True and allow for misfire grace period
-		self.scheduler = BackgroundScheduler()
-		self.scheduler.add_job( \
-			self.handleTelemetry, 'interval', seconds = self.pollRate, max_instances = 2, coalesce = True, misfire_grace_time = 15)
+		if self.sensorReadTimeout <= 0:
+			self.sensorReadTimeout = ConfigConst.DEFAULT_SENSOR_READ_TIMEOUT
+			
+		# created on first use, as it's shut down (and re-created) across stop / start
+		self.sensorReadExecutor = None
+		# by adapter - the future of its last submitted read
+		self.pendingSensorReads = {}
+		self.sensorReadLock = threading.Lock()
+		
+		# set by stopManager() - no new executor is created once stopped
+		self.stopped = False
+		
+		# one timer thread for all sensor tasks - missed polls are coalesced
+		self.scheduler = SensorTaskScheduler()
 		
 		self.dataMsgListener = None
 		self.humidityAdapter = None
 		self.pressureAdapter = None
 		self.tempAdapter     = None
+		self.sensorAdapters  = []
+		
+		self.taskRegistry = DeviceTaskRegistry(self.configUtil)
 	
 		# see PIOT-CDA-03-006 description for thoughts on the next line of code
-		self._initEnvironmentalSensorTasks()
+		if self.taskRegistry.hasPlugins(ConfigConst.SENSOR_PLUGINS_KEY):
+			self.sensorAdapters = self.taskRegistry.createTasks(ConfigConst.SENSOR_PLUGINS_KEY)
+		else:
+			self._initEnvironmentalSensorTasks()
+		
+		self._scheduleSensorTasks()
 
 	def _initEnvironmentalSensorTasks(self):
 		humidityFloor   = \
@@ -88,54 +163,118 @@ class SensorAdapterManager(object):
 				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.TEMP_SIM_CEILING_KEY, defaultVal = SensorDataGenerator.HI_NORMAL_INDOOR_TEMP)
 		
 		if not self.useEmulator:
-			self.dataGenerator = SensorDataGenerator()
-			
-			humidityData = \
-				self.dataGenerator.generateDailyEnvironmentHumidityDataSet( \
-					minValue = humidityFloor, maxValue = humidityCeiling, useSeconds = False)
-			pressureData = \
-				self.dataGenerator.generateDailyEnvironmentPressureDataSet( \
-					minValue = pressureFloor, maxValue = pressureCeiling, useSeconds = False)
-			tempData     = \
-				self.dataGenerator.generateDailyIndoorTemperatureDataSet( \
-					minValue = tempFloor, maxValue = tempCeiling, useSeconds = False)
-			
-			self.humidityAdapter = HumiditySensorSimTask(dataSet = humidityData)
-			self.pressureAdapter = PressureSensorSimTask(dataSet = pressureData)
-			self.tempAdapter     = TemperatureSensorSimTask(dataSet = tempData)
+			self.dataGenerator = SensorDataGenerator(seed = self.simSeed)
+			
+			# generate all channels together over one shared time base
+			# floors and ceilings are validated per sensor, as for the generateDaily*DataSet() calls
+			channelSpecs = [ \
+				self.dataGenerator.createEnvironmentHumidityChannelSpec( \
+					name = ConfigConst.HUMIDITY_SENSOR_NAME, minValue = humidityFloor, maxValue = humidityCeiling), \
+				self.dataGenerator.createEnvironmentPressureChannelSpec( \
+					name = ConfigConst.PRESSURE_SENSOR_NAME, minValue = pressureFloor, maxValue = pressureCeiling), \
+				self.dataGenerator.createIndoorTemperatureChannelSpec( \
+					name = ConfigConst.TEMP_SENSOR_NAME, minValue = tempFloor, maxValue = tempCeiling)]
+			
+			# only seeded data sets are cached - see SensorDataSetCache
+			envData = \
+				SensorDataSetCache(self.simDataCachePath).getMultiChannelDataSet( \
+					dataGenerator = self.dataGenerator, channelSpecs = channelSpecs, startHour = 0, endHour = 24, useSeconds = False)
+			
+			if self.compactSimData:
+				envData = envData.toCompact()
+			
+			humidityData = envData.getChannelDataSet(ConfigConst.HUMIDITY_SENSOR_NAME)
+			pressureData = envData.getChannelDataSet(ConfigConst.PRESSURE_SENSOR_NAME)
+			tempData     = envData.getChannelDataSet(ConfigConst.TEMP_SENSOR_NAME)
+			
+			# each task gets its own independent random stream
+			humiditySeed, pressureSeed, tempSeed = self.dataGenerator.spawnSeeds(3)
+			
+			self.humidityAdapter = \
+				HumiditySensorSimTask( \
+					dataSet = humidityData, reuseSensorData = self.reuseSensorData, seed = humiditySeed, useTimeIndex = self.useSimTimeIndex)
+			self.pressureAdapter = \
+				PressureSensorSimTask( \
+					dataSet = pressureData, reuseSensorData = self.reuseSensorData, seed = pressureSeed, useTimeIndex = self.useSimTimeIndex)
+			self.tempAdapter     = \
+				TemperatureSensorSimTask( \
+					dataSet = tempData, reuseSensorData = self.reuseSensorData, seed = tempSeed, useTimeIndex = self.useSimTimeIndex)
 	
 		else:
+			# the emulator modules (and pisense) are only imported here
+			self.humidityAdapter = self.taskRegistry.createTask({ConfigConst.PLUGIN_CLASS_KEY: 'HumiditySensorEmulatorTask'})
+			self.pressureAdapter = self.taskRegistry.createTask({ConfigConst.PLUGIN_CLASS_KEY: 'PressureSensorEmulatorTask'})
+			self.tempAdapter     = self.taskRegistry.createTask({ConfigConst.PLUGIN_CLASS_KEY: 'TemperatureSensorEmulatorTask'})
+		
+		sensorPollKeys = ( \
+			(self.humidityAdapter, ConfigConst.HUMIDITY_POLL_CYCLES_KEY, ConfigConst.HUMIDITY_POLL_PHASE_KEY), \
+			(self.pressureAdapter, ConfigConst.PRESSURE_POLL_CYCLES_KEY, ConfigConst.PRESSURE_POLL_PHASE_KEY), \
+			(self.tempAdapter, ConfigConst.TEMP_POLL_CYCLES_KEY, ConfigConst.TEMP_POLL_PHASE_KEY))
+		
+		for adapter, pollCyclesKey, pollPhaseKey in sensorPollKeys:
+			pollCycleSecs = \
+				self.configUtil.getFloat( \
+					section = ConfigConst.CONSTRAINED_DEVICE, key = pollCyclesKey, defaultVal = self.pollRate)
+			phaseOffsetSecs = \
+				self.configUtil.getFloat( \
+					section = ConfigConst.CONSTRAINED_DEVICE, key = pollPhaseKey, defaultVal = 0.0)
 			
-			heModule = import_module('programmingtheiot.cda.emulated.HumiditySensorEmulatorTask', 'HumiditySensorEmulatorTask')
-			heClazz = getattr(heModule, 'HumiditySensorEmulatorTask')
-			self.humidityAdapter = heClazz()
-			
-			peModule = import_module('programmingtheiot.cda.emulated.PressureSensorEmulatorTask', 'PressureSensorEmulatorTask')
-			peClazz = getattr(peModule, 'PressureSensorEmulatorTask')
-			self.pressureAdapter = peClazz()
+			adapter.setPollCycle(pollCycleSecs = pollCycleSecs, phaseOffsetSecs = phaseOffsetSecs)
+		
+		self.sensorAdapters = [self.humidityAdapter, self.pressureAdapter, self.tempAdapter]
+	
+	def _scheduleSensorTasks(self):
+		# sensors with the same poll cycle and phase offset are polled together, as one batch
+		sensorGroups = {}
+		
+		for adapter in self.sensorAdapters:
+			pollKey = (adapter.getPollCycleSecs() or self.pollRate, adapter.getPhaseOffsetSecs())
+			sensorGroups.setdefault(pollKey, []).append(adapter)
+		
+		for (pollCycleSecs, phaseOffsetSecs), adapters in sensorGroups.items():
+			self.scheduler.addTask( \
+				self.handleSensorTelemetry, periodSecs = pollCycleSecs, phaseOffsetSecs = phaseOffsetSecs, args = (adapters,))
 			
-			teModule = import_module('programmingtheiot.cda.emulated.TemperatureSensorEmulatorTask', 'TemperatureSensorEmulatorTask')
-			teClazz = getattr(teModule, 'TemperatureSensorEmulatorTask')
-			self.tempAdapter = teClazz()
-				
+			logging.info( \
+				"Scheduled sensor tasks: %s | poll cycle = %r secs | phase offset = %r secs", \
+				[adapter.getName() for adapter in adapters], pollCycleSecs, phaseOffsetSecs)
 	
 	def handleTelemetry(self):
-		humidityData = self.humidityAdapter.generateTelemetry()
-		pressureData = self.pressureAdapter.generateTelemetry()
-		tempData     = self.tempAdapter.generateTelemetry()
+		"""
+		Polls all sensor tasks at once, regardless of their poll cycles, and
+		passes the readings to the listener as one batch.
 		
-		humidityData.setLocationID(self.locationID)
-		pressureData.setLocationID(self.locationID)
-		tempData.setLocationID(self.locationID)
+		"""
+		self.handleSensorTelemetry(self.sensorAdapters)
+	
+	def handleSensorTelemetry(self, adapters: list):
+		"""
+		Polls the given sensor tasks, and passes the readings to the listener
+		as one batch (see IDataMessageListener.handleSensorMessages()).
 		
-		logging.debug('Generated humidity data: ' + str(humidityData))
-		logging.debug('Generated pressure data: ' + str(pressureData))
-		logging.debug('Generated temp data: ' + str(tempData))
+		@param adapters The list of sensor tasks (see BaseSensorSimTask).
+		"""
+		if self.parallelSensorReads:
+			# fan out all reads first - they share a single deadline
+			sensorReads = [(adapter, self._submitSensorRead(adapter)) for adapter in adapters]
+			deadline = time.monotonic() + self.sensorReadTimeout
+			
+			sensorDataList = [ \
+				self._getSensorReadResult(adapter, future, max(deadline - time.monotonic(), 0.0)) \
+				for adapter, future in sensorReads]
+		else:
+			sensorDataList = [adapter.generateTelemetry() for adapter in adapters]
+		
+		self._handleSensorData(sensorDataList)
+	
+	def _handleSensorData(self, sensorDataList: list):
+		for sensorData in sensorDataList:
+			sensorData.setLocationID(self.locationID)
+			
+			logging.debug('Generated %s data: %s', sensorData.getName(), str(sensorData))
 		
-		if self.dataMsgListener:
-			self.dataMsgListener.handleSensorMessage(humidityData)
-			self.dataMsgListener.handleSensorMessage(pressureData)
-			self.dataMsgListener.handleSensorMessage(tempData)
+		if self.dataMsgListener and sensorDataList:
+			self.dataMsgListener.handleSensorMessages(sensorDataList)
 		
 	def setDataMessageListener(self, listener: IDataMessageListener) -> bool:
 		if listener:
@@ -143,9 +282,11 @@ class SensorAdapterManager(object):
 	
 	def startManager(self) -> bool:
 		logging.info("Started SensorAdapterManager.")
+		
+		with self.sensorReadLock:
+			self.stopped = False
 	
-		if not self.scheduler.running:
-			self.scheduler.start()
+		if self.scheduler.start():
 			return True
 		else:
 			logging.info("SensorAdapterManager scheduler already started. Ignoring.")
@@ -153,10 +294,67 @@ class SensorAdapterManager(object):
 		
 	def stopManager(self) -> bool:
 		logging.info("Stopped SensorAdapterManager.")
-	
-		try:
-			self.scheduler.shutdown()
+		
+		# stop polling first (waiting for a running poll), so no poll submits reads after the shutdown
+		schedulerStopped = self.scheduler.stop()
+		
+		with self.sensorReadLock:
+			self.stopped = True
+			
+			if self.sensorReadExecutor:
+				# don't wait for hung reads
+				self.sensorReadExecutor.shutdown(wait = False, cancel_futures = True)
+				self.sensorReadExecutor = None
+		
+		if schedulerStopped:
 			return True
-		except:
+		else:
 			logging.info("SensorAdapterManager scheduler already stopped. Ignoring.")
 			return False
+	
+	def _submitSensorRead(self, adapter):
+		with self.sensorReadLock:
+			if self.stopped:
+				return None
+			
+			future = self.pendingSensorReads.get(adapter)
+			
+			if future and not future.done():
+				# still waiting on the last read - don't tie up another worker
+				return None
+			
+			if not self.sensorReadExecutor:
+				maxWorkers = \
+					self.maxSensorReadWorkers if self.maxSensorReadWorkers > 0 else \
+						max(min(len(self.sensorAdapters), self.MAX_DEFAULT_SENSOR_READ_WORKERS), 1)
+				
+				self.sensorReadExecutor = ThreadPoolExecutor(max_workers = maxWorkers, thread_name_prefix = 'SensorRead')
+			
+			future = self.sensorReadExecutor.submit(adapter.generateTelemetry)
+			self.pendingSensorReads[adapter] = future
+			
+			return future
+	
+	def _getSensorReadResult(self, adapter, future, timeout: float) -> SensorData:
+		if not future:
+			if self.stopped:
+				logging.warning("SensorAdapterManager stopped. Skipping sensor read: %s", adapter.getName())
+				return self._createSensorReadError(adapter, ConfigConst.SENSOR_READ_FAILED_STATUS)
+			
+			logging.warning("Sensor read still pending. Skipping: %s", adapter.getName())
+			return self._createSensorReadError(adapter, ConfigConst.SENSOR_READ_TIMEOUT_STATUS)
+		
+		try:
+			return future.result(timeout = timeout)
+		except FutureTimeoutError:
+			logging.warning("Sensor read timed out after %.3f secs: %s", timeout, adapter.getName())
+			return self._createSensorReadError(adapter, ConfigConst.SENSOR_READ_TIMEOUT_STATUS)
+		except Exception as e:
+			logging.warning("Sensor read failed: %s - %s", adapter.getName(), e)
+			return self._createSensorReadError(adapter, ConfigConst.SENSOR_READ_FAILED_STATUS)
+	
+	def _createSensorReadError(self, adapter, statusCode: int) -> SensorData:
+		sensorData = SensorData(typeID = adapter.getTypeID(), name = adapter.getName())
+		sensorData.setStatusCode(statusCode)
+		
+		return sensorData
@@ -0,0 +1,178 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# You may find it more helpful to your design to adjust the
+# functionality, constants and interfaces (if there are any)
+# provided within in order to meet the needs of your specific
+# Programming the Internet of Things project.
+#
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+class SensorTaskScheduler():
+	"""
+	Multi-rate scheduler for periodic (sensor) tasks, run from a single
+	timer thread.
+
+	Each task has its own period and phase offset (the delay of its first
+	run after start()). Pending runs are kept in a min-heap ordered by
+	their next run time, so the timer thread only ever waits for - and
+	runs - the earliest due task, regardless of the number of tasks.
+
+	Next run times are derived from the previous scheduled run time rather
+	than from the time a task completed, so periods don't drift. If a task
+	falls behind by one or more periods, the missed runs are coalesced into
+	a single run (as with APScheduler's 'coalesce' option).
+
+	Tasks run one at a time on the timer thread, so a slow task delays any
+	other task that comes due while it runs.
+
+	"""
+
+	def __init__(self, name: str = 'SensorTaskScheduler'):
+		"""
+		Constructor.
+
+		@param name The name of the timer thread.
+		"""
+		self.name = name
+
+		self.tasks = []
+		self.taskHeap = []
+		self.taskSeqNos = itertools.count()
+
+		self.condition = threading.Condition()
+		self.timerThread = None
+		self.running = False
+
+	def addTask(self, callback, periodSecs: float, phaseOffsetSecs: float = 0.0, args: tuple = ()):
+		"""
+		Adds a periodic task. Can be called before or after start().
+
+		@param callback The callable to run.
+		@param periodSecs The period in seconds. Must be greater than 0.
+		@param phaseOffsetSecs The delay of the first run in seconds, relative to
+		start() - or to now, if already started.
+		@param args The optional positional args to pass to the callback.
+		"""
+		if periodSecs <= 0:
+			raise ValueError("Task period must be greater than 0: %r" % periodSecs)
+
+		task = (callback, float(periodSecs), max(float(phaseOffsetSecs), 0.0), tuple(args))
+
+		with self.condition:
+			self.tasks.append(task)
+
+			if self.running:
+				self._pushTask(task, time.monotonic() + task[2])
+				self.condition.notify()
+
+	def getTaskCount(self) -> int:
+		"""
+		Returns the number of tasks added.
+
+		@return int
+		"""
+		return len(self.tasks)
+
+	def isRunning(self) -> bool:
+		"""
+		Returns True if the timer thread is running.
+
+		@return bool
+		"""
+		return self.running
+
+	def start(self) -> bool:
+		"""
+		Starts the timer thread. The first run of each task is scheduled at
+		its phase offset from now.
+
+		@return bool True if started, False if already running.
+		"""
+		with self.condition:
+			if self.running:
+				return False
+
+			startTime = time.monotonic()
+
+			self.taskHeap = []
+
+			for task in self.tasks:
+				self._pushTask(task, startTime + task[2])
+
+			self.running = True
+
+		self.timerThread = threading.Thread(target = self._runTasks, name = self.name, daemon = True)
+		self.timerThread.start()
+
+		return True
+
+	def stop(self, timeout: float = None) -> bool:
+		"""
+		Stops the timer thread, waiting for a task that's currently running
+		to complete.
+
+		@param timeout The optional max time to wait, in seconds.
+		@return bool True if stopped, False if not running.
+		"""
+		with self.condition:
+			if not self.running:
+				return False
+
+			self.running = False
+			self.condition.notify()
+
+		if self.timerThread is not threading.current_thread():
+			self.timerThread.join(timeout)
+
+		return True
+
+	def _pushTask(self, task: tuple, nextRunTime: float):
+		# the sequence number keeps ties in run order and never compares the tasks
+		heapq.heappush(self.taskHeap, (nextRunTime, next(self.taskSeqNos), task))
+
+	def _runTasks(self):
+		while True:
+			with self.condition:
+				task = None
+
+				while self.running and task is None:
+					if not self.taskHeap:
+						self.condition.wait()
+						continue
+
+					nextRunTime = self.taskHeap[0][0]
+					now = time.monotonic()
+
+					if nextRunTime > now:
+						self.condition.wait(nextRunTime - now)
+						continue
+
+					task = heapq.heappop(self.taskHeap)[2]
+					periodSecs = task[1]
+
+					nextRunTime += periodSecs
+
+					if nextRunTime <= now:
+						# behind by one or more periods - skip (coalesce) the missed runs
+						nextRunTime += (int((now - nextRunTime) / periodSecs) + 1) * periodSecs
+
+					self._pushTask(task, nextRunTime)
+
+				if not self.running:
+					return
+
+			callback, periodSecs, phaseOffsetSecs, args = task
+
+			try:
+				callback(*args)
+			except Exception:
+				logging.exception("Scheduled task failed: %r", callback)
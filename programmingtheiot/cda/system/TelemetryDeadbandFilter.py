@@ -0,0 +1,175 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# You may find it more helpful to your design to adjust the
+# functionality, constants and interfaces (if there are any)
+# provided within in order to meet the needs of your specific
+# Programming the Internet of Things project.
+#
+
+import logging
+import threading
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.ConfigUtil import ConfigUtil
+from programmingtheiot.data.SensorData import SensorData
+
+class TelemetryDeadbandFilter():
+	"""
+	Change-of-value (deadband) filter for sensor readings, tracked per
+	sensor name.
+
+	A reading is forwarded if it's the first reading of its sensor, if its
+	value differs from the last forwarded value by more than the absolute
+	deadband ('deadbandAbs') or by more than the relative deadband
+	('deadbandPct', in percent of the last forwarded value), or if the
+	max silence interval ('maxSilenceSecs') since the last forwarded reading
+	has expired (a heartbeat). With both deadbands at 0, any change of value
+	is forwarded. Readings with an error flag or a changed status code are
+	always forwarded.
+
+	The defaults are read from the ConstrainedDevice section, and can be
+	overridden per sensor in a 'Deadband.<sensor name>' section, e.g.:
+
+		[Deadband.TempSensor]
+		deadbandAbs    = 0.2
+		maxSilenceSecs = 300
+
+	The silence interval is measured using the readings' time stamps.
+
+	"""
+
+	NS_IN_SECS = 1000000000
+
+	def __init__(self, configUtil: ConfigUtil = None):
+		"""
+		Constructor.
+
+		@param configUtil The config to read the deadbands from. Defaults to
+		the ConfigUtil instance.
+		"""
+		self.configUtil = configUtil if configUtil else ConfigUtil()
+
+		self.defaultDeadband = self._getDeadband(ConfigConst.CONSTRAINED_DEVICE, (0.0, 0.0, 0.0))
+
+		# by sensor name: (deadbandAbs, deadbandPct, maxSilenceNs)
+		self.deadbands = {}
+
+		# by sensor name: (value, status code, time stamp ns) of the last forwarded reading
+		self.lastForwarded = {}
+
+		self.receivedCount = 0
+		self.forwardedCount = 0
+
+		self.lock = threading.Lock()
+
+	def setDeadband(self, name: str, deadbandAbs: float = 0.0, deadbandPct: float = 0.0, maxSilenceSecs: float = 0.0):
+		"""
+		Sets the deadband for a sensor, overriding the config.
+
+		@param name The sensor name.
+		@param deadbandAbs The absolute deadband. 0 disables it.
+		@param deadbandPct The relative deadband, in percent. 0 disables it.
+		@param maxSilenceSecs The max time between forwarded readings. 0 disables it.
+		"""
+		with self.lock:
+			self.deadbands[name] = self._toDeadband(deadbandAbs, deadbandPct, maxSilenceSecs)
+
+	def isForwarded(self, data: SensorData) -> bool:
+		"""
+		Returns True if 'data' should be forwarded, and if so, records it as
+		the last forwarded reading of its sensor.
+
+		@param data The SensorData reading.
+		@return bool
+		"""
+		name = data.getName()
+		value = data.getValue()
+		statusCode = data.getStatusCode()
+		timeStampNs = data.getTimeStampNs()
+
+		with self.lock:
+			self.receivedCount += 1
+
+			deadband = self.deadbands.get(name)
+
+			if deadband is None:
+				deadband = self._getDeadband(ConfigConst.DEADBAND_SECTION_PREFIX + name, self.defaultDeadband)
+				self.deadbands[name] = deadband
+
+				logging.info( \
+					"Deadband for %s: abs = %r | pct = %r | max silence = %r secs", \
+					name, deadband[0], deadband[1], deadband[2] / self.NS_IN_SECS)
+
+			lastForwarded = self.lastForwarded.get(name)
+
+			if lastForwarded and not data.hasErrorFlag() and not self._isOutsideDeadband(deadband, lastForwarded, value, statusCode, timeStampNs):
+				return False
+
+			self.lastForwarded[name] = (value, statusCode, timeStampNs)
+			self.forwardedCount += 1
+
+			return True
+
+	def filterSensorData(self, dataList: list) -> list:
+		"""
+		Returns the readings of 'dataList' that should be forwarded (see isForwarded()).
+
+		@param dataList The list of SensorData readings.
+		@return list The readings to forward, in order.
+		"""
+		return [data for data in dataList if self.isForwarded(data)]
+
+	def getStats(self) -> dict:
+		"""
+		Returns the number of readings received and forwarded.
+
+		@return dict The 'received' and 'forwarded' counts.
+		"""
+		return {'received': self.receivedCount, 'forwarded': self.forwardedCount}
+
+	def reset(self):
+		"""
+		Clears the last forwarded readings and the stats, so the next reading
+		of each sensor is forwarded.
+
+		"""
+		with self.lock:
+			self.lastForwarded.clear()
+			self.receivedCount = 0
+			self.forwardedCount = 0
+
+	def _isOutsideDeadband(self, deadband: tuple, lastForwarded: tuple, value: float, statusCode: int, timeStampNs: int) -> bool:
+		deadbandAbs, deadbandPct, maxSilenceNs = deadband
+		lastValue, lastStatusCode, lastTimeStampNs = lastForwarded
+
+		if statusCode != lastStatusCode:
+			return True
+
+		if maxSilenceNs > 0 and timeStampNs - lastTimeStampNs >= maxSilenceNs:
+			return True
+
+		delta = abs(value - lastValue)
+
+		if deadbandAbs <= 0 and deadbandPct <= 0:
+			return delta > 0
+
+		if deadbandAbs > 0 and delta > deadbandAbs:
+			return True
+
+		return deadbandPct > 0 and delta > abs(lastValue) * deadbandPct / 100.0
+
+	def _getDeadband(self, section: str, defaultDeadband: tuple) -> tuple:
+		defaultAbs, defaultPct, defaultSilenceNs = defaultDeadband
+
+		return self._toDeadband( \
+			self.configUtil.getFloat(section = section, key = ConfigConst.DEADBAND_ABS_KEY, defaultVal = defaultAbs), \
+			self.configUtil.getFloat(section = section, key = ConfigConst.DEADBAND_PCT_KEY, defaultVal = defaultPct), \
+			self.configUtil.getFloat(section = section, key = ConfigConst.MAX_SILENCE_KEY, defaultVal = defaultSilenceNs / self.NS_IN_SECS))
+
+	def _toDeadband(self, deadbandAbs: float, deadbandPct: float, maxSilenceSecs: float) -> tuple:
+		return (max(deadbandAbs or 0.0, 0.0), max(deadbandPct or 0.0, 0.0), int(max(maxSilenceSecs or 0.0, 0.0) * self.NS_IN_SECS))
@@ -30,7 +30,10 @@ DEFAULT_POLL_CYCLES      = 60
 DEFAULT_VAL              = 0.0
 DEFAULT_COMMAND          = 0
 DEFAULT_STATUS           = 0
+SENSOR_READ_TIMEOUT_STATUS = -1
+SENSOR_READ_FAILED_STATUS  = -2
 DEFAULT_TIMEOUT          = 5
+DEFAULT_SENSOR_READ_TIMEOUT = 2.0
 DEFAULT_TTL              = 300
 DEFAULT_QOS              = 0
 
@@ -86,6 +89,8 @@ STATE_DATA_PROP  = 'stateData'
 VALUE_PROP       = 'value'
 IS_RESPONSE_PROP = 'isResponse'
 
+DATA_LIST_PROP   = 'dataList'
+
 CPU_UTIL_PROP    = 'cpuUtil'
 DISK_UTIL_PROP   = 'diskUtil'
 MEM_UTIL_PROP    = 'memUtil'
@@ -113,6 +118,7 @@ MGMT_STATUS_MSG   = 'MgmtStatusMsg'
 MGMT_STATUS_CMD   = 'MgmtStatusCmd'
 MEDIA_MSG         = 'MediaMsg'
 SENSOR_MSG        = 'SensorMsg'
+SENSOR_BATCH_MSG  = 'SensorBatchMsg'
 SYSTEM_PERF_MSG   = 'SystemPerfMsg'
 
 UPDATE_NOTIFICATIONS_MSG      = 'UpdateMsg'
@@ -186,6 +192,7 @@ CDA_MGMT_CMD_MSG_RESOURCE             = PRODUCT_NAME + '/' + CONSTRAINED_DEVICE
 CDA_MEDIA_DATA_MSG_RESOURCE           = PRODUCT_NAME + '/' + CONSTRAINED_DEVICE + '/' + MEDIA_MSG
 CDA_REGISTRATION_REQUEST_RESOURCE     = PRODUCT_NAME + '/' + CONSTRAINED_DEVICE + '/' + RESOURCE_REGISTRATION_REQUEST
 CDA_SENSOR_DATA_MSG_RESOURCE          = PRODUCT_NAME + '/' + CONSTRAINED_DEVICE + '/' + SENSOR_MSG
+CDA_SENSOR_BATCH_MSG_RESOURCE         = PRODUCT_NAME + '/' + CONSTRAINED_DEVICE + '/' + SENSOR_BATCH_MSG
 CDA_SYSTEM_PERF_MSG_RESOURCE          = PRODUCT_NAME + '/' + CONSTRAINED_DEVICE + '/' + SYSTEM_PERF_MSG
 
 #####
@@ -214,6 +221,9 @@ SMTP    = 'Smtp'
 
 DEVICE_ID_KEY          = 'deviceID'
 DEVICE_LOCATION_ID_KEY = 'deviceLocationID'
+DEVICE_LATITUDE_KEY    = 'deviceLatitude'
+DEVICE_LONGITUDE_KEY   = 'deviceLongitude'
+DEVICE_ELEVATION_KEY   = 'deviceElevation'
 
 CLOUD_GATEWAY_SERVICE = CLOUD   + '.' + GATEWAY_SERVICE
 COAP_GATEWAY_SERVICE  = COAP    + '.' + GATEWAY_SERVICE
@@ -263,6 +273,10 @@ ENABLE_MQTT_CLIENT_KEY = 'enableMqttClient'
 ENABLE_COAP_CLIENT_KEY = 'enableCoapClient'
 ENABLE_COAP_SERVER_KEY = 'enableCoapServer'
 
+PAYLOAD_FORMAT_KEY     = 'payloadFormat'
+JSON_PAYLOAD_FORMAT    = 'json'
+BINARY_PAYLOAD_FORMAT  = 'binary'
+
 ENABLE_SYSTEM_PERF_KEY = 'enableSystemPerformance'
 ENABLE_SENSING_KEY     = 'enableSensing'
 
@@ -273,6 +287,38 @@ PRESSURE_SIM_CEILING_KEY = 'pressureSimCeiling'
 TEMP_SIM_FLOOR_KEY       = 'tempSimFloor'
 TEMP_SIM_CEILING_KEY     = 'tempSimCeiling'
 
+REUSE_SENSOR_DATA_KEY    = 'reuseSensorData'
+SIM_SEED_KEY             = 'simSeed'
+SIM_DATA_CACHE_PATH_KEY  = 'simDataCachePath'
+COMPACT_SIM_DATA_KEY     = 'compactSimData'
+USE_SIM_TIME_INDEX_KEY   = 'useSimTimeIndex'
+
+HUMIDITY_POLL_CYCLES_KEY = 'humidityPollCycleSecs'
+HUMIDITY_POLL_PHASE_KEY  = 'humidityPollPhaseSecs'
+PRESSURE_POLL_CYCLES_KEY = 'pressurePollCycleSecs'
+PRESSURE_POLL_PHASE_KEY  = 'pressurePollPhaseSecs'
+TEMP_POLL_CYCLES_KEY     = 'tempPollCycleSecs'
+TEMP_POLL_PHASE_KEY      = 'tempPollPhaseSecs'
+
+PARALLEL_SENSOR_READS_KEY   = 'parallelSensorReads'
+SENSOR_READ_TIMEOUT_KEY     = 'sensorReadTimeoutSecs'
+MAX_SENSOR_READ_WORKERS_KEY = 'maxSensorReadWorkers'
+
+ENABLE_BATCH_UPSTREAM_KEY = 'enableBatchUpstream'
+
+POLL_PHASE_KEY       = 'pollPhaseSecs'
+SENSOR_PLUGINS_KEY   = 'sensorPlugins'
+ACTUATOR_PLUGINS_KEY = 'actuatorPlugins'
+PLUGIN_CLASS_KEY     = 'class'
+PLUGIN_NAME_KEY      = 'name'
+PLUGIN_TYPE_ID_KEY   = 'typeID'
+
+ENABLE_DEADBAND_FILTER_KEY = 'enableDeadbandFilter'
+DEADBAND_SECTION_PREFIX    = 'Deadband.'
+DEADBAND_ABS_KEY           = 'deadbandAbs'
+DEADBAND_PCT_KEY           = 'deadbandPct'
+MAX_SILENCE_KEY            = 'maxSilenceSecs'
+
 HANDLE_TEMP_CHANGE_ON_DEVICE_KEY = 'handleTempChangeOnDevice'
 TRIGGER_HVAC_TEMP_FLOOR_KEY   = 'triggerHvacTempFloor'
 TRIGGER_HVAC_TEMP_CEILING_KEY = 'triggerHvacTempCeiling'
@@ -148,6 +148,22 @@ class ConfigUtil(metaclass = Singleton):
 		"""
 		return self._getConfig(forceReload).getfloat(section, key, fallback = defaultVal)
 	
+	def getSectionProperties(self, section: str, forceReload: bool = False) -> dict:
+		"""
+		Attempts to retrieve all key / value pairs of 'section' from the config.
+		Note that keys are lower-cased by the config parser.
+		
+		@param section The name of the section to parse.
+		@param forceReload Defaults to false; if true will reload the config.
+		@return dict The (string) values by key, or an empty dict if 'section' doesn't exist.
+		"""
+		config = self._getConfig(forceReload)
+		
+		if not config.has_section(section):
+			return {}
+		
+		return dict(config.items(section))
+	
 	def hasProperty(self, section: str, key: str) -> bool:
 		"""
 		Checks if a given 'key' exists in the named section of the loaded config.
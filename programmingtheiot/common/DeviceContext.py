@@ -0,0 +1,127 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# You may find it more helpful to your design to adjust the
+# functionality, constants and interfaces (if there are any)
+# provided within in order to meet the needs of your specific
+# Programming the Internet of Things project.
+#
+
+import logging
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.ConfigUtil import ConfigUtil
+
+class DeviceContext():
+	"""
+	Immutable holder for the identity of the device generating data:
+	its location ID, latitude, longitude and elevation.
+
+	A single process-wide instance is resolved from the configuration
+	file on first use and cached, so data containers (e.g. SensorData)
+	can read their defaults without a ConfigUtil lookup per object.
+
+	To simulate multiple devices, either replace the process-wide
+	context via setCurrent(), or pass a DeviceContext directly to the
+	data container's constructor.
+
+	"""
+
+	__slots__ = ('locationID', 'latitude', 'longitude', 'elevation')
+
+	_current = None
+
+	def __init__( \
+		self, \
+		locationID: str = ConfigConst.NOT_SET, \
+		latitude: float = ConfigConst.DEFAULT_LAT, \
+		longitude: float = ConfigConst.DEFAULT_LON, \
+		elevation: float = ConfigConst.DEFAULT_ELEVATION):
+		"""
+		Constructor.
+
+		@param locationID The device location ID.
+		@param latitude The device latitude.
+		@param longitude The device longitude.
+		@param elevation The device elevation.
+		"""
+		object.__setattr__(self, 'locationID', locationID)
+		object.__setattr__(self, 'latitude', latitude)
+		object.__setattr__(self, 'longitude', longitude)
+		object.__setattr__(self, 'elevation', elevation)
+
+	@classmethod
+	def fromConfig(cls):
+		"""
+		Creates a new DeviceContext using the values stored in the
+		ConstrainedDevice section of the configuration file.
+
+		@return DeviceContext The context resolved from configuration.
+		"""
+		configUtil = ConfigUtil()
+
+		return cls( \
+			locationID = configUtil.getProperty(ConfigConst.CONSTRAINED_DEVICE, ConfigConst.DEVICE_LOCATION_ID_KEY), \
+			latitude   = configUtil.getFloat(ConfigConst.CONSTRAINED_DEVICE, ConfigConst.DEVICE_LATITUDE_KEY, defaultVal = ConfigConst.DEFAULT_LAT), \
+			longitude  = configUtil.getFloat(ConfigConst.CONSTRAINED_DEVICE, ConfigConst.DEVICE_LONGITUDE_KEY, defaultVal = ConfigConst.DEFAULT_LON), \
+			elevation  = configUtil.getFloat(ConfigConst.CONSTRAINED_DEVICE, ConfigConst.DEVICE_ELEVATION_KEY, defaultVal = ConfigConst.DEFAULT_ELEVATION))
+
+	@classmethod
+	def getCurrent(cls):
+		"""
+		Returns the process-wide DeviceContext. If none has been set, it
+		will be resolved from the configuration file once and cached.
+
+		@return DeviceContext The current process-wide context.
+		"""
+		ctx = cls._current
+
+		if ctx is None:
+			ctx = cls.fromConfig()
+			DeviceContext._current = ctx
+
+			logging.info("Resolved device context: %s", str(ctx))
+
+		return ctx
+
+	@classmethod
+	def setCurrent(cls, ctx = None):
+		"""
+		Sets the process-wide DeviceContext. Passing None clears the
+		cached context, which will be re-resolved from the configuration
+		file on the next call to getCurrent().
+
+		@param ctx The DeviceContext to use, or None to reset.
+		"""
+		DeviceContext._current = ctx
+
+	def getElevation(self) -> float:
+		return self.elevation
+
+	def getLatitude(self) -> float:
+		return self.latitude
+
+	def getLocationID(self) -> str:
+		return self.locationID
+
+	def getLongitude(self) -> float:
+		return self.longitude
+
+	def __setattr__(self, name, value):
+		raise AttributeError("DeviceContext is immutable. Create a new instance instead.")
+
+	def __str__(self):
+		"""
+		Returns a string representation of this instance.
+
+		@return The string representing this instance, returned in CSV 'key=value' format.
+		"""
+		return '{}={},{}={},{}={},{}={}'.format(
+			ConfigConst.LOCATION_ID_PROP, self.locationID,
+			ConfigConst.LATITUDE_PROP, self.latitude,
+			ConfigConst.LONGITUDE_PROP, self.longitude,
+			ConfigConst.ELEVATION_PROP, self.elevation)
@@ -87,6 +87,25 @@ class IDataMessageListener():
 		"""
 		pass
 	
+	def handleSensorMessages(self, dataList: list) -> bool:
+		"""
+		Callback function to handle a batch of sensor messages (e.g. all readings
+		of one poll cycle) packaged as a list of SensorData objects.
+		
+		The default implementation passes each item to handleSensorMessage().
+		Implementations can override this to process the whole batch at once.
+		
+		@param dataList The list of SensorData messages received.
+		@return bool True on success (for all items); False otherwise.
+		"""
+		success = True
+		
+		for data in dataList or []:
+			if not self.handleSensorMessage(data):
+				success = False
+		
+		return success
+	
 	def handleSystemPerformanceMessage(self, data: SystemPerformanceData) -> bool:
 		"""
 		Callback function to handle a system performance message packaged as
@@ -46,6 +46,7 @@ class ResourceNameEnum(Enum):
 	
 	"""
 	CDA_SENSOR_MSG_RESOURCE           = ConfigConst.CDA_SENSOR_DATA_MSG_RESOURCE
+	CDA_SENSOR_BATCH_MSG_RESOURCE     = ConfigConst.CDA_SENSOR_BATCH_MSG_RESOURCE
 	CDA_ACTUATOR_CMD_RESOURCE    	  = ConfigConst.CDA_ACTUATOR_CMD_MSG_RESOURCE
 	CDA_ACTUATOR_RESPONSE_RESOURCE    = ConfigConst.CDA_ACTUATOR_RESPONSE_MSG_RESOURCE
 	CDA_MGMT_STATUS_MSG_RESOURCE	  = ConfigConst.CDA_MGMT_STATUS_MSG_RESOURCE
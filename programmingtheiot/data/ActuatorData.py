@@ -19,9 +19,11 @@ class ActuatorData(BaseIotData):
 	Shell representation of class for student implementation.
 	
 	"""
+	
+	__slots__ = (ConfigConst.VALUE_PROP, ConfigConst.COMMAND_PROP, ConfigConst.STATE_DATA_PROP, ConfigConst.IS_RESPONSE_PROP)
 
-	def __init__(self, typeID: int = ConfigConst.DEFAULT_ACTUATOR_TYPE, name = ConfigConst.NOT_SET, d = None):
-		super(ActuatorData, self).__init__(name = name, typeID = typeID, d = d)
+	def __init__(self, typeID: int = ConfigConst.DEFAULT_ACTUATOR_TYPE, name = ConfigConst.NOT_SET, d = None, context = None):
+		super(ActuatorData, self).__init__(name = name, typeID = typeID, d = d, context = context)
 		self.value = ConfigConst.DEFAULT_VAL
 		self.command = ConfigConst.DEFAULT_COMMAND
 		self.stateData = ""
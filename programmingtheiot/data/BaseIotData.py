@@ -7,11 +7,14 @@
 # Copyright (c) 2020 - 2025 by Andrew D. King
 # 
 
+import logging
+import time
+
 from datetime import datetime, timezone
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 
-from programmingtheiot.common.ConfigUtil import ConfigUtil
+from programmingtheiot.common.DeviceContext import DeviceContext
 
 class BaseIotData(object):
 	"""
@@ -21,20 +24,46 @@ class BaseIotData(object):
 	
 	Sub-classes add parameters and accessors specific to their needs.
 	
+	NOTE: All data containers use __slots__ to avoid a per-instance __dict__,
+	so sub-classes must declare their own __slots__ for any new properties.
+	Use toDict() (rather than vars() or __dict__) to retrieve the property
+	names and values of an instance.
+	
+	The time stamp is stored as integer nanoseconds since Epoch, and is
+	only rendered as an ISO 8601 string when requested (e.g. via
+	getTimeStamp(), __str__, or JSON encoding). The rendered string is
+	cached until the time stamp changes.
+	
 	"""
+	
+	EPOCH = datetime(1970, 1, 1, tzinfo = timezone.utc)
+	NS_IN_SECS = 1000000000
+	
+	# order matches the JSON property order used by the GDA; the time
+	# stamp is exposed as the 'timeStamp' property (see getPropertyNames())
+	__slots__ = ( \
+		'_timeStampNs', '_timeStampStr', ConfigConst.HAS_ERROR_PROP, ConfigConst.NAME_PROP, \
+		ConfigConst.TYPE_ID_PROP, ConfigConst.STATUS_CODE_PROP, ConfigConst.LATITUDE_PROP, \
+		ConfigConst.LONGITUDE_PROP, ConfigConst.ELEVATION_PROP, ConfigConst.LOCATION_ID_PROP)
 
-	def __init__(self, name = ConfigConst.NOT_SET, typeID = ConfigConst.DEFAULT_TYPE_ID, d = None):
+	def __init__(self, name = ConfigConst.NOT_SET, typeID = ConfigConst.DEFAULT_TYPE_ID, d = None, context: DeviceContext = None):
 		"""
 		Constructor.
 		
 		@param d Defaults to None. The data (dict) to use for setting all parameters.
 		It's provided here as a convenience - mostly for testing purposes. The utility
 		in DataUtil should be used instead.
+		@param context Defaults to None. The DeviceContext providing the location ID,
+		latitude, longitude and elevation defaults. If None, the process-wide
+		context will be used (see DeviceContext.getCurrent()).
 		"""
 			
 		self.updateTimeStamp()
 		self.hasError = False
 		
+		if context is None:
+			context = DeviceContext.getCurrent()
+		
 		useDefaults = True
 		
 		if d:
@@ -54,15 +83,15 @@ class BaseIotData(object):
 			self.name       = name
 			self.typeID     = typeID
 			self.statusCode = ConfigConst.DEFAULT_STATUS
-			self.latitude   = ConfigConst.DEFAULT_LAT
-			self.longitude  = ConfigConst.DEFAULT_LON
-			self.elevation  = ConfigConst.DEFAULT_ELEVATION
+			self.latitude   = context.latitude
+			self.longitude  = context.longitude
+			self.elevation  = context.elevation
 		
 		if not self.name:
 			self.name = ConfigConst.NOT_SET
 			
-		# always pull location ID from configuration file
-		self.locationID = ConfigUtil().getProperty(ConfigConst.CONSTRAINED_DEVICE, ConfigConst.DEVICE_LOCATION_ID_KEY)
+		# always pull location ID from the device context (resolved once from configuration)
+		self.locationID = context.locationID
 		
 	def getElevation(self) -> float:
 		"""
@@ -117,9 +146,30 @@ class BaseIotData(object):
 		Returns the time stamp in ISO 8601 format, as follows:
 		%Y%m%dT%H:%M:%S%z
 		
+		The string is rendered on first request and cached until the
+		time stamp is next updated.
+		
 		@return The time stamp as a string.
 		"""
-		return self.timeStamp
+		tsStr = self._timeStampStr
+		
+		if tsStr is None:
+			secs, nanos = divmod(self._timeStampNs, self.NS_IN_SECS)
+			tsStr = datetime.fromtimestamp(secs, timezone.utc).replace(microsecond = nanos // 1000).isoformat()
+			
+			self._timeStampStr = tsStr
+		
+		return tsStr
+	
+	def getTimeStampNs(self) -> int:
+		"""
+		Returns the time stamp as integer nanoseconds since Epoch (UTC).
+		Use this for latency and interval calculations instead of
+		parsing the string returned by getTimeStamp().
+		
+		@return The time stamp as an integer.
+		"""
+		return self._timeStampNs
 	
 	def getTypeID(self) -> int:
 		"""
@@ -130,6 +180,30 @@ class BaseIotData(object):
 		"""
 		return self.typeID
 	
+	@classmethod
+	def getPropertyNames(cls) -> tuple:
+		"""
+		Returns the names of all data properties declared via __slots__
+		for this class and its parent classes, in declaration order. The
+		result is computed once per class and cached.
+		
+		@return The tuple of property names.
+		"""
+		propNames = cls.__dict__.get('_propertyNames')
+		
+		if propNames is None:
+			names = [ConfigConst.TIMESTAMP_PROP]
+			
+			for clazz in reversed(cls.__mro__):
+				for name in clazz.__dict__.get('__slots__', ()):
+					if not name.startswith('_') and name not in names:
+						names.append(name)
+			
+			propNames = tuple(names)
+			cls._propertyNames = propNames
+		
+		return propNames
+	
 	def hasErrorFlag(self):
 		"""
 		Returns the boolean flag indicating if an error is present.
@@ -193,6 +267,38 @@ class BaseIotData(object):
 		if val < 0:
 			self.hasError = True
 			
+	def setTimeStamp(self, timeStamp: str):
+		"""
+		Sets the time stamp using an ISO 8601 string, such as one
+		received from the GDA. If the string has no UTC offset, it's
+		assumed to be in UTC. If invalid, no action is taken.
+		
+		@param timeStamp The time stamp as a string.
+		"""
+		try:
+			dt = datetime.fromisoformat(timeStamp)
+			
+			if dt.tzinfo is None:
+				dt = dt.replace(tzinfo = timezone.utc)
+			
+			delta = dt - self.EPOCH
+			
+			self._timeStampNs  = (delta.days * 86400 + delta.seconds) * self.NS_IN_SECS + delta.microseconds * 1000
+			self._timeStampStr = timeStamp
+		except (TypeError, ValueError):
+			logging.warning("Invalid time stamp. Ignoring: %s", timeStamp)
+	
+	def setTimeStampNs(self, timeStampNs: int):
+		"""
+		Sets the time stamp using integer nanoseconds since Epoch (UTC).
+		
+		@param timeStampNs The time stamp as an integer.
+		"""
+		self._timeStampNs  = timeStampNs
+		self._timeStampStr = None
+	
+	timeStamp = property(getTimeStamp, setTimeStamp)
+	
 	def setTypeID(self, val: int):
 		"""
 		Sets the type ID value.
@@ -201,6 +307,50 @@ class BaseIotData(object):
 		"""
 		self.typeID = val
 	
+	def toDict(self) -> dict:
+		"""
+		Returns a dict containing the name and value of each data property
+		of this instance. This replaces vars(obj) and obj.__dict__, which
+		aren't available for slotted instances.
+		
+		@return The dict of property names and values.
+		"""
+		propDict = {name: getattr(self, name) for name in self.getPropertyNames()}
+		
+		# sub-classes that don't declare __slots__ will still have a __dict__
+		instDict = getattr(self, '__dict__', None)
+		
+		if instDict:
+			propDict.update(instDict)
+		
+		return propDict
+	
+	def copy(self):
+		"""
+		Returns a new instance of the same class with the same property
+		values as this instance, including the time stamp. Use this to
+		retain a reading whose producer may reuse the instance (see
+		BaseSensorSimTask).
+		
+		@return A new instance of this instance's class.
+		"""
+		clazz = type(self)
+		obj = clazz.__new__(clazz)
+		
+		obj._timeStampNs  = self._timeStampNs
+		obj._timeStampStr = self._timeStampStr
+		
+		# the first property is the 'timeStamp' property, which is copied above
+		for name in clazz.getPropertyNames()[1:]:
+			setattr(obj, name, getattr(self, name))
+		
+		instDict = getattr(self, '__dict__', None)
+		
+		if instDict:
+			obj.__dict__.update(instDict)
+		
+		return obj
+	
 	def updateData(self, data):
 		"""
 		Sets the internal values of this object to be that of 'data',
@@ -227,8 +377,8 @@ class BaseIotData(object):
 		"""
 		Updates the internal time stamp to the current date / time
 		in Zulu time.
-		This retrieves the time since Epoch and converts to an ISO 8601
-		string, with second granularity, as follows:
+		This retrieves the time since Epoch in nanoseconds. The ISO 8601
+		string is rendered later by getTimeStamp(), as follows:
 		
 		e.g. 2020-12-27T17:12:40.032631+00:00
 		
@@ -236,7 +386,8 @@ class BaseIotData(object):
 		with 'Z' if desired. In testing, the format above is
 		compatible with the GDA's parsing logic.
 		"""
-		self.timeStamp = str(datetime.now(timezone.utc).isoformat())
+		self._timeStampNs  = time.time_ns()
+		self._timeStampStr = None
 	
 	def __str__(self):
 		"""
@@ -12,12 +12,21 @@
 
 import json
 import logging
+import struct
 
 from decimal import Decimal
 from json import JSONEncoder
+from json.encoder import encode_basestring_ascii
 
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.DeviceContext import DeviceContext
 from programmingtheiot.data.ActuatorData import ActuatorData
+from programmingtheiot.data.BaseIotData import BaseIotData
 from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
 from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
 
 class DataUtil():
@@ -51,6 +60,430 @@ class DataUtil():
 			return ""
 		return self._generateJsonData(obj=data, useDecForFloat=useDecForFloat)
 	
+	def iotDataToCompactJson(self, data: BaseIotData = None) -> str:
+		"""
+		Fast path for converting SensorData, ActuatorData or SystemPerformanceData
+		(or any other BaseIotData sub-class) to compact JSON. The JSON is built
+		directly from a per-class field schema, with no pretty-printing and no
+		post-processing passes, so string values (e.g. stateData) are never altered.
+		
+		@param data The BaseIotData instance to convert.
+		@return str The compact JSON string, or an empty string if data is None.
+		"""
+		if not data:
+			logging.debug("IoT data is null. Returning empty string.")
+			return ""
+		
+		return self._generateCompactJsonData(data)
+	
+	def iotDataToCompactJsonBytes(self, data: BaseIotData = None) -> bytes:
+		"""
+		Same as iotDataToCompactJson(), but returns UTF-8 encoded bytes that can be
+		passed directly to MqttClientConnector.publishMessage().
+		
+		@param data The BaseIotData instance to convert.
+		@return bytes The compact JSON bytes, or empty bytes if data is None.
+		"""
+		if not data:
+			logging.debug("IoT data is null. Returning empty bytes.")
+			return b""
+		
+		# all strings are ASCII-escaped by the schema encoder, so this is a straight copy
+		return self._generateCompactJsonData(data).encode('ascii')
+	
+	def iotDataToCompactJsonTemplate(self, data: BaseIotData = None, fieldNames: tuple = None) -> tuple:
+		"""
+		Renders 'data' as compact JSON (see iotDataToCompactJson()), split into
+		parts around the values of the given fields. Joining the parts with the
+		rendered JSON values of those fields in between yields the complete JSON,
+		so the fixed parts of a payload can be rendered once and reused.
+		
+		@param data The BaseIotData instance to convert.
+		@param fieldNames The names of the (volatile) fields to leave out.
+		@return tuple The list of len(fieldNames) + 1 JSON parts, and the tuple of
+		field names in the order their values belong between the parts.
+		"""
+		if not data:
+			raise ValueError("IoT data is null. Cannot create template.")
+		
+		schema, hasInstDict = _getCompactJsonSchema(type(data))
+		
+		parts = []
+		orderedNames = []
+		current = []
+		
+		for prefix, name in schema:
+			current.append(prefix)
+			
+			if name in fieldNames:
+				parts.append(''.join(current))
+				orderedNames.append(name)
+				current = []
+			else:
+				val = getattr(data, name)
+				current.append(_COMPACT_JSON_ENCODERS.get(type(val), _encodeCompactJsonValue)(val))
+		
+		if hasInstDict:
+			for name, val in data.__dict__.items():
+				current.append(',' + encode_basestring_ascii(name) + ':')
+				current.append(_COMPACT_JSON_ENCODERS.get(type(val), _encodeCompactJsonValue)(val))
+		
+		current.append('}')
+		parts.append(''.join(current))
+		
+		if len(orderedNames) != len(fieldNames):
+			raise ValueError("Not all template fields are properties of %s: %s" % (type(data).__name__, fieldNames))
+		
+		return parts, tuple(orderedNames)
+	
+	def iotDataToBinary(self, data: BaseIotData = None) -> bytes:
+		"""
+		Converts SensorData, ActuatorData or SystemPerformanceData to the compact
+		binary wire format. The payload starts with a fixed header carrying a
+		magic byte, the schema version, the data kind and the type ID, followed
+		by the fixed-size numeric fields and length-prefixed UTF-8 strings.
+		
+		@param data The SensorData, ActuatorData or SystemPerformanceData instance.
+		@return bytes The binary payload, or empty bytes if data is None.
+		"""
+		if not data:
+			logging.debug("IoT data is null. Returning empty bytes.")
+			return b""
+		
+		schema = _getBinarySchema(type(data))
+		
+		flags = 0
+		
+		for bit, name in enumerate(schema.flagFields):
+			if getattr(data, name):
+				flags |= 1 << bit
+		
+		parts = [ \
+			_BINARY_HEADER.pack( \
+				_BINARY_MAGIC, _BINARY_VERSION, schema.kind, data.typeID, data.getTimeStampNs(), \
+				data.statusCode, flags, data.latitude, data.longitude, data.elevation), \
+			schema.body.pack(*[getattr(data, name) for name in schema.bodyFields])]
+		
+		for name in schema.textFields:
+			_packBinaryText(parts, name, getattr(data, name))
+		
+		return b''.join(parts)
+	
+	def binaryToIotData(self, payload = None) -> BaseIotData:
+		"""
+		Converts a binary payload created by iotDataToBinary() back to a new
+		SensorData, ActuatorData or SystemPerformanceData instance, depending on
+		the data kind in the payload header.
+		
+		@param payload The binary payload (bytes, bytearray or memoryview).
+		@return BaseIotData The new instance, or None if the payload is empty.
+		@throws ValueError If the payload isn't a supported binary payload.
+		"""
+		if not payload:
+			logging.warning("Binary payload is empty or null. Returning null.")
+			return None
+		
+		if not self.isBinaryPayload(payload):
+			raise ValueError("Payload isn't in the binary wire format.")
+		
+		buf = memoryview(payload)
+		
+		magic, version, kind, typeID, timeStampNs, statusCode, flags, latitude, longitude, elevation = \
+			_BINARY_HEADER.unpack_from(buf, 0)
+		
+		schema = _BINARY_SCHEMAS_BY_KIND.get(kind)
+		
+		if version != _BINARY_VERSION or not schema:
+			raise ValueError("Unsupported binary payload. Version: %s, kind: %s" % (version, kind))
+		
+		obj = schema.clazz()
+		obj.typeID     = typeID
+		obj.statusCode = statusCode
+		obj.latitude   = latitude
+		obj.longitude  = longitude
+		obj.elevation  = elevation
+		
+		for bit, name in enumerate(schema.flagFields):
+			setattr(obj, name, bool(flags & (1 << bit)))
+		
+		offset = _BINARY_HEADER.size
+		
+		for name, val in zip(schema.bodyFields, schema.body.unpack_from(buf, offset)):
+			setattr(obj, name, val)
+		
+		offset += schema.body.size
+		
+		for name in schema.textFields:
+			val, offset = _unpackBinaryText(buf, offset)
+			setattr(obj, name, val)
+		
+		# set last, since the setters above may update the time stamp
+		obj.setTimeStampNs(timeStampNs)
+		
+		return obj
+	
+	def iotDataToPayload(self, data: BaseIotData = None, payloadFormat: str = ConfigConst.JSON_PAYLOAD_FORMAT):
+		"""
+		Converts 'data' using the given payload format, which is typically
+		configured per transport (see ConfigConst.PAYLOAD_FORMAT_KEY).
+		
+		@param data The SensorData, ActuatorData or SystemPerformanceData instance.
+		@param payloadFormat Either ConfigConst.JSON_PAYLOAD_FORMAT (default) or
+		ConfigConst.BINARY_PAYLOAD_FORMAT.
+		@return The JSON string, or binary payload bytes.
+		"""
+		if payloadFormat == ConfigConst.BINARY_PAYLOAD_FORMAT:
+			return self.iotDataToBinary(data)
+		
+		if isinstance(data, ActuatorData):
+			return self.actuatorDataToJson(data)
+		elif isinstance(data, SystemPerformanceData):
+			return self.systemPerformanceDataToJson(data)
+		else:
+			return self.sensorDataToJson(data)
+	
+	def payloadToActuatorData(self, payload = None, lenient: bool = False) -> ActuatorData:
+		"""
+		Converts a JSON or binary payload to ActuatorData. The format is
+		detected from the payload itself (see isBinaryPayload()).
+		
+		@param payload The payload (str, bytes, bytearray or memoryview).
+		@param lenient Passed to jsonBytesToActuatorData() for JSON payloads.
+		@return ActuatorData The new instance, or None if invalid.
+		"""
+		if self.isBinaryPayload(payload):
+			data = self.binaryToIotData(payload)
+			
+			if not isinstance(data, ActuatorData):
+				logging.warning("Binary payload doesn't contain ActuatorData. Returning null.")
+				return None
+			
+			return data
+		
+		return self.jsonBytesToActuatorData(payload, lenient = lenient)
+	
+	def sensorDataBatchToJson(self, batch: SensorDataBatch = None) -> str:
+		"""
+		Converts a SensorDataBatch to a compact JSON envelope. The location ID,
+		latitude, longitude and elevation are written once in the envelope
+		header, followed by the list of readings (see ConfigConst.DATA_LIST_PROP),
+		each carrying only its name, type ID, time stamp, status and value.
+		
+		@param batch The SensorDataBatch to convert.
+		@return str The JSON envelope, or an empty string if batch is None or empty.
+		"""
+		if not batch:
+			logging.debug("SensorDataBatch is null or empty. Returning empty string.")
+			return ""
+		
+		ctx = batch.getContext()
+		
+		dataList = [ \
+			{ \
+				ConfigConst.NAME_PROP: sd.name, \
+				ConfigConst.TYPE_ID_PROP: sd.typeID, \
+				ConfigConst.TIMESTAMP_PROP: sd.getTimeStamp(), \
+				ConfigConst.STATUS_CODE_PROP: sd.statusCode, \
+				ConfigConst.HAS_ERROR_PROP: sd.hasError, \
+				ConfigConst.VALUE_PROP: sd.value \
+			} for sd in batch.toSensorDataList()]
+		
+		envelope = { \
+			ConfigConst.LOCATION_ID_PROP: ctx.locationID, \
+			ConfigConst.LATITUDE_PROP: ctx.latitude, \
+			ConfigConst.LONGITUDE_PROP: ctx.longitude, \
+			ConfigConst.ELEVATION_PROP: ctx.elevation, \
+			ConfigConst.DATA_LIST_PROP: dataList}
+		
+		return json.dumps(envelope, separators = (',', ':'))
+	
+	def jsonToSensorDataBatch(self, payload = None, lenient: bool = False) -> SensorDataBatch:
+		"""
+		Converts a JSON envelope created by sensorDataBatchToJson() back to a
+		new SensorDataBatch. The envelope header becomes the batch's DeviceContext.
+		
+		@param payload The JSON envelope (str, bytes, bytearray or memoryview).
+		@param lenient If True, apply the legacy quote / boolean fix-ups when
+		the payload isn't valid JSON.
+		@return SensorDataBatch The new batch, or None if the payload is invalid.
+		"""
+		jsonStruct = self._loadJsonPayload(payload, lenient = lenient)
+		
+		if jsonStruct is None:
+			return None
+		
+		ctx = DeviceContext( \
+			locationID = jsonStruct.get(ConfigConst.LOCATION_ID_PROP, ConfigConst.NOT_SET), \
+			latitude   = jsonStruct.get(ConfigConst.LATITUDE_PROP, ConfigConst.DEFAULT_LAT), \
+			longitude  = jsonStruct.get(ConfigConst.LONGITUDE_PROP, ConfigConst.DEFAULT_LON), \
+			elevation  = jsonStruct.get(ConfigConst.ELEVATION_PROP, ConfigConst.DEFAULT_ELEVATION))
+		
+		dataList = []
+		
+		for item in jsonStruct.get(ConfigConst.DATA_LIST_PROP) or []:
+			sd = SensorData(context = ctx)
+			self._updateIotData(item, sd)
+			dataList.append(sd)
+		
+		return SensorDataBatch.fromSensorDataList(dataList, context = ctx)
+	
+	def sensorDataBatchToBinary(self, batch: SensorDataBatch = None) -> bytes:
+		"""
+		Converts a SensorDataBatch to the compact binary wire format. The payload
+		starts with a header carrying the magic byte, schema version, data kind,
+		reading count and the shared latitude, longitude and elevation, followed by
+		the location ID, the name table and then each column as a packed array.
+		
+		@param batch The SensorDataBatch to convert.
+		@return bytes The binary payload, or empty bytes if batch is None or empty.
+		"""
+		if not batch:
+			logging.debug("SensorDataBatch is null or empty. Returning empty bytes.")
+			return b""
+		
+		ctx = batch.getContext()
+		names = batch.getNames()
+		
+		parts = [ \
+			_BINARY_BATCH_HEADER.pack( \
+				_BINARY_MAGIC, _BINARY_VERSION, _BINARY_BATCH_KIND, len(batch), \
+				ctx.latitude, ctx.longitude, ctx.elevation)]
+		
+		_packBinaryText(parts, ConfigConst.LOCATION_ID_PROP, ctx.locationID)
+		
+		parts.append(_BINARY_TEXT_LEN.pack(len(names)))
+		
+		for name in names:
+			_packBinaryText(parts, ConfigConst.NAME_PROP, name)
+		
+		for getter, wireType, _ in _BINARY_BATCH_COLUMNS:
+			parts.append(calcLib.ascontiguousarray(getter(batch), dtype = wireType).tobytes())
+		
+		return b''.join(parts)
+	
+	def binaryToSensorDataBatch(self, payload = None) -> SensorDataBatch:
+		"""
+		Converts a binary payload created by sensorDataBatchToBinary() back to
+		a new SensorDataBatch.
+		
+		@param payload The binary payload (bytes, bytearray or memoryview).
+		@return SensorDataBatch The new batch, or None if the payload is empty.
+		@throws ValueError If the payload isn't a supported binary batch payload.
+		"""
+		if not payload:
+			logging.warning("Binary payload is empty or null. Returning null.")
+			return None
+		
+		if not self.isBinaryPayload(payload):
+			raise ValueError("Payload isn't in the binary wire format.")
+		
+		buf = memoryview(payload)
+		
+		magic, version, kind, count, latitude, longitude, elevation = _BINARY_BATCH_HEADER.unpack_from(buf, 0)
+		
+		if version != _BINARY_VERSION or kind != _BINARY_BATCH_KIND:
+			raise ValueError("Unsupported binary batch payload. Version: %s, kind: %s" % (version, kind))
+		
+		offset = _BINARY_BATCH_HEADER.size
+		
+		locationID, offset = _unpackBinaryText(buf, offset)
+		
+		(nameCount,) = _BINARY_TEXT_LEN.unpack_from(buf, offset)
+		offset += _BINARY_TEXT_LEN.size
+		
+		names = []
+		
+		for _ in range(nameCount):
+			name, offset = _unpackBinaryText(buf, offset)
+			names.append(name)
+		
+		columns = []
+		
+		for _, wireType, localType in _BINARY_BATCH_COLUMNS:
+			# astype() copies out of 'payload', so the batch doesn't pin the buffer
+			column = calcLib.frombuffer(buf, dtype = wireType, count = count, offset = offset)
+			columns.append(column.astype(localType))
+			offset += column.nbytes
+		
+		nameCodes, typeIDs, values, statusCodes, timeStampsNs, errorFlags = columns
+		
+		ctx = DeviceContext(locationID = locationID, latitude = latitude, longitude = longitude, elevation = elevation)
+		
+		return SensorDataBatch( \
+			nameCodes = nameCodes, names = names, typeIDs = typeIDs, values = values, \
+			statusCodes = statusCodes, timeStampsNs = timeStampsNs, context = ctx, errorFlags = errorFlags)
+	
+	def sensorDataBatchToPayload(self, batch: SensorDataBatch = None, payloadFormat: str = ConfigConst.JSON_PAYLOAD_FORMAT):
+		"""
+		Converts 'batch' using the given payload format (see iotDataToPayload()).
+		
+		@param batch The SensorDataBatch to convert.
+		@param payloadFormat Either ConfigConst.JSON_PAYLOAD_FORMAT (default) or
+		ConfigConst.BINARY_PAYLOAD_FORMAT.
+		@return The JSON string, or binary payload bytes.
+		"""
+		if payloadFormat == ConfigConst.BINARY_PAYLOAD_FORMAT:
+			return self.sensorDataBatchToBinary(batch)
+		
+		return self.sensorDataBatchToJson(batch)
+	
+	def payloadToSensorDataBatch(self, payload = None, lenient: bool = False) -> SensorDataBatch:
+		"""
+		Converts a JSON or binary envelope to a SensorDataBatch. The format is
+		detected from the payload itself (see isBinaryPayload()).
+		
+		@param payload The payload (str, bytes, bytearray or memoryview).
+		@param lenient Passed to jsonToSensorDataBatch() for JSON payloads.
+		@return SensorDataBatch The new batch, or None if invalid.
+		"""
+		if self.isBinaryPayload(payload):
+			return self.binaryToSensorDataBatch(payload)
+		
+		return self.jsonToSensorDataBatch(payload, lenient = lenient)
+	
+	def isBinaryPayload(self, payload = None) -> bool:
+		"""
+		Checks if 'payload' is in the binary wire format. The binary magic byte
+		is never a valid first byte of UTF-8 text, so JSON payloads won't match.
+		
+		@param payload The payload to check.
+		@return bool True if the payload is in binary format; False otherwise.
+		"""
+		return bool(payload) and not isinstance(payload, str) and payload[0] == _BINARY_MAGIC
+	
+	def jsonBytesToActuatorData(self, payload = None, useDecForFloat: bool = False, lenient: bool = False):
+		"""
+		Converts a UTF-8 encoded JSON payload (bytes, bytearray or memoryview),
+		such as an MQTT message payload, to ActuatorData.
+		
+		@param payload The JSON payload. A str is also accepted.
+		@param useDecForFloat If True, floats are parsed as Decimal.
+		@param lenient If True, and the payload isn't valid JSON, the
+		single-quote / Python literal fix-ups used by jsonToActuatorData()
+		are applied before a second parse attempt.
+		@return ActuatorData The new instance, or None if the payload is empty
+		or doesn't contain a JSON object.
+		"""
+		return self._decodeIotData(payload, ActuatorData, useDecForFloat = useDecForFloat, lenient = lenient)
+	
+	def jsonBytesToSensorData(self, payload = None, useDecForFloat: bool = False, lenient: bool = False):
+		"""
+		Converts a UTF-8 encoded JSON payload to SensorData.
+		See jsonBytesToActuatorData() for parameter details.
+		
+		@return SensorData The new instance, or None if invalid.
+		"""
+		return self._decodeIotData(payload, SensorData, useDecForFloat = useDecForFloat, lenient = lenient)
+	
+	def jsonBytesToSystemPerformanceData(self, payload = None, useDecForFloat: bool = False, lenient: bool = False):
+		"""
+		Converts a UTF-8 encoded JSON payload to SystemPerformanceData.
+		See jsonBytesToActuatorData() for parameter details.
+		
+		@return SystemPerformanceData The new instance, or None if invalid.
+		"""
+		return self._decodeIotData(payload, SystemPerformanceData, useDecForFloat = useDecForFloat, lenient = lenient)
+	
 	def jsonToActuatorData(self, jsonData: str = None, useDecForFloat: bool = False):
 		if not jsonData:
 			logging.warning("JSON data is empty or null. Returning null.")
@@ -81,8 +514,49 @@ class DataUtil():
 		self._updateIotData(jsonStruct, spd)
 		return spd
 	
+	def _decodeIotData(self, payload, clazz, useDecForFloat: bool = False, lenient: bool = False):
+		jsonStruct = self._loadJsonPayload(payload, useDecForFloat = useDecForFloat, lenient = lenient)
+		
+		if jsonStruct is None:
+			return None
+		
+		obj = clazz()
+		self._updateIotData(jsonStruct, obj)
+		
+		return obj
 	
-	
+	def _loadJsonPayload(self, payload, useDecForFloat: bool = False, lenient: bool = False) -> dict:
+		if not payload:
+			logging.warning("JSON payload is empty or null. Returning null.")
+			return None
+		
+		try:
+			# str() decodes directly from the buffer (bytes, bytearray or memoryview)
+			jsonData = payload if isinstance(payload, str) else str(payload, 'utf-8')
+		except UnicodeDecodeError as e:
+			logging.warning("JSON payload isn't valid UTF-8. Returning null: %s", e)
+			return None
+		
+		try:
+			jsonStruct = json.loads(jsonData, parse_float = Decimal) if useDecForFloat else json.loads(jsonData)
+		except json.JSONDecodeError as e:
+			if not lenient:
+				logging.warning("JSON payload invalid. Returning null: %s", e)
+				return None
+			
+			logging.debug("JSON payload invalid. Applying lenient fix-ups and retrying.")
+			
+			try:
+				jsonStruct = self._formatDataAndLoadDictionary(jsonData, useDecForFloat = useDecForFloat)
+			except json.JSONDecodeError as e:
+				logging.warning("JSON payload invalid, even after lenient fix-ups. Returning null: %s", e)
+				return None
+		
+		if not isinstance(jsonStruct, dict):
+			logging.warning("JSON payload isn't an object. Returning null: %s", type(jsonStruct).__name__)
+			return None
+		
+		return jsonStruct
 	
 	def _formatDataAndLoadDictionary(self, jsonData: str, useDecForFloat: bool = False) -> dict:
 		jsonData = jsonData.replace("\'", "\"").replace('False', 'false').replace('True', 'true')
@@ -109,15 +583,179 @@ class DataUtil():
 		
 		return jsonData
 	
+	def _generateCompactJsonData(self, obj) -> str:
+		schema, hasInstDict = _getCompactJsonSchema(type(obj))
+		
+		parts = []
+		
+		for prefix, name in schema:
+			val = getattr(obj, name)
+			
+			parts.append(prefix)
+			parts.append(_COMPACT_JSON_ENCODERS.get(type(val), _encodeCompactJsonValue)(val))
+		
+		# sub-classes that don't declare __slots__ may carry additional properties
+		if hasInstDict:
+			for name, val in obj.__dict__.items():
+				parts.append(',' + encode_basestring_ascii(name) + ':')
+				parts.append(_COMPACT_JSON_ENCODERS.get(type(val), _encodeCompactJsonValue)(val))
+		
+		parts.append('}')
+		
+		return ''.join(parts)
+	
 	def _updateIotData(self, jsonStruct, obj):
-		varStruct = vars(obj)
+		fieldNames = _getIotDataFieldNames(type(obj))
 		
-		for key in jsonStruct:
-			if key in varStruct:
-				setattr(obj, key, jsonStruct[key])
+		for key, val in jsonStruct.items():
+			if key in fieldNames:
+				setattr(obj, key, val)
 			else:
-				logging.warn("JSON data contains key not mappable to object: %s", key)
+				logging.warning("JSON data contains key not mappable to object: %s", key)
+		
+def _encodeCompactJsonFloat(val: float) -> str:
+	# matches the output of json.dumps() for non-finite values
+	if val != val:
+		return 'NaN'
+	elif val == _INFINITY:
+		return 'Infinity'
+	elif val == -_INFINITY:
+		return '-Infinity'
+	
+	return float.__repr__(val)
+
+def _encodeCompactJsonValue(val) -> str:
+	return json.dumps(val, cls = JsonDataEncoder, separators = (',', ':'))
+
+_INFINITY = float('inf')
+
+_COMPACT_JSON_ENCODERS = {
+	str: encode_basestring_ascii,
+	int: int.__repr__,
+	float: _encodeCompactJsonFloat,
+	bool: lambda val: 'true' if val else 'false',
+	type(None): lambda val: 'null',
+	Decimal: str
+}
+
+_compactJsonSchemas = {}
+
+def _getCompactJsonSchema(clazz):
+	"""
+	Returns the cached compact JSON schema for 'clazz', creating it on first use.
+	The schema is a tuple of (key prefix, property name) pairs, where each key
+	prefix is the pre-rendered JSON for the property name - e.g. ',"value":'.
+	
+	@return tuple The schema and a flag indicating if instances carry a __dict__.
+	"""
+	entry = _compactJsonSchemas.get(clazz)
+	
+	if entry is None:
+		schema = tuple( \
+			(('{' if i == 0 else ',') + encode_basestring_ascii(name) + ':', name) \
+			for i, name in enumerate(clazz.getPropertyNames()))
+		
+		entry = (schema, clazz.__dictoffset__ != 0)
+		_compactJsonSchemas[clazz] = entry
+	
+	return entry
+
+_iotDataFieldNames = {}
+
+def _getIotDataFieldNames(clazz) -> frozenset:
+	"""
+	Returns the cached set of property names that may be set on instances
+	of 'clazz' when decoding JSON, creating it on first use.
+	
+	@return frozenset The property names.
+	"""
+	fieldNames = _iotDataFieldNames.get(clazz)
+	
+	if fieldNames is None:
+		fieldNames = frozenset(clazz.getPropertyNames())
+		_iotDataFieldNames[clazz] = fieldNames
+	
+	return fieldNames
+
+class _BinarySchema():
+	"""
+	Binary wire format layout for a single data class.
+	
+	"""
+	__slots__ = ('clazz', 'kind', 'body', 'bodyFields', 'textFields', 'flagFields')
+	
+	def __init__(self, clazz, kind: int, bodyFormat: str, bodyFields: tuple, textFields: tuple, flagFields: tuple):
+		self.clazz      = clazz
+		self.kind       = kind
+		self.body       = struct.Struct('!' + bodyFormat)
+		self.bodyFields = bodyFields
+		self.textFields = textFields
+		self.flagFields = flagFields
+
+# 0xA5 can't begin a UTF-8 sequence, so binary payloads are never mistaken for JSON
+_BINARY_MAGIC = 0xA5
+_BINARY_VERSION = 1
+
+# magic, version, kind, typeID, timeStampNs, statusCode, flags, latitude, longitude, elevation
+_BINARY_HEADER = struct.Struct('!BBBiqiBddd')
+
+_BINARY_TEXT_LEN = struct.Struct('!H')
+_BINARY_NULL_TEXT_LEN = 0xFFFF
+
+_BINARY_SCHEMAS = (
+	_BinarySchema(SensorData, 1, 'd', (ConfigConst.VALUE_PROP,), \
+		(ConfigConst.NAME_PROP, ConfigConst.LOCATION_ID_PROP), (ConfigConst.HAS_ERROR_PROP,)),
+	_BinarySchema(ActuatorData, 2, 'di', (ConfigConst.VALUE_PROP, ConfigConst.COMMAND_PROP), \
+		(ConfigConst.NAME_PROP, ConfigConst.LOCATION_ID_PROP, ConfigConst.STATE_DATA_PROP), \
+		(ConfigConst.HAS_ERROR_PROP, ConfigConst.IS_RESPONSE_PROP)),
+	_BinarySchema(SystemPerformanceData, 3, 'dd', (ConfigConst.CPU_UTIL_PROP, ConfigConst.MEM_UTIL_PROP), \
+		(ConfigConst.NAME_PROP, ConfigConst.LOCATION_ID_PROP), (ConfigConst.HAS_ERROR_PROP,))
+)
+
+_BINARY_SCHEMAS_BY_KIND = {schema.kind: schema for schema in _BINARY_SCHEMAS}
+
+# magic, version, kind, count, latitude, longitude, elevation
+_BINARY_BATCH_HEADER = struct.Struct('!BBBIddd')
+_BINARY_BATCH_KIND = 4
+
+# column getter, big-endian wire type, and local type - in payload order
+_BINARY_BATCH_COLUMNS = (
+	(SensorDataBatch.getNameCodes, '>i4', SensorDataBatch.NAME_CODE_TYPE),
+	(SensorDataBatch.getTypeIDs, '>i4', SensorDataBatch.TYPE_ID_TYPE),
+	(SensorDataBatch.getValues, '>f8', SensorDataBatch.VALUE_TYPE),
+	(SensorDataBatch.getStatusCodes, '>i4', SensorDataBatch.STATUS_CODE_TYPE),
+	(SensorDataBatch.getTimeStampsNs, '>i8', SensorDataBatch.TIME_STAMP_TYPE),
+	(SensorDataBatch.getErrorFlags, '?', SensorDataBatch.ERROR_FLAG_TYPE)
+)
+
+def _packBinaryText(parts: list, name: str, val):
+	if val is None:
+		parts.append(_BINARY_TEXT_LEN.pack(_BINARY_NULL_TEXT_LEN))
+	else:
+		encodedVal = str(val).encode('utf-8')
+		
+		if len(encodedVal) >= _BINARY_NULL_TEXT_LEN:
+			raise ValueError("Binary payload text field too long: " + name)
 		
+		parts.append(_BINARY_TEXT_LEN.pack(len(encodedVal)))
+		parts.append(encodedVal)
+
+def _unpackBinaryText(buf: memoryview, offset: int):
+	(textLen,) = _BINARY_TEXT_LEN.unpack_from(buf, offset)
+	offset += _BINARY_TEXT_LEN.size
+	
+	if textLen == _BINARY_NULL_TEXT_LEN:
+		return None, offset
+	
+	return str(buf[offset:offset + textLen], 'utf-8'), offset + textLen
+
+def _getBinarySchema(clazz) -> _BinarySchema:
+	for schema in _BINARY_SCHEMAS:
+		if issubclass(clazz, schema.clazz):
+			return schema
+	
+	raise ValueError("No binary wire format for type: " + clazz.__name__)
+
 class JsonDataEncoder(JSONEncoder):
 	"""
 	Convenience class to facilitate JSON encoding of an object that
@@ -125,5 +763,8 @@ class JsonDataEncoder(JSONEncoder):
 	
 	"""
 	def default(self, o):
+		if isinstance(o, BaseIotData):
+			return o.toDict()
+		
 		return o.__dict__
 	
\ No newline at end of file
@@ -19,9 +19,11 @@ class SensorData(BaseIotData):
 	Shell representation of class for student implementation.
 	
 	"""
+	
+	__slots__ = (ConfigConst.VALUE_PROP,)
 		
-	def __init__(self, typeID: int = ConfigConst.DEFAULT_SENSOR_TYPE, name = ConfigConst.NOT_SET, d = None):
-		super(SensorData, self).__init__(name = name, typeID = typeID, d = d)
+	def __init__(self, typeID: int = ConfigConst.DEFAULT_SENSOR_TYPE, name = ConfigConst.NOT_SET, d = None, context = None):
+		super(SensorData, self).__init__(name = name, typeID = typeID, d = d, context = context)
 	
 		self.value = ConfigConst.DEFAULT_VAL
 	
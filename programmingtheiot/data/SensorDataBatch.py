@@ -0,0 +1,203 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# You may find it more helpful to your design to adjust the
+# functionality, constants and interfaces (if there are any)
+# provided within in order to meet the needs of your specific
+# Programming the Internet of Things project.
+#
+
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.DeviceContext import DeviceContext
+from programmingtheiot.data.SensorData import SensorData
+
+class SensorDataBatch():
+	"""
+	Columnar container for many SensorData readings. Each property is
+	stored in its own NumPy array (one entry per reading), so filtering,
+	aggregation and serialization can operate over the whole batch
+	at once instead of over individual SensorData instances.
+
+	Names are stored as integer codes into a shared name table, and
+	time stamps as integer nanoseconds since Epoch (see
+	BaseIotData.getTimeStampNs()). The location ID, latitude, longitude
+	and elevation are shared by all readings via a DeviceContext.
+
+	Each reading's error flag (see BaseIotData.hasErrorFlag()) is kept in its
+	own column, as it can be set independently of the status code.
+
+	Slicing a batch (e.g. batch[10:20]) returns a new batch whose arrays
+	are views onto this batch's arrays - no data is copied.
+
+	"""
+
+	NAME_CODE_TYPE   = calcLib.int32
+	TYPE_ID_TYPE     = calcLib.int32
+	VALUE_TYPE       = calcLib.float64
+	STATUS_CODE_TYPE = calcLib.int32
+	ERROR_FLAG_TYPE  = calcLib.bool_
+	TIME_STAMP_TYPE  = calcLib.int64
+
+	def __init__( \
+		self, \
+		nameCodes = None, names: list = None, typeIDs = None, values = None, \
+		statusCodes = None, timeStampsNs = None, context: DeviceContext = None, errorFlags = None):
+		"""
+		Constructor. Each array argument must be one dimensional and of
+		the same length; if omitted, an empty batch is created.
+
+		NOTE: Arrays already of the correct dtype are stored as-is (not copied).
+
+		@param nameCodes The array of indices into 'names', one per reading.
+		@param names The name table referenced by 'nameCodes'.
+		@param typeIDs The array of type IDs.
+		@param values The array of values.
+		@param statusCodes The array of status codes.
+		@param timeStampsNs The array of time stamps in nanoseconds since Epoch.
+		@param context The DeviceContext shared by all readings. Defaults to
+		the process-wide context.
+		@param errorFlags The array of error flags. If omitted, a reading's
+		error flag is set if its status code is less than 0.
+		"""
+		self.nameCodes    = self._toArray(nameCodes, self.NAME_CODE_TYPE)
+		self.names        = list(names) if names else []
+		self.typeIDs      = self._toArray(typeIDs, self.TYPE_ID_TYPE)
+		self.values       = self._toArray(values, self.VALUE_TYPE)
+		self.statusCodes  = self._toArray(statusCodes, self.STATUS_CODE_TYPE)
+		self.timeStampsNs = self._toArray(timeStampsNs, self.TIME_STAMP_TYPE)
+		self.errorFlags   = self._toArray(errorFlags, self.ERROR_FLAG_TYPE) if errorFlags is not None else self.statusCodes < 0
+		self.context      = context if context else DeviceContext.getCurrent()
+
+		size = self.values.size
+
+		for arr in (self.nameCodes, self.typeIDs, self.statusCodes, self.timeStampsNs, self.errorFlags):
+			if arr.size != size:
+				raise ValueError("All SensorDataBatch arrays must be the same length: " + str(size))
+
+	@classmethod
+	def fromSensorDataList(cls, dataList: list, context: DeviceContext = None):
+		"""
+		Creates a new batch from a list of SensorData instances.
+
+		@param dataList The list of SensorData instances.
+		@param context The DeviceContext to apply to the batch.
+		@return SensorDataBatch The new batch.
+		"""
+		count = len(dataList)
+		nameTable = {}
+
+		nameCodes = calcLib.fromiter( \
+			(nameTable.setdefault(sd.name, len(nameTable)) for sd in dataList), \
+			dtype = cls.NAME_CODE_TYPE, count = count)
+		typeIDs = calcLib.fromiter((sd.typeID for sd in dataList), dtype = cls.TYPE_ID_TYPE, count = count)
+		values = calcLib.fromiter((sd.value for sd in dataList), dtype = cls.VALUE_TYPE, count = count)
+		statusCodes = calcLib.fromiter((sd.statusCode for sd in dataList), dtype = cls.STATUS_CODE_TYPE, count = count)
+		timeStampsNs = calcLib.fromiter((sd.getTimeStampNs() for sd in dataList), dtype = cls.TIME_STAMP_TYPE, count = count)
+		errorFlags = calcLib.fromiter((sd.hasError for sd in dataList), dtype = cls.ERROR_FLAG_TYPE, count = count)
+
+		return cls( \
+			nameCodes = nameCodes, names = list(nameTable), typeIDs = typeIDs, values = values, \
+			statusCodes = statusCodes, timeStampsNs = timeStampsNs, context = context, errorFlags = errorFlags)
+
+	def getContext(self) -> DeviceContext:
+		return self.context
+
+	def getErrorFlags(self):
+		return self.errorFlags
+
+	def getName(self, index: int) -> str:
+		return self.names[self.nameCodes[index]]
+
+	def getNameCodes(self):
+		return self.nameCodes
+
+	def getNames(self) -> list:
+		return self.names
+
+	def getStatusCodes(self):
+		return self.statusCodes
+
+	def getTimeStampsNs(self):
+		return self.timeStampsNs
+
+	def getTypeIDs(self):
+		return self.typeIDs
+
+	def getValues(self):
+		return self.values
+
+	def getSensorData(self, index: int) -> SensorData:
+		"""
+		Returns the reading at 'index' as a new SensorData instance.
+
+		@param index The index of the reading.
+		@return SensorData The new SensorData instance.
+		"""
+		return self._createSensorData( \
+			self.names[self.nameCodes[index]], int(self.typeIDs[index]), float(self.values[index]), \
+			int(self.statusCodes[index]), int(self.timeStampsNs[index]), bool(self.errorFlags[index]))
+
+	def toSensorDataList(self) -> list:
+		"""
+		Converts this batch into a list of new SensorData instances.
+
+		@return list The list of SensorData instances, in batch order.
+		"""
+		names = self.names
+
+		return [ \
+			self._createSensorData(names[nameCode], typeID, value, statusCode, timeStampNs, hasError) \
+			for nameCode, typeID, value, statusCode, timeStampNs, hasError in zip( \
+				self.nameCodes.tolist(), self.typeIDs.tolist(), self.values.tolist(), \
+				self.statusCodes.tolist(), self.timeStampsNs.tolist(), self.errorFlags.tolist())]
+
+	def _createSensorData(self, name: str, typeID: int, value: float, statusCode: int, timeStampNs: int, hasError: bool) -> SensorData:
+		sd = SensorData(typeID = typeID, name = name, context = self.context)
+
+		sd.value = value
+		sd.setStatusCode(statusCode)
+		sd.setTimeStampNs(timeStampNs)
+		sd.hasError = hasError
+
+		return sd
+
+	def _toArray(self, data, dtype):
+		if data is None:
+			return calcLib.empty(0, dtype = dtype)
+
+		return calcLib.asarray(data, dtype = dtype)
+
+	def __getitem__(self, key):
+		"""
+		Returns a SensorData instance for an integer index, or a new
+		SensorDataBatch sharing this batch's arrays for a slice.
+
+		@param key The integer index or slice.
+		"""
+		if isinstance(key, slice):
+			return SensorDataBatch( \
+				nameCodes = self.nameCodes[key], names = self.names, typeIDs = self.typeIDs[key], \
+				values = self.values[key], statusCodes = self.statusCodes[key], \
+				timeStampsNs = self.timeStampsNs[key], context = self.context, errorFlags = self.errorFlags[key])
+
+		return self.getSensorData(key)
+
+	def __len__(self):
+		return self.values.size
+
+	def __str__(self):
+		"""
+		Returns a string representation of this instance.
+
+		@return The string representing this instance, returned in CSV 'key=value' format.
+		"""
+		return '{}={},{}={},{}={}'.format(
+			'size', len(self),
+			ConfigConst.NAME_PROP, self.names,
+			ConfigConst.LOCATION_ID_PROP, self.context.locationID)
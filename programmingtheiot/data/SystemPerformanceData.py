@@ -21,8 +21,10 @@ class SystemPerformanceData(BaseIotData):
 	"""
 	DEFAULT_VAL = 0.0
 	
-	def __init__(self, d = None):
-		super(SystemPerformanceData, self).__init__(name = ConfigConst.SYSTEM_PERF_MSG, typeID = ConfigConst.SYSTEM_PERF_TYPE, d = d)
+	__slots__ = (ConfigConst.CPU_UTIL_PROP, ConfigConst.MEM_UTIL_PROP)
+	
+	def __init__(self, d = None, context = None):
+		super(SystemPerformanceData, self).__init__(name = ConfigConst.SYSTEM_PERF_MSG, typeID = ConfigConst.SYSTEM_PERF_TYPE, d = d, context = context)
 	
 		self.cpuUtil = ConfigConst.DEFAULT_VAL
 		self.memUtil = ConfigConst.DEFAULT_VAL
@@ -13,6 +13,8 @@ import unittest
 import time
 
 from programmingtheiot.cda.connection.MqttClientConnector import MqttClientConnector
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorDataPayloadCache import SensorDataPayloadCache
 
 from programmingtheiot.common.ResourceNameEnum import ResourceNameEnum
 
@@ -65,6 +67,28 @@ class MqttClientConnectorTest(unittest.TestCase):
 	def testPublishQoS2(self):
 		self._execTestPublish(self.MAX_TEST_RUNS, 2)
 
+	@unittest.skip("Ignore for now.")
+	def testPublishCachedPayloadsQoS0(self):
+		self.assertTrue(self.mqttClient.connectClient())
+		
+		dataSet = SensorDataGenerator().generateDailyIndoorTemperatureDataSet(useSeconds = True)
+		payloadCache = SensorDataPayloadCache(dataSet = dataSet)
+		payloadLen = len(payloadCache.getPayload(0))
+		startTime = time.time_ns()
+		
+		count = self.mqttClient.publishCachedPayloads( \
+			resource = ResourceNameEnum.CDA_SENSOR_MSG_RESOURCE, payloadCache = payloadCache, count = self.MAX_TEST_RUNS, qos = 0)
+		
+		endTime = time.time_ns()
+		elapsedMillis = (endTime - startTime) / self.NS_IN_MILLIS
+		
+		self.assertTrue(self.mqttClient.disconnectClient())
+		self.assertEqual(count, self.MAX_TEST_RUNS)
+		
+		logging.info( \
+			"\n\tTesting Publish Cached Payloads: QoS = 0 | msgs = %r | payload size = %r | elapsed = %r ms", \
+			count, payloadLen, elapsedMillis)
+		
 	def _execTestPublish(self, maxTestRuns: int, qos: int):
 		self.assertTrue(self.mqttClient.connectClient())
 		
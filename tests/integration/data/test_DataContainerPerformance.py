@@ -0,0 +1,148 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import logging
+import time
+import tracemalloc
+import unittest
+
+from datetime import datetime, timezone
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.ConfigUtil import ConfigUtil
+from programmingtheiot.common.DeviceContext import DeviceContext
+from programmingtheiot.data.SensorData import SensorData
+
+class DataContainerPerformanceTest(unittest.TestCase):
+	"""
+	This test case class contains very basic performance tests for
+	the slotted data containers (e.g. SensorData), comparing them
+	against the original __dict__ based layout. It should not be
+	considered complete, but serve as a starting point for the student
+	implementing additional functionality within their Programming the
+	IoT environment.
+	"""
+	NS_IN_MILLIS = 1000000
+	NS_IN_SECS = 1000000000
+	MAX_TEST_RUNS = 100000
+	MAX_CONSTRUCTION_RUNS = 10000
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.INFO)
+		logging.info("Testing data container performance...")
+
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+
+	def testSensorDataMemoryFootprint(self):
+		legacyBytes = self._execTestMemory(LegacySensorData, self.MAX_TEST_RUNS)
+		slottedBytes = self._execTestMemory(SensorData, self.MAX_TEST_RUNS)
+
+		logging.info( \
+			"\n\tTesting Memory: objs = %r | legacy bytes/obj = %r | slotted bytes/obj = %r | savings = %.1f%%", \
+			self.MAX_TEST_RUNS, legacyBytes, slottedBytes, (1 - slottedBytes / legacyBytes) * 100)
+
+		self.assertLess(slottedBytes, legacyBytes)
+
+	def testSensorDataAttributeAccess(self):
+		legacyMillis = self._execTestAccess(LegacySensorData(), self.MAX_TEST_RUNS)
+		slottedMillis = self._execTestAccess(SensorData(), self.MAX_TEST_RUNS)
+
+		logging.info( \
+			"\n\tTesting Attribute Access: reads = %r | legacy = %r ms | slotted = %r ms", \
+			self.MAX_TEST_RUNS, legacyMillis, slottedMillis)
+
+	def testSensorDataConstructionRate(self):
+		DeviceContext.getCurrent()
+
+		configLookupRate = self._execTestConstruction(ConfigLookupSensorData, self.MAX_CONSTRUCTION_RUNS)
+		contextRate = self._execTestConstruction(SensorData, self.MAX_CONSTRUCTION_RUNS)
+
+		logging.info( \
+			"\n\tTesting Construction: objs = %r | per-object config lookup = %.0f objs/sec | device context = %.0f objs/sec", \
+			self.MAX_CONSTRUCTION_RUNS, configLookupRate, contextRate)
+
+	def _execTestConstruction(self, clazz, maxTestRuns: int) -> float:
+		startTime = time.perf_counter_ns()
+
+		for seqNo in range(0, maxTestRuns):
+			clazz()
+
+		endTime = time.perf_counter_ns()
+
+		return maxTestRuns * self.NS_IN_SECS / (endTime - startTime)
+
+	def _execTestMemory(self, clazz, maxTestRuns: int) -> float:
+		# construct once outside of the trace to exclude one-time (config, import) allocations
+		clazz()
+
+		tracemalloc.start()
+
+		startBytes = tracemalloc.get_traced_memory()[0]
+		dataList = [clazz() for seqNo in range(0, maxTestRuns)]
+		endBytes = tracemalloc.get_traced_memory()[0]
+
+		tracemalloc.stop()
+
+		# exclude the list itself - one pointer per entry
+		return (endBytes - startBytes) / len(dataList) - 8
+
+	def _execTestAccess(self, data, maxTestRuns: int) -> float:
+		startTime = time.perf_counter_ns()
+
+		for seqNo in range(0, maxTestRuns):
+			data.value
+			data.name
+			data.typeID
+
+		endTime = time.perf_counter_ns()
+
+		return (endTime - startTime) / self.NS_IN_MILLIS
+
+class LegacySensorData():
+	"""
+	Replica of the original (pre __slots__) SensorData instance layout,
+	retained for comparison purposes only.
+
+	"""
+
+	def __init__(self):
+		self.timeStamp  = str(datetime.now(timezone.utc).isoformat())
+		self.hasError   = False
+		self.name       = ConfigConst.NOT_SET
+		self.typeID     = ConfigConst.DEFAULT_SENSOR_TYPE
+		self.statusCode = ConfigConst.DEFAULT_STATUS
+		self.latitude   = ConfigConst.DEFAULT_LAT
+		self.longitude  = ConfigConst.DEFAULT_LON
+		self.elevation  = ConfigConst.DEFAULT_ELEVATION
+		self.locationID = ConfigConst.NOT_SET
+		self.value      = ConfigConst.DEFAULT_VAL
+
+class ConfigLookupSensorData(SensorData):
+	"""
+	Replica of the original SensorData construction path, which
+	looked up the location ID from ConfigUtil for every instance,
+	retained for comparison purposes only.
+
+	"""
+
+	__slots__ = ()
+
+	def __init__(self):
+		super(ConfigLookupSensorData, self).__init__()
+
+		self.locationID = ConfigUtil().getProperty(ConfigConst.CONSTRAINED_DEVICE, ConfigConst.DEVICE_LOCATION_ID_KEY)
+
+if __name__ == "__main__":
+	unittest.main()
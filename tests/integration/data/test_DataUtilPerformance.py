@@ -0,0 +1,128 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import logging
+import time
+import unittest
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorDataPayloadCache import SensorDataPayloadCache
+from programmingtheiot.data.ActuatorData import ActuatorData
+from programmingtheiot.data.DataUtil import DataUtil
+from programmingtheiot.data.SensorData import SensorData
+
+class DataUtilPerformanceTest(unittest.TestCase):
+	"""
+	This test case class contains very basic performance tests for
+	DataUtil, comparing the compact (schema based) JSON encoder against
+	the original JSONEncoder based path. It should not be considered
+	complete, but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	NS_IN_SECS = 1000000000
+	MAX_TEST_RUNS = 20000
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.INFO)
+		logging.info("Testing DataUtil performance...")
+
+		self.dataUtil = DataUtil()
+
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+
+	def testSensorDataEncodeRate(self):
+		sensorData = SensorData()
+		sensorData.setValue(21.5)
+
+		self._execTestEncode("SensorData", sensorData, self.dataUtil.sensorDataToJson, self.MAX_TEST_RUNS)
+
+	def testActuatorDataEncodeRate(self):
+		actuatorData = ActuatorData()
+		actuatorData.setStateData("Lights on")
+
+		self._execTestEncode("ActuatorData", actuatorData, self.dataUtil.actuatorDataToJson, self.MAX_TEST_RUNS)
+
+	def testActuatorDataDecodeRate(self):
+		actuatorData = ActuatorData()
+		actuatorData.setStateData("Lights on")
+
+		payload = self.dataUtil.iotDataToCompactJsonBytes(actuatorData)
+
+		legacyRate = self._execTestEncodeRate( \
+			lambda data: self.dataUtil.jsonToActuatorData(data.decode('utf-8')), payload, self.MAX_TEST_RUNS)
+		bytesRate = self._execTestEncodeRate(self.dataUtil.jsonBytesToActuatorData, payload, self.MAX_TEST_RUNS)
+
+		logging.info( \
+			"\n\tTesting ActuatorData Decoding: msgs = %r | legacy = %.0f msgs/sec | bytes = %.0f msgs/sec", \
+			self.MAX_TEST_RUNS, legacyRate, bytesRate)
+
+	def testSensorDataPayloadCacheRate(self):
+		dataSet = SensorDataGenerator().generateDailyIndoorTemperatureDataSet(useSeconds = True)
+
+		def encodeSensorData(index: int):
+			sensorData = SensorData()
+			sensorData.setValue(dataSet.getDataEntry(index))
+
+			return self.dataUtil.iotDataToCompactJsonBytes(sensorData)
+
+		startTime = time.perf_counter_ns()
+
+		payloadCache = SensorDataPayloadCache(dataSet = dataSet)
+
+		renderMillis = (time.perf_counter_ns() - startTime) / 1000000
+		timeStamp = payloadCache.renderTimeStamp()
+
+		encodeRate = self._execTestIndexedRate(encodeSensorData, self.MAX_TEST_RUNS)
+		cachedRate = self._execTestIndexedRate(lambda index: payloadCache.getPayload(index, timeStamp), self.MAX_TEST_RUNS)
+
+		logging.info( \
+			"\n\tTesting SensorData Payload Cache: msgs = %r | per-message encode = %.0f msgs/sec | cached = %.0f msgs/sec | pre-render %r payloads = %.1f ms", \
+			self.MAX_TEST_RUNS, encodeRate, cachedRate, payloadCache.getPayloadCount(), renderMillis)
+
+	def _execTestEncode(self, label: str, data, legacyEncodeFunc, maxTestRuns: int):
+		legacyRate = self._execTestEncodeRate(legacyEncodeFunc, data, maxTestRuns)
+		compactRate = self._execTestEncodeRate(self.dataUtil.iotDataToCompactJson, data, maxTestRuns)
+		compactBytesRate = self._execTestEncodeRate(self.dataUtil.iotDataToCompactJsonBytes, data, maxTestRuns)
+		binaryRate = self._execTestEncodeRate(self.dataUtil.iotDataToBinary, data, maxTestRuns)
+
+		logging.info( \
+			"\n\tTesting %s Encoding: msgs = %r | legacy = %.0f msgs/sec | compact = %.0f msgs/sec | compact bytes = %.0f msgs/sec | binary = %.0f msgs/sec", \
+			label, maxTestRuns, legacyRate, compactRate, compactBytesRate, binaryRate)
+		logging.info( \
+			"\n\tTesting %s Payload Size: legacy = %d bytes | compact = %d bytes | binary = %d bytes", \
+			label, len(legacyEncodeFunc(data)), len(self.dataUtil.iotDataToCompactJson(data)), len(self.dataUtil.iotDataToBinary(data)))
+
+	def _execTestEncodeRate(self, encodeFunc, data, maxTestRuns: int) -> float:
+		startTime = time.perf_counter_ns()
+
+		for seqNo in range(0, maxTestRuns):
+			encodeFunc(data)
+
+		endTime = time.perf_counter_ns()
+
+		return maxTestRuns * self.NS_IN_SECS / (endTime - startTime)
+
+	def _execTestIndexedRate(self, encodeFunc, maxTestRuns: int) -> float:
+		startTime = time.perf_counter_ns()
+
+		for seqNo in range(0, maxTestRuns):
+			encodeFunc(seqNo)
+
+		endTime = time.perf_counter_ns()
+
+		return maxTestRuns * self.NS_IN_SECS / (endTime - startTime)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,199 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import importlib.util
+import logging
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+import unittest
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorChannelSpec
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorDataSetCache import SensorDataSetCache
+from programmingtheiot.cda.sim.SensorFleetGenerator import SensorFleetGenerator
+
+class SensorDataGeneratorPerformanceTest(unittest.TestCase):
+	"""
+	This test case class contains very basic performance tests for
+	SensorDataGenerator, comparing per-channel generation against
+	multi-channel generation. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	NS_IN_MILLIS = 1000000
+	MAX_CHANNELS = 3000
+	MAX_FLEET_CHANNELS = 5000
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.INFO)
+		logging.info("Testing sensor data generator performance...")
+
+	def setUp(self):
+		self.dataGenerator = SensorDataGenerator()
+
+		curveTypes = ( \
+			SensorDataGenerator.DEFAULT_HUMIDITY_CURVE, SensorDataGenerator.DEFAULT_PRESSURE_CURVE, \
+			SensorDataGenerator.DEFAULT_TEMP_CURVE)
+
+		self.channelSpecs = [ \
+			SensorChannelSpec( \
+				name = str(i), curveType = curveTypes[i % len(curveTypes)], \
+				minValue = SensorDataGenerator.LOW_NORMAL_INDOOR_TEMP + i % 10, \
+				maxValue = SensorDataGenerator.HI_NORMAL_INDOOR_TEMP + i % 10) \
+			for i in range(0, self.MAX_CHANNELS)]
+
+	def tearDown(self):
+		pass
+
+	def testGenerateChannels(self):
+		# exclude the per-channel log records from the measurement
+		logging.disable(logging.INFO)
+
+		try:
+			startTime = time.perf_counter_ns()
+
+			for spec in self.channelSpecs:
+				self.dataGenerator.generateDailySensorDataSet( \
+					curveType = spec.curveType, noiseLevel = spec.noiseLevel, \
+					minValue = spec.minValue, maxValue = spec.maxValue, startHour = 0, endHour = 24)
+
+			perChannelMillis = (time.perf_counter_ns() - startTime) / self.NS_IN_MILLIS
+
+			startTime = time.perf_counter_ns()
+
+			self.dataGenerator.generateMultiChannelDataSet(channelSpecs = self.channelSpecs, startHour = 0, endHour = 24)
+
+			multiChannelMillis = (time.perf_counter_ns() - startTime) / self.NS_IN_MILLIS
+		finally:
+			logging.disable(logging.NOTSET)
+
+		logging.info( \
+			"\n\tTesting Generate Channels: channels = %r | per-channel = %.1f ms | multi-channel = %.1f ms", \
+			self.MAX_CHANNELS, perChannelMillis, multiChannelMillis)
+
+	def testGenerateChunksMemory(self):
+		logging.disable(logging.INFO)
+
+		try:
+			tracemalloc.start()
+
+			self.dataGenerator.generateDailySensorDataSet(useSeconds = True)
+			dataSetPeakBytes = tracemalloc.get_traced_memory()[1]
+
+			tracemalloc.reset_peak()
+
+			for timeEntries, dataEntries in self.dataGenerator.generateDailySensorDataChunks(useSeconds = True):
+				pass
+
+			chunkPeakBytes = tracemalloc.get_traced_memory()[1]
+		finally:
+			tracemalloc.stop()
+			logging.disable(logging.NOTSET)
+
+		logging.info( \
+			"\n\tTesting Generate Chunks: entries = %r | data set peak = %.1f KB | chunked peak = %.1f KB", \
+			SensorDataGenerator.MAX_HOURS * 3600, dataSetPeakBytes / 1024, chunkPeakBytes / 1024)
+
+		self.assertLess(chunkPeakBytes, dataSetPeakBytes)
+
+	def testCachedDataSet(self):
+		cachePath = tempfile.mkdtemp()
+		cache = SensorDataSetCache(cachePath)
+
+		logging.disable(logging.INFO)
+
+		try:
+			startTime = time.perf_counter_ns()
+	
+			SensorDataGenerator(seed = 42).generateMultiChannelDataSet(channelSpecs = self.channelSpecs, startHour = 0, endHour = 24)
+	
+			generateMillis = (time.perf_counter_ns() - startTime) / self.NS_IN_MILLIS
+	
+			cache.getMultiChannelDataSet(SensorDataGenerator(seed = 42), channelSpecs = self.channelSpecs, startHour = 0, endHour = 24)
+	
+			startTime = time.perf_counter_ns()
+	
+			dataSet = cache.getMultiChannelDataSet(SensorDataGenerator(seed = 42), channelSpecs = self.channelSpecs, startHour = 0, endHour = 24)
+	
+			cachedMillis = (time.perf_counter_ns() - startTime) / self.NS_IN_MILLIS
+		finally:
+			logging.disable(logging.NOTSET)
+			shutil.rmtree(cachePath, ignore_errors = True)
+
+		logging.info( \
+			"\n\tTesting Cached Data Set: channels = %r | generate = %.1f ms | open cached = %.1f ms", \
+			self.MAX_CHANNELS, generateMillis, cachedMillis)
+
+		self.assertEqual(dataSet.getChannelCount(), self.MAX_CHANNELS)
+
+	def testGenerateFleet(self):
+		fleetSpecs = [SensorChannelSpec(name = str(i), curveType = self.channelSpecs[i % self.MAX_CHANNELS].curveType) for i in range(0, self.MAX_FLEET_CHANNELS)]
+		workerCount = os.cpu_count() or 1
+
+		logging.disable(logging.INFO)
+
+		try:
+			startTime = time.perf_counter_ns()
+
+			SensorDataGenerator(seed = 42).generateMultiChannelDataSet(channelSpecs = fleetSpecs, startHour = 0, endHour = 24, useSeconds = False)
+
+			singleMillis = (time.perf_counter_ns() - startTime) / self.NS_IN_MILLIS
+
+			startTime = time.perf_counter_ns()
+
+			dataSet = SensorFleetGenerator(SensorDataGenerator(seed = 42), maxWorkers = workerCount).generateFleetDataSet( \
+				channelSpecs = fleetSpecs, startHour = 0, endHour = 24, useSeconds = False)
+
+			fleetMillis = (time.perf_counter_ns() - startTime) / self.NS_IN_MILLIS
+		finally:
+			logging.disable(logging.NOTSET)
+
+		logging.info( \
+			"\n\tTesting Generate Fleet: channels = %r | single process = %.1f ms | %r worker(s) = %.1f ms", \
+			self.MAX_FLEET_CHANNELS, singleMillis, workerCount, fleetMillis)
+
+		self.assertEqual(dataSet.getChannelCount(), self.MAX_FLEET_CHANNELS)
+
+	@unittest.skipUnless(importlib.util.find_spec('matplotlib'), "matplotlib not installed")
+	def testGenerateGraphFile(self):
+		dataSet = self.dataGenerator.generateDailySensorDataSet(startHour = 0, endHour = SensorDataGenerator.MAX_HOURS, useSeconds = True)
+		tempDir = tempfile.mkdtemp()
+
+		logging.disable(logging.INFO)
+
+		try:
+			# first call includes the matplotlib import and font cache
+			self.dataGenerator.generateGraphFile(dataSet = dataSet, fileName = os.path.join(tempDir, 'warmup.png'))
+
+			results = []
+
+			for downsampleMethod in (None, SensorDataGenerator.LTTB_DOWNSAMPLE, SensorDataGenerator.MIN_MAX_DOWNSAMPLE):
+				for fileExt in ('png', 'svg'):
+					fileName = os.path.join(tempDir, 'graph.' + fileExt)
+					startTime = time.perf_counter_ns()
+
+					self.dataGenerator.generateGraphFile(dataSet = dataSet, fileName = fileName, downsampleMethod = downsampleMethod)
+
+					results.append(( \
+						str(downsampleMethod), fileExt, (time.perf_counter_ns() - startTime) / self.NS_IN_MILLIS, os.path.getsize(fileName) / 1024))
+		finally:
+			logging.disable(logging.NOTSET)
+			shutil.rmtree(tempDir, ignore_errors = True)
+
+		logging.info( \
+			"\n\tTesting Generate Graph File: points = %r%s", dataSet.getDataEntryCount(), \
+			''.join("\n\t  downsample = %-6s | %s | %.1f ms | %.1f KB" % result for result in results))
+
+if __name__ == "__main__":
+	unittest.main()
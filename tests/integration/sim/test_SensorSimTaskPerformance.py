@@ -0,0 +1,87 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import gc
+import logging
+import time
+import unittest
+
+from programmingtheiot.cda.sim.TemperatureSensorSimTask import TemperatureSensorSimTask
+
+class SensorSimTaskPerformanceTest(unittest.TestCase):
+	"""
+	This test case class contains very basic performance tests for
+	the sensor sim tasks, comparing a new SensorData instance per
+	tick against reused (double-buffered) SensorData instances. It
+	should not be considered complete, but serve as a starting point
+	for the student implementing additional functionality within their
+	Programming the IoT environment.
+	"""
+	NS_IN_MILLIS = 1000000
+	NS_IN_SECS = 1000000000
+	MAX_TEST_RUNS = 200000
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.INFO)
+		logging.info("Testing sensor sim task performance...")
+
+	def setUp(self):
+		self.gcPauseNs = 0
+		self.gcStartNs = 0
+
+		gc.callbacks.append(self._trackGcPause)
+
+	def tearDown(self):
+		gc.callbacks.remove(self._trackGcPause)
+
+	def testGenerateTelemetry(self):
+		newRate, newCollections, newPauseMillis = \
+			self._execTestGenerate(TemperatureSensorSimTask(), self.MAX_TEST_RUNS)
+		reuseRate, reuseCollections, reusePauseMillis = \
+			self._execTestGenerate(TemperatureSensorSimTask(reuseSensorData = True), self.MAX_TEST_RUNS)
+
+		logging.info( \
+			"\n\tTesting Generate Telemetry: ticks = %r" \
+			"\n\t  new SensorData per tick: %.0f ticks/sec | GC collections = %r | GC pause = %.2f ms" \
+			"\n\t  reused SensorData:       %.0f ticks/sec | GC collections = %r | GC pause = %.2f ms", \
+			self.MAX_TEST_RUNS, newRate, newCollections, newPauseMillis, reuseRate, reuseCollections, reusePauseMillis)
+
+	def _execTestGenerate(self, simTask, maxTestRuns: int):
+		# exclude the per-tick log records from the measurement
+		logging.disable(logging.INFO)
+
+		try:
+			gc.collect()
+
+			self.gcPauseNs = 0
+			startCollections = sum(stats['collections'] for stats in gc.get_stats())
+			startTime = time.perf_counter_ns()
+
+			for seqNo in range(0, maxTestRuns):
+				simTask.generateTelemetry()
+
+			endTime = time.perf_counter_ns()
+			endCollections = sum(stats['collections'] for stats in gc.get_stats())
+		finally:
+			logging.disable(logging.NOTSET)
+
+		return \
+			maxTestRuns * self.NS_IN_SECS / (endTime - startTime), \
+			endCollections - startCollections, \
+			self.gcPauseNs / self.NS_IN_MILLIS
+
+	def _trackGcPause(self, phase: str, info: dict):
+		if phase == 'start':
+			self.gcStartNs = time.perf_counter_ns()
+		else:
+			self.gcPauseNs += time.perf_counter_ns() - self.gcStartNs
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,84 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import logging
+import os
+import unittest
+
+from programmingtheiot.cda.app.DeviceDataManager import DeviceDataManager
+from programmingtheiot.cda.sim.TelemetryReplayEngine import TelemetryReplayEngine
+
+class TelemetryReplayPerformanceTest(unittest.TestCase):
+	"""
+	This test case class contains very basic performance tests for
+	replaying the simulated test data into DeviceDataManager, both
+	time-compressed and as fast as possible. It should not be considered
+	complete, but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT environment.
+
+	NOTE: Be sure to disable MQTT and CoAP by setting the following flags to False
+	within PiotConfig.props, unless the replay should include the publish path
+	enableMqttClient = False
+	enableCoapClient = False
+
+	"""
+	SIM_TEST_DATA_PATH = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'simTestData')
+	SIM_TEST_DATA_FILES = ( \
+		'PIOT_SimulatedTestData_EnvironmentPressure.json', \
+		'PIOT_SimulatedTestData_IndoorHumidity.json', \
+		'PIOT_SimulatedTestData_IndoorTemperature.json')
+
+	# 1440 readings per file
+	MAX_TEST_RUNS = 4320
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.INFO)
+		logging.info("Testing telemetry replay performance...")
+
+	def setUp(self):
+		self.ddMgr = DeviceDataManager()
+
+	def tearDown(self):
+		pass
+
+	def testReplayTimeCompressed(self):
+		# the recorded 24000 seconds in ~10 seconds
+		self._execTestReplay(2400.0, self.MAX_TEST_RUNS)
+
+	def testReplayAsFastAsPossible(self):
+		self._execTestReplay(TelemetryReplayEngine.AS_FAST_AS_POSSIBLE, self.MAX_TEST_RUNS)
+
+	def _execTestReplay(self, speedFactor: float, maxTestRuns: int):
+		replayEngine = TelemetryReplayEngine(speedFactor = speedFactor, restampData = True)
+		replayEngine.setDataMessageListener(self.ddMgr)
+
+		for fileName in self.SIM_TEST_DATA_FILES:
+			replayEngine.addJsonFile(os.path.join(self.SIM_TEST_DATA_PATH, fileName))
+
+		# exclude DeviceDataManager's per-message log records from the measurement
+		logging.disable(logging.INFO)
+
+		try:
+			stats = replayEngine.replay(maxMessages = maxTestRuns)
+		finally:
+			logging.disable(logging.NOTSET)
+
+		logging.info( \
+			"\n\tTesting Replay Telemetry: speed-up = %r | messages = %r | throughput = %.0f msgs/sec" \
+			"\n\t  handle latency (ms): p50 = %.3f | p99 = %.3f | max = %.3f" \
+			"\n\t  lag latency (ms):    p50 = %.3f | p99 = %.3f | max = %.3f", \
+			speedFactor, stats['messageCount'], stats['throughput'], \
+			stats['handle']['p50'], stats['handle']['p99'], stats['handle']['max'], \
+			stats['lag']['p50'], stats['lag']['p99'], stats['lag']['max'])
+
+		self.assertEqual(stats['messageCount'], maxTestRuns)
+
+if __name__ == "__main__":
+	unittest.main()
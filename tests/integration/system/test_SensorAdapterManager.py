@@ -8,12 +8,18 @@
 # 
 
 import logging
+import threading
+import time
 import unittest
 
 from time import sleep
 
+import programmingtheiot.common.ConfigConst as ConfigConst
+
 from programmingtheiot.common.DefaultDataMessageListener import DefaultDataMessageListener
+from programmingtheiot.cda.sim.BaseSensorSimTask import BaseSensorSimTask
 from programmingtheiot.cda.system.SensorAdapterManager import SensorAdapterManager
+from programmingtheiot.data.SensorData import SensorData
 
 class SensorAdapterManagerTest(unittest.TestCase):
 	"""
@@ -45,6 +51,118 @@ class SensorAdapterManagerTest(unittest.TestCase):
 		sleep(60)
 		
 		self.sensorAdapterMgr.stopManager()
+		
+	def testParallelSensorReads(self):
+		sensorAdapterMgr = SensorAdapterManager()
+		sensorAdapterMgr.setDataMessageListener(self.defaultMsgListener)
+		sensorAdapterMgr.parallelSensorReads = True
+		sensorAdapterMgr.sensorReadTimeout = 0.5
+		
+		sensorAdapterMgr.sensorAdapters = [ \
+			DelayedSensorTask(ConfigConst.HUMIDITY_SENSOR_NAME, delaySecs = 0.3), \
+			DelayedSensorTask(ConfigConst.PRESSURE_SENSOR_NAME, delaySecs = 0.3), \
+			DelayedSensorTask(ConfigConst.TEMP_SENSOR_NAME, delaySecs = 2.0)]
+		
+		sensorDataList = []
+		self.defaultMsgListener.handleSensorMessage = sensorDataList.append
+		
+		try:
+			startTime = time.monotonic()
+			sensorAdapterMgr.handleTelemetry()
+			elapsedSecs = time.monotonic() - startTime
+			
+			# bounded by the timeout, not the sum of all reads
+			self.assertLess(elapsedSecs, 1.0)
+			self.assertEqual(len(sensorDataList), 3)
+			self.assertFalse(sensorDataList[0].hasErrorFlag())
+			self.assertFalse(sensorDataList[1].hasErrorFlag())
+			self.assertTrue(sensorDataList[2].hasErrorFlag())
+			self.assertEqual(sensorDataList[2].getStatusCode(), ConfigConst.SENSOR_READ_TIMEOUT_STATUS)
+			
+			# the hung sensor is skipped, not read again
+			sensorAdapterMgr.handleSensorTelemetry(sensorAdapterMgr.sensorAdapters[2:])
+			
+			self.assertTrue(sensorDataList[3].hasErrorFlag())
+			self.assertEqual(sensorAdapterMgr.sensorAdapters[2].readCount, 1)
+		finally:
+			del self.defaultMsgListener.handleSensorMessage
+			sensorAdapterMgr.stopManager()
+
+	def testStopManagerDuringSensorRead(self):
+		sensorAdapterMgr = SensorAdapterManager()
+		sensorAdapterMgr.setDataMessageListener(self.defaultMsgListener)
+		sensorAdapterMgr.parallelSensorReads = True
+		sensorAdapterMgr.sensorReadTimeout = 2.0
+		
+		delayedTask = DelayedSensorTask(ConfigConst.TEMP_SENSOR_NAME, delaySecs = 1.0)
+		sensorAdapterMgr.sensorAdapters = [delayedTask]
+		
+		sensorDataList = []
+		self.defaultMsgListener.handleSensorMessage = sensorDataList.append
+		
+		try:
+			pollThread = threading.Thread(target = sensorAdapterMgr.handleTelemetry)
+			pollThread.start()
+			
+			# stop while the read is in flight
+			sleep(0.3)
+			
+			self.assertTrue(pollThread.is_alive())
+			
+			sensorAdapterMgr.stopManager()
+			pollThread.join()
+			
+			# the in-flight read completes, but no new executor is created after the stop
+			sensorAdapterMgr.handleTelemetry()
+			
+			self.assertIsNone(sensorAdapterMgr.sensorReadExecutor)
+			self.assertEqual(delayedTask.readCount, 1)
+			self.assertEqual(len(sensorDataList), 2)
+			self.assertFalse(sensorDataList[0].hasErrorFlag())
+			self.assertEqual(sensorDataList[1].getStatusCode(), ConfigConst.SENSOR_READ_FAILED_STATUS)
+		finally:
+			del self.defaultMsgListener.handleSensorMessage
+			sensorAdapterMgr.stopManager()
+		
+	def testBatchDelivery(self):
+		sensorAdapterMgr = SensorAdapterManager()
+		sensorAdapterMgr.setDataMessageListener(self.defaultMsgListener)
+		sensorAdapterMgr.sensorAdapters = [ \
+			DelayedSensorTask(ConfigConst.HUMIDITY_SENSOR_NAME), \
+			DelayedSensorTask(ConfigConst.PRESSURE_SENSOR_NAME), \
+			DelayedSensorTask(ConfigConst.TEMP_SENSOR_NAME)]
+		
+		batches = []
+		self.defaultMsgListener.handleSensorMessages = batches.append
+		
+		try:
+			sensorAdapterMgr.handleTelemetry()
+		finally:
+			del self.defaultMsgListener.handleSensorMessages
+		
+		# one batch per poll cycle
+		self.assertEqual(len(batches), 1)
+		self.assertEqual( \
+			[sensorData.getName() for sensorData in batches[0]], \
+			[ConfigConst.HUMIDITY_SENSOR_NAME, ConfigConst.PRESSURE_SENSOR_NAME, ConfigConst.TEMP_SENSOR_NAME])
+
+class DelayedSensorTask(BaseSensorSimTask):
+	"""
+	Simulates a blocking (e.g. I2C) sensor read.
+	
+	"""
+	
+	def __init__(self, name: str, delaySecs: float = 0.0):
+		super(DelayedSensorTask, self).__init__(name = name)
+		
+		self.delaySecs = delaySecs
+		self.readCount = 0
+		
+	def generateTelemetry(self) -> SensorData:
+		self.readCount += 1
+		sleep(self.delaySecs)
+		
+		return SensorData(name = self.getName())
 
 if __name__ == "__main__":
 	unittest.main()
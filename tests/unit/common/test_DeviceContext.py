@@ -0,0 +1,71 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2025 by Andrew D. King
+#
+
+import logging
+import unittest
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.DeviceContext import DeviceContext
+from programmingtheiot.data.ActuatorData import ActuatorData
+from programmingtheiot.data.SensorData import SensorData
+
+class DeviceContextTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	DeviceContext. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	DEFAULT_LOCATION_ID = "simdevice042"
+	DEFAULT_LAT = 44.98
+	DEFAULT_LON = -93.27
+	DEFAULT_ELEVATION = 264.0
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing DeviceContext class...")
+
+	def setUp(self):
+		self.ctx = DeviceContext( \
+			locationID = self.DEFAULT_LOCATION_ID, latitude = self.DEFAULT_LAT, \
+			longitude = self.DEFAULT_LON, elevation = self.DEFAULT_ELEVATION)
+
+	def tearDown(self):
+		DeviceContext.setCurrent(None)
+
+	def testCurrentContextIsCached(self):
+		self.assertIs(DeviceContext.getCurrent(), DeviceContext.getCurrent())
+
+	def testProcessWideOverride(self):
+		DeviceContext.setCurrent(self.ctx)
+
+		sd = SensorData()
+
+		self.assertEqual(sd.getLocationID(), self.DEFAULT_LOCATION_ID)
+		self.assertEqual(sd.getLatitude(), self.DEFAULT_LAT)
+		self.assertEqual(sd.getLongitude(), self.DEFAULT_LON)
+		self.assertEqual(sd.getElevation(), self.DEFAULT_ELEVATION)
+
+	def testPerObjectOverride(self):
+		ad = ActuatorData(context = self.ctx)
+		sd = SensorData()
+
+		self.assertEqual(ad.getLocationID(), self.DEFAULT_LOCATION_ID)
+		self.assertEqual(ad.getLatitude(), self.DEFAULT_LAT)
+		self.assertNotEqual(sd.getLocationID(), self.DEFAULT_LOCATION_ID)
+
+	def testImmutable(self):
+		with self.assertRaises(AttributeError):
+			self.ctx.locationID = ConfigConst.NOT_SET
+
+if __name__ == "__main__":
+	unittest.main()
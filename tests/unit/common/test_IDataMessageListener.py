@@ -0,0 +1,65 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import logging
+import unittest
+
+from programmingtheiot.common.IDataMessageListener import IDataMessageListener
+from programmingtheiot.data.SensorData import SensorData
+
+class IDataMessageListenerTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	IDataMessageListener. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing IDataMessageListener class...")
+
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+
+	def testHandleSensorMessagesFallback(self):
+		listener = SensorMessageTestListener()
+		dataList = [SensorData(name = 'a'), SensorData(name = 'b'), SensorData(name = 'c')]
+
+		self.assertTrue(listener.handleSensorMessages(dataList))
+		self.assertEqual(listener.sensorDataList, dataList)
+
+		# the batch fails if any item fails, but all items are handled
+		listener.failName = 'b'
+
+		self.assertFalse(listener.handleSensorMessages(dataList))
+		self.assertEqual(len(listener.sensorDataList), 6)
+
+class SensorMessageTestListener(IDataMessageListener):
+	"""
+	Collects the SensorData instances passed to handleSensorMessage().
+
+	"""
+
+	def __init__(self):
+		self.sensorDataList = []
+		self.failName = None
+
+	def handleSensorMessage(self, data: SensorData) -> bool:
+		self.sensorDataList.append(data)
+
+		return data.getName() != self.failName
+
+if __name__ == "__main__":
+	unittest.main()
@@ -67,6 +67,17 @@ class ActuatorDataTest(unittest.TestCase):
 		self.assertEqual(ad.getStateData(), self.DEFAULT_STATE_DATA)
 		self.assertEqual(ad.getValue(), self.DEFAULT_VALUE)
 		
+	def testSlottedRepresentation(self):
+		ad = self._createTestActuatorData()
+		
+		self.assertFalse(hasattr(ad, '__dict__'))
+		
+		adDict = ad.toDict()
+		
+		self.assertEqual(adDict[ConfigConst.COMMAND_PROP], ConfigConst.COMMAND_ON)
+		self.assertEqual(adDict[ConfigConst.STATE_DATA_PROP], self.DEFAULT_STATE_DATA)
+		self.assertFalse(adDict[ConfigConst.IS_RESPONSE_PROP])
+		
 	def _createTestActuatorData(self):
 		ad = ActuatorData()
 		
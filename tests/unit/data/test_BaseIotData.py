@@ -26,6 +26,8 @@ class BaseIotDataTest(unittest.TestCase):
 	DEFAULT_NAME = "TestIotDataSample"
 	DEFAULT_LOCATION_ID = "MyLocation"
 	DEFAULT_STATUS_CODE = 1
+	DEFAULT_TIME_STAMP = "2020-12-27T17:12:40.032631+00:00"
+	DEFAULT_TIME_STAMP_NS = 1609089160032631000
 	
 	@classmethod
 	def setUpClass(self):
@@ -71,6 +73,23 @@ class BaseIotDataTest(unittest.TestCase):
 		self.assertEqual(td.getLocationID(), self.DEFAULT_LOCATION_ID)
 		self.assertEqual(td.getStatusCode(), self.DEFAULT_STATUS_CODE)
 		
+	def testTimeStampRendering(self):
+		td = TestIotData()
+		
+		td.setTimeStampNs(self.DEFAULT_TIME_STAMP_NS)
+		
+		self.assertEqual(td.getTimeStamp(), self.DEFAULT_TIME_STAMP)
+		self.assertIs(td.getTimeStamp(), td.getTimeStamp())
+		
+		td.updateTimeStamp()
+		
+		self.assertGreater(td.getTimeStampNs(), self.DEFAULT_TIME_STAMP_NS)
+		
+		td.setTimeStamp(self.DEFAULT_TIME_STAMP)
+		
+		self.assertEqual(td.getTimeStampNs(), self.DEFAULT_TIME_STAMP_NS)
+		self.assertEqual(td.toDict()[ConfigConst.TIMESTAMP_PROP], self.DEFAULT_TIME_STAMP)
+		
 	def _createTestIotData(self):
 		td = TestIotData()
 		
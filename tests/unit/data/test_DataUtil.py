@@ -7,13 +7,18 @@
 # Copyright (c) 2020 - 2025 by Andrew D. King
 # 
 
+import json
 import logging
 import unittest
 
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.DeviceContext import DeviceContext
 from programmingtheiot.data.DataUtil import DataUtil
 
 from programmingtheiot.data.ActuatorData import ActuatorData
 from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
 from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
 
 class DataUtilTest(unittest.TestCase):
@@ -183,5 +188,174 @@ class DataUtilTest(unittest.TestCase):
 		self.assertEqual(spdObj1.getTimeStamp(), spdObj2.getTimeStamp())
 		self.assertEqual(spdObj1Str, spdObj2Str)
 
+	#@unittest.skip("Ignore for now.")
+	def testCompactJsonConversions(self):
+		logging.info("\n\n----- [Compact JSON Conversions] -----")
+		
+		self.assertEqual(self.dataUtil.iotDataToCompactJson(None), "")
+		self.assertEqual(self.dataUtil.iotDataToCompactJsonBytes(None), b"")
+		
+		stateData = "Heater True, fan False"
+		adObj1 = ActuatorData()
+		adObj1.setName(self.adName)
+		adObj1.setStateData(stateData)
+		
+		adJson  = self.dataUtil.iotDataToCompactJson(adObj1)
+		adBytes = self.dataUtil.iotDataToCompactJsonBytes(adObj1)
+		adObj2  = self.dataUtil.jsonToActuatorData(adJson)
+		
+		logging.info("ActuatorData to compact JSON: " + adJson)
+		
+		self.assertEqual(adJson, json.dumps(adObj1.toDict(), separators = (',', ':')))
+		self.assertEqual(adBytes, adJson.encode('utf-8'))
+		self.assertEqual(json.loads(adJson)['stateData'], stateData)
+		self.assertEqual(adObj1.getName(), adObj2.getName())
+		self.assertEqual(adObj1.getTimeStamp(), adObj2.getTimeStamp())
+		
+		sdObj1 = SensorData()
+		sdObj1.setValue(12.5)
+		
+		sdObj2 = self.dataUtil.jsonToSensorData(self.dataUtil.iotDataToCompactJson(sdObj1))
+		
+		self.assertEqual(sdObj1.getValue(), sdObj2.getValue())
+		
+		spdObj1 = SystemPerformanceData()
+		spdObj1.setCpuUtilization(42.0)
+		
+		spdObj2 = self.dataUtil.jsonToSystemPerformanceData(self.dataUtil.iotDataToCompactJson(spdObj1))
+		
+		self.assertEqual(spdObj1.getCpuUtilization(), spdObj2.getCpuUtilization())
+
+	#@unittest.skip("Ignore for now.")
+	def testJsonBytesConversions(self):
+		logging.info("\n\n----- [JSON Bytes Conversions] -----")
+		
+		self.assertIsNone(self.dataUtil.jsonBytesToActuatorData(None))
+		self.assertIsNone(self.dataUtil.jsonBytesToActuatorData(b""))
+		self.assertIsNone(self.dataUtil.jsonBytesToSensorData(b"[1, 2]"))
+		
+		stateData = "It's True, not False"
+		adObj1 = ActuatorData()
+		adObj1.setName(self.adName)
+		adObj1.setStateData(stateData)
+		
+		adBytes = self.dataUtil.iotDataToCompactJsonBytes(adObj1)
+		adObj2  = self.dataUtil.jsonBytesToActuatorData(adBytes)
+		adObj3  = self.dataUtil.jsonBytesToActuatorData(memoryview(bytearray(adBytes)))
+		
+		for adObj in (adObj2, adObj3):
+			self.assertEqual(adObj1.getName(), adObj.getName())
+			self.assertEqual(adObj1.getStateData(), adObj.getStateData())
+			self.assertEqual(adObj1.getTimeStamp(), adObj.getTimeStamp())
+		
+		sdPyStr = ("{'name': '" + self.sdName + "', 'value': 1.5, 'hasError': False}").encode('utf-8')
+		
+		self.assertIsNone(self.dataUtil.jsonBytesToSensorData(sdPyStr))
+		self.assertIsNone(self.dataUtil.jsonBytesToSensorData(b"not json"))
+		self.assertIsNone(self.dataUtil.jsonBytesToSensorData(b"\xff\xfe"))
+		self.assertIsNone(self.dataUtil.jsonBytesToSensorData(b"not json", lenient = True))
+		
+		sdObj = self.dataUtil.jsonBytesToSensorData(sdPyStr, lenient = True)
+		
+		self.assertEqual(sdObj.getName(), self.sdName)
+		self.assertEqual(sdObj.getValue(), 1.5)
+		
+		spdObj1 = SystemPerformanceData()
+		spdObj1.setMemoryUtilization(12.0)
+		
+		spdObj2 = self.dataUtil.jsonBytesToSystemPerformanceData(self.dataUtil.iotDataToCompactJsonBytes(spdObj1))
+		
+		self.assertEqual(spdObj1.getMemoryUtilization(), spdObj2.getMemoryUtilization())
+
+	#@unittest.skip("Ignore for now.")
+	def testBinaryConversions(self):
+		logging.info("\n\n----- [Binary Conversions] -----")
+		
+		self.assertEqual(self.dataUtil.iotDataToBinary(None), b"")
+		self.assertIsNone(self.dataUtil.binaryToIotData(None))
+		
+		adObj1 = ActuatorData()
+		adObj1.setName(self.adName)
+		adObj1.setStateData("Température OK")
+		adObj1.setCommand(1)
+		adObj1.setValue(22.5)
+		adObj1.setAsResponse()
+		
+		sdObj1 = SensorData()
+		sdObj1.setName(self.sdName)
+		sdObj1.setValue(21.7)
+		sdObj1.setStatusCode(-1)
+		
+		spdObj1 = SystemPerformanceData()
+		spdObj1.setCpuUtilization(12.5)
+		spdObj1.setMemoryUtilization(42.0)
+		
+		for obj1 in (adObj1, sdObj1, spdObj1):
+			payload = self.dataUtil.iotDataToBinary(obj1)
+			obj2    = self.dataUtil.binaryToIotData(memoryview(payload))
+			
+			logging.info("%s to binary: %d bytes (JSON: %d bytes)", type(obj1).__name__, len(payload), len(self.dataUtil.iotDataToCompactJson(obj1)))
+			
+			self.assertTrue(self.dataUtil.isBinaryPayload(payload))
+			self.assertIs(type(obj1), type(obj2))
+			self.assertEqual(obj1.toDict(), obj2.toDict())
+		
+		adObj2 = self.dataUtil.payloadToActuatorData(self.dataUtil.iotDataToPayload(adObj1, ConfigConst.BINARY_PAYLOAD_FORMAT))
+		adObj3 = self.dataUtil.payloadToActuatorData(self.dataUtil.iotDataToPayload(adObj1, ConfigConst.JSON_PAYLOAD_FORMAT))
+		
+		self.assertEqual(adObj1.getStateData(), adObj2.getStateData())
+		self.assertEqual(adObj1.getStateData(), adObj3.getStateData())
+		self.assertIsNone(self.dataUtil.payloadToActuatorData(self.dataUtil.iotDataToBinary(sdObj1)))
+		self.assertFalse(self.dataUtil.isBinaryPayload(self.dataUtil.iotDataToCompactJsonBytes(sdObj1)))
+		
+		with self.assertRaises(ValueError):
+			self.dataUtil.binaryToIotData(b"{}")
+	
+	def testSensorDataBatchConversions(self):
+		logging.info("\n\n----- [SensorDataBatch Conversions] -----")
+		
+		ctx = DeviceContext(locationID = "simdevice042", latitude = 44.98, longitude = -93.27, elevation = 264.0)
+		
+		dataList = []
+		
+		for i, name in enumerate((ConfigConst.HUMIDITY_SENSOR_NAME, ConfigConst.PRESSURE_SENSOR_NAME, ConfigConst.TEMP_SENSOR_NAME)):
+			sd = SensorData(name = name, typeID = i, context = ctx)
+			sd.setValue(10.5 * i)
+			sd.setStatusCode(-i)
+			dataList.append(sd)
+		
+		# flagged as an error, but with a non-negative status code
+		dataList[0].hasError = True
+		
+		batch = SensorDataBatch.fromSensorDataList(dataList, context = ctx)
+		
+		self.assertEqual(self.dataUtil.sensorDataBatchToJson(None), "")
+		self.assertEqual(self.dataUtil.sensorDataBatchToBinary(SensorDataBatch(context = ctx)), b"")
+		
+		for payloadFormat in (ConfigConst.JSON_PAYLOAD_FORMAT, ConfigConst.BINARY_PAYLOAD_FORMAT):
+			payload = self.dataUtil.sensorDataBatchToPayload(batch, payloadFormat)
+			batch2  = self.dataUtil.payloadToSensorDataBatch(payload)
+			
+			logging.info("SensorDataBatch to %s: %d bytes", payloadFormat, len(payload))
+			
+			self.assertEqual(len(batch2), len(batch))
+			self.assertEqual(batch2.getContext().getLocationID(), ctx.getLocationID())
+			self.assertEqual(batch2.getContext().getElevation(), ctx.getElevation())
+			
+			for sd1, sd2 in zip(dataList, batch2.toSensorDataList()):
+				self.assertEqual(sd1.getName(), sd2.getName())
+				self.assertEqual(sd1.getTypeID(), sd2.getTypeID())
+				self.assertEqual(sd1.getValue(), sd2.getValue())
+				self.assertEqual(sd1.getStatusCode(), sd2.getStatusCode())
+				self.assertEqual(sd1.hasErrorFlag(), sd2.hasErrorFlag())
+				self.assertEqual(sd1.getTimeStampNs() // 1000, sd2.getTimeStampNs() // 1000)
+				self.assertEqual(sd1.getLatitude(), sd2.getLatitude())
+		
+		# the location ID is written once per envelope, not once per reading
+		self.assertEqual(self.dataUtil.sensorDataBatchToJson(batch).count(ctx.getLocationID()), 1)
+		
+		with self.assertRaises(ValueError):
+			self.dataUtil.binaryToSensorDataBatch(self.dataUtil.iotDataToBinary(dataList[0]))
+
 if __name__ == "__main__":
 	unittest.main()
@@ -63,6 +63,31 @@ class SensorDataTest(unittest.TestCase):
 		self.assertEqual(sd.getName(), self.DEFAULT_NAME)
 		self.assertEqual(sd.getValue(), self.MIN_VALUE)
 	
+	def testSlottedRepresentation(self):
+		sd = self._createTestSensorData()
+		
+		self.assertFalse(hasattr(sd, '__dict__'))
+		
+		sdDict = sd.toDict()
+		
+		self.assertEqual(sdDict[ConfigConst.NAME_PROP], self.DEFAULT_NAME)
+		self.assertEqual(sdDict[ConfigConst.VALUE_PROP], self.MIN_VALUE)
+		self.assertEqual(list(sdDict.keys()), list(SensorData.getPropertyNames()))
+	
+	def testCopy(self):
+		sd = self._createTestSensorData()
+		sd.setStatusCode(-1)
+		
+		sd2 = sd.copy()
+		
+		self.assertIsNot(sd, sd2)
+		self.assertEqual(sd.toDict(), sd2.toDict())
+		self.assertEqual(sd.getTimeStampNs(), sd2.getTimeStampNs())
+		
+		sd.setValue(self.MAX_VALUE)
+		
+		self.assertEqual(sd2.getValue(), self.MIN_VALUE)
+	
 	def _createTestSensorData(self):
 		sd = SensorData()
 		
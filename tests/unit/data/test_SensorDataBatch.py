@@ -0,0 +1,95 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import logging
+import unittest
+
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
+
+class SensorDataBatchTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SensorDataBatch. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	DEFAULT_COUNT = 10
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SensorDataBatch class...")
+
+	def setUp(self):
+		self.dataList = []
+
+		for i in range(0, self.DEFAULT_COUNT):
+			name = ConfigConst.TEMP_SENSOR_NAME if i % 2 == 0 else ConfigConst.HUMIDITY_SENSOR_NAME
+			typeID = ConfigConst.TEMP_SENSOR_TYPE if i % 2 == 0 else ConfigConst.HUMIDITY_SENSOR_TYPE
+
+			sd = SensorData(typeID = typeID, name = name)
+			sd.setValue(float(i))
+			sd.setStatusCode(i)
+
+			self.dataList.append(sd)
+
+	def tearDown(self):
+		pass
+
+	def testRoundTrip(self):
+		batch = SensorDataBatch.fromSensorDataList(self.dataList)
+
+		self.assertEqual(len(batch), self.DEFAULT_COUNT)
+		self.assertEqual(len(batch.getNames()), 2)
+
+		for sd1, sd2 in zip(self.dataList, batch.toSensorDataList()):
+			self.assertEqual(sd1.getName(), sd2.getName())
+			self.assertEqual(sd1.getTypeID(), sd2.getTypeID())
+			self.assertEqual(sd1.getValue(), sd2.getValue())
+			self.assertEqual(sd1.getStatusCode(), sd2.getStatusCode())
+			self.assertEqual(sd1.getTimeStampNs(), sd2.getTimeStampNs())
+			self.assertEqual(sd1.getLocationID(), sd2.getLocationID())
+
+	def testSliceWithoutCopy(self):
+		batch = SensorDataBatch.fromSensorDataList(self.dataList)
+		subBatch = batch[2:6]
+
+		self.assertEqual(len(subBatch), 4)
+		self.assertTrue(calcLib.shares_memory(subBatch.getValues(), batch.getValues()))
+		self.assertEqual(subBatch.getName(0), batch.getName(2))
+		self.assertEqual(subBatch[1].getValue(), self.dataList[3].getValue())
+
+	def testErrorFlags(self):
+		# flagged as an error, but with a non-negative status code
+		self.dataList[2].hasError = True
+
+		batch = SensorDataBatch.fromSensorDataList(self.dataList)
+
+		self.assertEqual(batch.getErrorFlags().tolist(), [i == 2 for i in range(0, self.DEFAULT_COUNT)])
+		self.assertTrue(batch[2].hasErrorFlag())
+		self.assertTrue(batch[2:4].toSensorDataList()[0].hasErrorFlag())
+		self.assertFalse(batch[3].hasErrorFlag())
+
+		# without error flags, they're derived from the status codes
+		batch = SensorDataBatch(nameCodes = [0, 0], names = ['a'], typeIDs = [1, 1], values = [1.0, 2.0], statusCodes = [0, -1], timeStampsNs = [0, 0])
+
+		self.assertEqual(batch.getErrorFlags().tolist(), [False, True])
+
+	def testMismatchedArrays(self):
+		with self.assertRaises(ValueError):
+			SensorDataBatch(nameCodes = [0, 0], names = ['a'], typeIDs = [1], values = [1.0, 2.0], statusCodes = [0, 0], timeStampsNs = [0, 0])
+
+if __name__ == "__main__":
+	unittest.main()
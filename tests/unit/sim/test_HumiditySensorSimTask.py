@@ -13,6 +13,7 @@ import unittest
 import programmingtheiot.common.ConfigConst as ConfigConst
 
 from programmingtheiot.cda.sim.HumiditySensorSimTask import HumiditySensorSimTask
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
 
 class HumiditySensorSimTaskTest(unittest.TestCase):
 	"""
@@ -49,6 +50,19 @@ class HumiditySensorSimTaskTest(unittest.TestCase):
 		logging.info("Humidity data: %f", val)
 		self.assertGreater(val, ConfigConst.DEFAULT_VAL)
 
+	def testGenerateTelemetryFromDataSet(self):
+		dataSet = SensorDataGenerator(seed = 42).generateDailyEnvironmentHumidityDataSet()
+		
+		# steps through the data set one entry per call, with and without reused instances
+		for taskDataSet, reuseSensorData in ((dataSet, False), (dataSet, True), (dataSet.toCompact(), True)):
+			simTask = HumiditySensorSimTask(dataSet = taskDataSet, reuseSensorData = reuseSensorData, useTimeIndex = False)
+			
+			for index in range(0, 5):
+				sd = simTask.generateTelemetry()
+				
+				self.assertEqual(sd.getName(), ConfigConst.HUMIDITY_SENSOR_NAME)
+				self.assertEqual(sd.getValue(), taskDataSet.getDataEntry(index))
+
 if __name__ == "__main__":
 	unittest.main()
 	
\ No newline at end of file
@@ -0,0 +1,265 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import importlib.util
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as calcLib
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorChannelSpec
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataSet
+from programmingtheiot.cda.sim.SensorDataGenerator import downsampleLttb
+from programmingtheiot.cda.sim.SensorDataGenerator import downsampleMinMax
+
+class SensorDataGeneratorTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SensorDataGenerator. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	CURVE_TYPES = ( \
+		SensorDataGenerator.FULL_WAVE, SensorDataGenerator.BELL_CURVE, SensorDataGenerator.INVERSE_CURVE, \
+		SensorDataGenerator.CURVE_UP, SensorDataGenerator.CURVE_DOWN)
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SensorDataGenerator class...")
+
+	def setUp(self):
+		self.dataGenerator = SensorDataGenerator()
+
+	def tearDown(self):
+		pass
+
+	def testMultiChannelMatchesSingleChannel(self):
+		for alignGeneratorToDay in (True, False):
+			self.dataGenerator.alignGeneratorToDay = alignGeneratorToDay
+
+			channelSpecs = [ \
+				SensorChannelSpec(name = str(curveType), curveType = curveType, noiseLevel = SensorDataGenerator.NO_NOISE, minValue = 10.0, maxValue = 20.0) \
+				for curveType in self.CURVE_TYPES]
+
+			multiDataSet = self.dataGenerator.generateMultiChannelDataSet(channelSpecs = channelSpecs, startHour = 0, endHour = 24)
+
+			self.assertEqual(multiDataSet.getChannelCount(), len(channelSpecs))
+
+			for spec in channelSpecs:
+				dataSet = self.dataGenerator.generateDailySensorDataSet( \
+					curveType = spec.curveType, noiseLevel = spec.noiseLevel, \
+					minValue = spec.minValue, maxValue = spec.maxValue, startHour = 0, endHour = 24)
+
+				channelDataSet = multiDataSet.getChannelDataSet(spec.name)
+
+				self.assertEqual(channelDataSet.getDataEntryCount(), dataSet.getDataEntryCount())
+				self.assertTrue(calcLib.array_equal(channelDataSet.getTimeEntries(), dataSet.getTimeEntries()))
+				self.assertTrue(calcLib.allclose(channelDataSet.getDataEntries(), dataSet.getDataEntries()))
+
+	def testOutOfRangeHours(self):
+		# out of range hours are clamped the same way for single and multi-channel data sets
+		for startHour, endHour, expectedEntries in ((-1, 12, (0, 12)), (SensorDataGenerator.MAX_HOURS + 1, 12, (0, 12)), (20, 12, (12, 12))):
+			dataSet = self.dataGenerator.generateDailySensorDataSet(noiseLevel = SensorDataGenerator.NO_NOISE, startHour = startHour, endHour = endHour)
+			timeEntries = self.dataGenerator.generateTimeEntries(startHour = startHour, endHour = endHour)
+
+			self.assertEqual((timeEntries[0], timeEntries[-1]), expectedEntries)
+			self.assertTrue(calcLib.array_equal(dataSet.getTimeEntries(), timeEntries))
+
+	def testChannelSpecsMatchDailyDataSets(self):
+		noNoise = SensorDataGenerator.NO_NOISE
+		lowPressure = SensorDataGenerator.LOW_NORMAL_ENV_PRESSURE
+
+		# as configured by default (pressure floor = ceiling), and out of range
+		for humidityRange, pressureRange, tempRange in ( \
+			((35.0, 45.0), (lowPressure, lowPressure), (15.0, 25.0)), \
+			((-10.0, 150.0), (2000.0, 100.0), (30.0, 20.0))):
+			dataGenerator = SensorDataGenerator(seed = 42)
+
+			channelSpecs = [ \
+				dataGenerator.createEnvironmentHumidityChannelSpec(name = 'humidity', noiseLevel = noNoise, minValue = humidityRange[0], maxValue = humidityRange[1]), \
+				dataGenerator.createEnvironmentPressureChannelSpec(name = 'pressure', noiseLevel = noNoise, minValue = pressureRange[0], maxValue = pressureRange[1]), \
+				dataGenerator.createIndoorTemperatureChannelSpec(name = 'temp', noiseLevel = noNoise, minValue = tempRange[0], maxValue = tempRange[1])]
+
+			multiDataSet = dataGenerator.generateMultiChannelDataSet(channelSpecs = channelSpecs, startHour = 0, endHour = 24)
+
+			dataGenerator = SensorDataGenerator(seed = 42)
+
+			dataSets = { \
+				'humidity': dataGenerator.generateDailyEnvironmentHumidityDataSet(noiseLevel = noNoise, minValue = humidityRange[0], maxValue = humidityRange[1]), \
+				'pressure': dataGenerator.generateDailyEnvironmentPressureDataSet(noiseLevel = noNoise, minValue = pressureRange[0], maxValue = pressureRange[1]), \
+				'temp': dataGenerator.generateDailyIndoorTemperatureDataSet(noiseLevel = noNoise, minValue = tempRange[0], maxValue = tempRange[1])}
+
+			for name, dataSet in dataSets.items():
+				channelEntries = multiDataSet.getChannelDataSet(name).getDataEntries()
+
+				self.assertTrue(calcLib.allclose(channelEntries, dataSet.getDataEntries()))
+				self.assertGreater(channelEntries.max() - channelEntries.min(), 0.5)
+
+		# a floor equal to the ceiling is moved below it
+		pressureSpec = dataGenerator.createEnvironmentPressureChannelSpec(minValue = lowPressure, maxValue = lowPressure)
+
+		self.assertEqual((pressureSpec.minValue, pressureSpec.maxValue), (lowPressure - 1, lowPressure))
+
+	def testMultiChannelNoise(self):
+		channelSpecs = [ \
+			SensorChannelSpec(minValue = SensorDataGenerator.LOW_NORMAL_INDOOR_TEMP, maxValue = SensorDataGenerator.HI_NORMAL_INDOOR_TEMP), \
+			SensorChannelSpec(noiseLevel = SensorDataGenerator.NO_NOISE, minValue = SensorDataGenerator.LOW_NORMAL_ENV_PRESSURE, maxValue = SensorDataGenerator.HI_NORMAL_ENV_PRESSURE)]
+
+		multiDataSet = self.dataGenerator.generateMultiChannelDataSet(channelSpecs = channelSpecs, startHour = 0, endHour = 24)
+
+		noisyEntries = multiDataSet.getChannelDataSet(0).getDataEntries()
+		cleanEntries = multiDataSet.getChannelDataSet(1).getDataEntries()
+
+		self.assertEqual(multiDataSet.getDataEntries().shape, (2, 24 * 60))
+		self.assertAlmostEqual(cleanEntries.min(), SensorDataGenerator.LOW_NORMAL_ENV_PRESSURE)
+		self.assertAlmostEqual(cleanEntries.max(), SensorDataGenerator.HI_NORMAL_ENV_PRESSURE)
+		self.assertLess(noisyEntries.min(), SensorDataGenerator.LOW_NORMAL_INDOOR_TEMP)
+
+	def testChunkedMatchesDataSet(self):
+		for curveType in self.CURVE_TYPES:
+			dataSet = SensorDataGenerator(seed = curveType + 100).generateDailySensorDataSet( \
+				curveType = curveType, minValue = 10.0, maxValue = 20.0, startHour = 0, endHour = 24)
+
+			chunks = list(SensorDataGenerator(seed = curveType + 100).generateDailySensorDataChunks( \
+				curveType = curveType, minValue = 10.0, maxValue = 20.0, startHour = 0, endHour = 24, chunkSize = 100))
+
+			self.assertEqual(len(chunks), 15)
+			self.assertTrue(all(timeEntries.size <= 100 for timeEntries, dataEntries in chunks))
+			self.assertTrue(calcLib.array_equal(calcLib.concatenate([c[0] for c in chunks]), dataSet.getTimeEntries()))
+			self.assertTrue(calcLib.array_equal(calcLib.concatenate([c[1] for c in chunks]), dataSet.getDataEntries()))
+
+	def testSeededReproducibility(self):
+		channelSpecs = [SensorChannelSpec(name = str(i)) for i in range(0, 3)]
+
+		dataSet1 = SensorDataGenerator(seed = 42).generateMultiChannelDataSet(channelSpecs = channelSpecs, startHour = 0, endHour = 24)
+		dataSet2 = SensorDataGenerator(seed = 42).generateMultiChannelDataSet(channelSpecs = channelSpecs, startHour = 0, endHour = 24)
+		dataSet3 = SensorDataGenerator(seed = 43).generateMultiChannelDataSet(channelSpecs = channelSpecs, startHour = 0, endHour = 24)
+
+		self.assertTrue(calcLib.array_equal(dataSet1.getDataEntries(), dataSet2.getDataEntries()))
+		self.assertFalse(calcLib.array_equal(dataSet1.getDataEntries(), dataSet3.getDataEntries()))
+
+	def testSpawn(self):
+		children1 = SensorDataGenerator(seed = 42).spawn(3)
+		children2 = SensorDataGenerator(seed = 42).spawn(3)
+
+		dataEntries1 = [child.generateDailySensorDataSet(startHour = 0, endHour = 24).getDataEntries() for child in children1]
+		dataEntries2 = [child.generateDailySensorDataSet(startHour = 0, endHour = 24).getDataEntries() for child in children2]
+
+		# each child stream is reproducible, and independent of its siblings
+		for i in range(0, 3):
+			self.assertTrue(calcLib.array_equal(dataEntries1[i], dataEntries2[i]))
+
+		self.assertFalse(calcLib.array_equal(dataEntries1[0], dataEntries1[1]))
+		self.assertFalse(calcLib.array_equal(dataEntries1[1], dataEntries1[2]))
+
+	def testCompactDataSet(self):
+		dataSet = self.dataGenerator.generateDailySensorDataSet( \
+			minValue = SensorDataGenerator.LOW_NORMAL_ENV_PRESSURE, maxValue = SensorDataGenerator.HI_NORMAL_ENV_PRESSURE, startHour = 0, endHour = 24)
+		compactSet = dataSet.toCompact()
+
+		self.assertTrue(compactSet.isCompact())
+		self.assertEqual(compactSet.getDataEntries().dtype, calcLib.float32)
+		self.assertLessEqual(compactSet.getStorageSize() * 2, dataSet.getStorageSize())
+		self.assertEqual(compactSet.getDataEntryCount(), dataSet.getDataEntryCount())
+		self.assertTrue(calcLib.allclose(compactSet.getTimeEntries(), dataSet.getTimeEntries(), rtol = 0.0, atol = 1e-9))
+
+		# getTimeEntry() / getDataEntry() keep their semantics, including out of range indexes
+		for index in (0, 1, 100, dataSet.getDataEntryCount() - 1, -1, dataSet.getDataEntryCount()):
+			self.assertAlmostEqual(compactSet.getTimeEntry(index), dataSet.getTimeEntry(index))
+			self.assertAlmostEqual(compactSet.getDataEntry(index), dataSet.getDataEntry(index), delta = SensorDataSet.DEFAULT_FLOAT32_TOLERANCE)
+			self.assertIsInstance(compactSet.getDataEntry(index), float)
+
+	def testCompactMultiChannelDataSet(self):
+		channelSpecs = [SensorChannelSpec(name = str(i)) for i in range(0, 3)]
+
+		compactSet = self.dataGenerator.generateMultiChannelDataSet(channelSpecs = channelSpecs, startHour = 0, endHour = 24).toCompact()
+		channelSet = compactSet.getChannelDataSet('1')
+
+		self.assertEqual(compactSet.getChannelNames(), ['0', '1', '2'])
+		self.assertTrue(channelSet.isCompact())
+		self.assertEqual(channelSet.getDataEntries().dtype, calcLib.float32)
+
+		# precision doesn't allow float32 - keep float64
+		self.assertEqual(self.dataGenerator.generateMultiChannelDataSet(channelSpecs = channelSpecs).toCompact(tolerance = 0.0).getDataEntries().dtype, calcLib.float64)
+
+	def testDataEntryAtTime(self):
+		epochOffset = 1000.0
+		dataGenerator = SensorDataGenerator(epochOffsetSeconds = epochOffset, useCurrentTime = False)
+
+		dataSet = dataGenerator.generateDailySensorDataSet(startHour = 0, endHour = 24)
+		stepSeconds = (dataSet.getTimeEntry(1) - dataSet.getTimeEntry(0)) * SensorDataSet.TIME_ENTRY_UNIT_SECONDS
+		periodSeconds = stepSeconds * (dataSet.getDataEntryCount() - 1)
+
+		for compactSet in (dataSet, dataSet.toCompact(useFloat32 = False)):
+			self.assertAlmostEqual(compactSet.getDataEntryAtTime(epochOffset), dataSet.getDataEntry(0))
+			self.assertAlmostEqual(compactSet.getDataEntryAtTime(epochOffset + stepSeconds * 5), dataSet.getDataEntry(5))
+			self.assertAlmostEqual( \
+				compactSet.getDataEntryAtTime(epochOffset + stepSeconds * 5.5), (dataSet.getDataEntry(5) + dataSet.getDataEntry(6)) / 2)
+
+			# repeats once the last time entry is reached
+			self.assertAlmostEqual(compactSet.getDataEntryAtTime(epochOffset + periodSeconds + stepSeconds * 5), dataSet.getDataEntry(5))
+
+		channelSpecs = [SensorChannelSpec(name = str(i), curveType = curveType) for i, curveType in enumerate(self.CURVE_TYPES)]
+		multiDataSet = dataGenerator.generateMultiChannelDataSet(channelSpecs = channelSpecs, startHour = 0, endHour = 24)
+
+		self.assertTrue(calcLib.allclose(multiDataSet.getDataEntryAtTime(epochOffset + stepSeconds * 7), multiDataSet.getDataEntries()[:, 7]))
+
+	def testDownsampleLttb(self):
+		xValues = calcLib.arange(10000, dtype = calcLib.float64)
+		yValues = calcLib.sin(xValues / 500)
+		yValues[1234] = 5.0
+
+		xSampled, ySampled = downsampleLttb(xValues, yValues, 200)
+
+		self.assertEqual(xSampled.size, 200)
+		self.assertEqual((xSampled[0], xSampled[-1]), (xValues[0], xValues[-1]))
+		self.assertTrue(calcLib.all(calcLib.diff(xSampled) > 0))
+		self.assertIn(1234.0, xSampled)
+		self.assertTrue(calcLib.array_equal(ySampled, yValues[xSampled.astype(int)]))
+
+		# nothing to do
+		self.assertEqual(downsampleLttb(xValues[:100], yValues[:100], 200)[1].size, 100)
+
+	def testDownsampleMinMax(self):
+		xValues = calcLib.arange(10001, dtype = calcLib.float64)
+		yValues = calcLib.sin(xValues / 500)
+		yValues[1234] = 5.0
+		yValues[9999] = -5.0
+
+		xSampled, ySampled = downsampleMinMax(xValues, yValues, 200)
+
+		self.assertLessEqual(xSampled.size, 200)
+		self.assertTrue(calcLib.all(calcLib.diff(xSampled) > 0))
+		self.assertIn(1234.0, xSampled)
+		self.assertIn(9999.0, xSampled)
+
+	@unittest.skipUnless(importlib.util.find_spec('matplotlib'), "matplotlib not installed")
+	def testGenerateGraphFile(self):
+		tempDir = tempfile.mkdtemp()
+
+		try:
+			dataSet = self.dataGenerator.generateDailySensorDataSet(useSeconds = True)
+
+			for fileName in ('graph.png', 'graph.svg'):
+				fileName = os.path.join(tempDir, fileName)
+
+				self.dataGenerator.generateGraphFile(dataSet = dataSet, fileName = fileName, chartTitle = "Week")
+
+				self.assertGreater(os.path.getsize(fileName), 0)
+		finally:
+			shutil.rmtree(tempDir, ignore_errors = True)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,104 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import json
+import logging
+import unittest
+
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataSet
+from programmingtheiot.cda.sim.SensorDataPayloadCache import SensorDataPayloadCache
+from programmingtheiot.data.DataUtil import DataUtil
+from programmingtheiot.data.SensorData import SensorData
+
+class SensorDataPayloadCacheTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SensorDataPayloadCache. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SensorDataPayloadCache class...")
+
+		self.dataUtil = DataUtil()
+
+	def setUp(self):
+		self.dataSet = SensorDataGenerator(seed = 42).generateDailyIndoorTemperatureDataSet()
+
+		self.sensorData = SensorData(typeID = ConfigConst.TEMP_SENSOR_TYPE, name = ConfigConst.TEMP_SENSOR_NAME)
+		self.sensorData.setStatusCode(3)
+
+	def tearDown(self):
+		pass
+
+	def testPayloadsMatchCompactJson(self):
+		payloadCache = SensorDataPayloadCache(dataSet = self.dataSet, sensorData = self.sensorData)
+
+		self.assertEqual(payloadCache.getPayloadCount(), self.dataSet.getDataEntryCount())
+
+		for index in (0, 1, 500, self.dataSet.getDataEntryCount() - 1):
+			self.sensorData.setValue(self.dataSet.getDataEntry(index))
+
+			timeStamp = payloadCache.renderTimeStamp()
+			expectedPayload = \
+				self.dataUtil.iotDataToCompactJsonBytes(self.sensorData) \
+					.replace(json.dumps(self.sensorData.getTimeStamp()).encode('ascii'), timeStamp, 1)
+
+			self.assertEqual(payloadCache.getPayload(index, timeStamp), expectedPayload)
+
+		# wraps around
+		self.assertEqual(payloadCache.getPayload(self.dataSet.getDataEntryCount(), timeStamp), payloadCache.getPayload(0, timeStamp))
+
+	def testCompactDataSet(self):
+		compactDataSet = self.dataSet.toCompact()
+
+		self.assertEqual(compactDataSet.getDataEntries().dtype, calcLib.float32)
+
+		payloadCache = SensorDataPayloadCache(dataSet = compactDataSet, sensorData = self.sensorData)
+		timeStamp = payloadCache.renderTimeStamp()
+
+		for index in (0, 1, 500):
+			self.sensorData.setValue(compactDataSet.getDataEntry(index))
+
+			expectedPayload = \
+				self.dataUtil.iotDataToCompactJsonBytes(self.sensorData) \
+					.replace(json.dumps(self.sensorData.getTimeStamp()).encode('ascii'), timeStamp, 1)
+
+			self.assertEqual(payloadCache.getPayload(index, timeStamp), expectedPayload)
+
+	def testDecodePayload(self):
+		payloadCache = SensorDataPayloadCache(dataSet = self.dataSet, sensorData = self.sensorData)
+
+		sensorData = self.dataUtil.jsonBytesToSensorData(payloadCache.getPayload(10, payloadCache.renderTimeStamp(1700000000.5)))
+
+		self.assertEqual(sensorData.getValue(), self.dataSet.getDataEntry(10))
+		self.assertEqual(sensorData.getName(), ConfigConst.TEMP_SENSOR_NAME)
+		self.assertEqual(sensorData.getStatusCode(), 3)
+		self.assertEqual(sensorData.getTimeStamp(), '2023-11-14T22:13:20.500000+00:00')
+
+	def testNonFiniteValues(self):
+		dataSet = SensorDataSet(timeEntries = calcLib.arange(3.0), dataEntries = calcLib.array([calcLib.nan, calcLib.inf, 1.5]))
+		payloadCache = SensorDataPayloadCache(dataSet = dataSet)
+
+		values = [json.loads(payloadCache.getPayload(i))[ConfigConst.VALUE_PROP] for i in range(0, 3)]
+
+		self.assertTrue(calcLib.isnan(values[0]))
+		self.assertEqual(values[1:], [calcLib.inf, 1.5])
+
+if __name__ == "__main__":
+	unittest.main()
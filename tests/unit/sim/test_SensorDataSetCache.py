@@ -0,0 +1,102 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as calcLib
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorChannelSpec
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorDataSetCache import SensorDataSetCache
+
+class SensorDataSetCacheTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SensorDataSetCache. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SensorDataSetCache class...")
+
+	def setUp(self):
+		self.cachePath = tempfile.mkdtemp()
+		self.cache = SensorDataSetCache(self.cachePath)
+
+		self.channelSpecs = [ \
+			SensorChannelSpec(name = 'humidity', curveType = SensorDataGenerator.DEFAULT_HUMIDITY_CURVE), \
+			SensorChannelSpec(name = 'temp', curveType = SensorDataGenerator.DEFAULT_TEMP_CURVE)]
+
+	def tearDown(self):
+		shutil.rmtree(self.cachePath, ignore_errors = True)
+
+	def testCachedDataSet(self):
+		dataSet = SensorDataGenerator(seed = 42).generateMultiChannelDataSet(channelSpecs = self.channelSpecs, startHour = 0, endHour = 24)
+
+		storedDataSet = self.cache.getMultiChannelDataSet(SensorDataGenerator(seed = 42), channelSpecs = self.channelSpecs, startHour = 0, endHour = 24)
+		cachedDataSet = self.cache.getMultiChannelDataSet(SensorDataGenerator(seed = 42), channelSpecs = self.channelSpecs, startHour = 0, endHour = 24)
+
+		self.assertIsInstance(cachedDataSet.getDataEntries(), calcLib.memmap)
+		self.assertFalse(cachedDataSet.getDataEntries().flags.writeable)
+		self.assertEqual(cachedDataSet.getChannelNames(), ['humidity', 'temp'])
+
+		for cachedSet in (storedDataSet, cachedDataSet):
+			self.assertTrue(calcLib.array_equal(cachedSet.getTimeEntries(), dataSet.getTimeEntries()))
+			self.assertTrue(calcLib.array_equal(cachedSet.getDataEntries(), dataSet.getDataEntries()))
+
+		self.assertTrue(calcLib.array_equal( \
+			cachedDataSet.getChannelDataSet('temp').getDataEntries(), dataSet.getChannelDataSet('temp').getDataEntries()))
+
+	def testSuccessiveDataSets(self):
+		# two data sets in a row from the same generator, with and without the cache
+		dataGenerator = SensorDataGenerator(seed = 42)
+		dataSets = [dataGenerator.generateMultiChannelDataSet(channelSpecs = self.channelSpecs, startHour = 0, endHour = 24) for _ in range(2)]
+		nextValue = dataGenerator.rng.random()
+
+		for _ in range(2):
+			cachedGenerator = SensorDataGenerator(seed = 42)
+			cachedDataSets = [self.cache.getMultiChannelDataSet(cachedGenerator, channelSpecs = self.channelSpecs, startHour = 0, endHour = 24) for _ in range(2)]
+
+			self.assertFalse(calcLib.array_equal(cachedDataSets[0].getDataEntries(), cachedDataSets[1].getDataEntries()))
+
+			for dataSet, cachedDataSet in zip(dataSets, cachedDataSets):
+				self.assertTrue(calcLib.array_equal(cachedDataSet.getDataEntries(), dataSet.getDataEntries()))
+
+			# a hit leaves the generator where a miss would have
+			self.assertEqual(cachedGenerator.rng.random(), nextValue)
+
+	def testCacheKey(self):
+		key = self.cache.getCacheKey(SensorDataGenerator(seed = 42), self.channelSpecs, 0, 24, False)
+
+		self.assertEqual(key, self.cache.getCacheKey(SensorDataGenerator(seed = 42), self.channelSpecs, 0, 24, False))
+		self.assertNotEqual(key, self.cache.getCacheKey(SensorDataGenerator(seed = 43), self.channelSpecs, 0, 24, False))
+		self.assertNotEqual(key, self.cache.getCacheKey(SensorDataGenerator(seed = 42), self.channelSpecs, 0, 12, False))
+		self.assertNotEqual(key, self.cache.getCacheKey(SensorDataGenerator(seed = 42), self.channelSpecs[:1], 0, 24, False))
+
+		dataGenerator = SensorDataGenerator(seed = 42)
+		dataGenerator.rng.random()
+
+		self.assertNotEqual(key, self.cache.getCacheKey(dataGenerator, self.channelSpecs, 0, 24, False))
+
+	def testUnseededNotCached(self):
+		dataSet = self.cache.getMultiChannelDataSet(SensorDataGenerator(), channelSpecs = self.channelSpecs, startHour = 0, endHour = 24)
+
+		self.assertNotIsInstance(dataSet.getDataEntries(), calcLib.memmap)
+		self.assertEqual(os.listdir(self.cachePath), [])
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,66 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import logging
+import unittest
+
+import numpy as calcLib
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorChannelSpec
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorFleetGenerator import SensorFleetGenerator
+
+class SensorFleetGeneratorTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SensorFleetGenerator. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SensorFleetGenerator class...")
+
+	def setUp(self):
+		self.channelSpecs = [ \
+			SensorChannelSpec(name = str(i), curveType = SensorDataGenerator.DEFAULT_TEMP_CURVE, minValue = i, maxValue = i + 10.0) \
+			for i in range(0, 10)]
+
+	def tearDown(self):
+		pass
+
+	def testMatchesMultiChannelDataSet(self):
+		for spec in self.channelSpecs:
+			spec.noiseLevel = SensorDataGenerator.NO_NOISE
+
+		fleetDataSet = SensorFleetGenerator(maxWorkers = 2, blockSize = 3).generateFleetDataSet( \
+			channelSpecs = self.channelSpecs, startHour = 0, endHour = 24)
+		dataSet = SensorDataGenerator().generateMultiChannelDataSet(channelSpecs = self.channelSpecs, startHour = 0, endHour = 24)
+
+		self.assertEqual(fleetDataSet.getChannelNames(), dataSet.getChannelNames())
+		self.assertTrue(calcLib.array_equal(fleetDataSet.getTimeEntries(), dataSet.getTimeEntries()))
+		self.assertTrue(calcLib.allclose(fleetDataSet.getDataEntries(), dataSet.getDataEntries()))
+
+	def testReproducibleAcrossWorkerCounts(self):
+		dataEntries1 = SensorFleetGenerator(SensorDataGenerator(seed = 42), maxWorkers = 1, blockSize = 3).generateFleetDataSet( \
+			channelSpecs = self.channelSpecs, startHour = 0, endHour = 24).getDataEntries()
+		dataEntries2 = SensorFleetGenerator(SensorDataGenerator(seed = 42), maxWorkers = 2, blockSize = 3).generateFleetDataSet( \
+			channelSpecs = self.channelSpecs, startHour = 0, endHour = 24).getDataEntries()
+
+		self.assertEqual(dataEntries1.shape, (10, 24 * 60))
+		self.assertTrue(calcLib.array_equal(dataEntries1, dataEntries2))
+
+		# each block has its own noise stream
+		self.assertFalse(calcLib.array_equal(dataEntries1[0] - dataEntries1[0].mean(), dataEntries1[3] - dataEntries1[3].mean()))
+
+if __name__ == "__main__":
+	unittest.main()
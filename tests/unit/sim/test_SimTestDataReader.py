@@ -0,0 +1,86 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from programmingtheiot.cda.sim.SimTestDataReader import SimTestDataReader
+
+class SimTestDataReaderTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SimTestDataReader. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	SIM_TEST_DATA_FILE = \
+		os.path.join(os.path.dirname(__file__), '..', '..', '..', 'simTestData', 'PIOT_SimulatedTestData_IndoorTemperature.json')
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SimTestDataReader class...")
+
+		with open(self.SIM_TEST_DATA_FILE, 'r') as dataFile:
+			self.sensorDataList = json.load(dataFile)[SimTestDataReader.SENSOR_DATA_LIST_KEY]
+
+	def setUp(self):
+		# use a copy, so the sidecar index isn't written to the repo
+		self.tempDir  = tempfile.mkdtemp()
+		self.fileName = shutil.copy(self.SIM_TEST_DATA_FILE, self.tempDir)
+
+	def tearDown(self):
+		shutil.rmtree(self.tempDir, ignore_errors = True)
+
+	def testReadAllEntries(self):
+		# use a small chunk size to exercise entries split across reads
+		reader = SimTestDataReader(self.fileName, chunkSize = 1024)
+		count = 0
+
+		for (timeOffset, sd), entry in zip(reader.readSensorData(), self.sensorDataList):
+			self.assertEqual(timeOffset, entry[SimTestDataReader.TIME_OFFSET_KEY])
+			self.assertEqual(sd.getName(), entry['name'])
+			self.assertEqual(sd.getValue(), entry['value'])
+			self.assertEqual(sd.getTimeStamp(), entry['timeStamp'])
+			self.assertEqual(sd.getLocationID(), entry['locationID'])
+
+			count += 1
+
+		self.assertEqual(count, len(self.sensorDataList))
+		self.assertTrue(os.path.exists(reader.getIndexFileName()))
+
+	def testSeekWithIndex(self):
+		SimTestDataReader(self.fileName).buildIndex()
+
+		reader = SimTestDataReader(self.fileName)
+		self.assertTrue(reader.hasIndex())
+
+		startOffset = self.sensorDataList[1000][SimTestDataReader.TIME_OFFSET_KEY]
+
+		timeOffset, sd = next(reader.readSensorData(startOffsetSeconds = startOffset))
+
+		self.assertEqual(timeOffset, startOffset)
+		self.assertEqual(sd.getValue(), self.sensorDataList[1000]['value'])
+		self.assertEqual(len(list(reader.readSensorData(startOffsetSeconds = startOffset))), len(self.sensorDataList) - 1000)
+
+	def testStaleIndexIgnored(self):
+		SimTestDataReader(self.fileName).buildIndex()
+
+		with open(self.fileName, 'a') as dataFile:
+			dataFile.write('\n')
+
+		self.assertFalse(SimTestDataReader(self.fileName).hasIndex())
+
+if __name__ == "__main__":
+	unittest.main()
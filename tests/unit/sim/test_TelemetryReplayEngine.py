@@ -0,0 +1,131 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from programmingtheiot.common.IDataMessageListener import IDataMessageListener
+from programmingtheiot.cda.sim.TelemetryReplayEngine import TelemetryReplayEngine
+from programmingtheiot.data.SensorData import SensorData
+
+class TelemetryReplayEngineTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	TelemetryReplayEngine. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	SIM_TEST_DATA_FILE = \
+		os.path.join(os.path.dirname(__file__), '..', '..', '..', 'simTestData', 'PIOT_SimulatedTestData_IndoorTemperature.json')
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing TelemetryReplayEngine class...")
+
+	def setUp(self):
+		self.listener = ReplayTestListener()
+
+	def tearDown(self):
+		pass
+
+	def testMergeSources(self):
+		replayEngine = TelemetryReplayEngine(speedFactor = TelemetryReplayEngine.AS_FAST_AS_POSSIBLE)
+		replayEngine.setDataMessageListener(self.listener)
+		replayEngine.addSource(self._createSource('a', (0.0, 2.0, 4.0)))
+		replayEngine.addSource(self._createSource('b', (1.0, 3.0)))
+
+		stats = replayEngine.replay()
+
+		self.assertEqual([sd.getName() for sd in self.listener.sensorDataList], ['a', 'b', 'a', 'b', 'a'])
+		self.assertEqual(stats['messageCount'], 5)
+		self.assertGreater(stats['throughput'], 0.0)
+
+		for stageName in ('read', 'handle'):
+			self.assertGreaterEqual(stats[stageName]['max'], stats[stageName]['p50'])
+
+	def testSpeedFactor(self):
+		replayEngine = TelemetryReplayEngine(speedFactor = 10.0)
+		replayEngine.setDataMessageListener(self.listener)
+		replayEngine.addSource(self._createSource('a', (100.0, 101.0, 102.0)))
+
+		startTime = time.perf_counter()
+		stats = replayEngine.replay()
+		elapsed = time.perf_counter() - startTime
+
+		# 2 seconds of recorded time at 10x
+		self.assertGreaterEqual(elapsed, 0.2)
+		self.assertLess(elapsed, 1.0)
+		self.assertEqual(stats['messageCount'], 3)
+		self.assertLess(stats['lag']['max'], 100.0)
+
+	def testReplayJsonFile(self):
+		replayEngine = TelemetryReplayEngine(speedFactor = TelemetryReplayEngine.AS_FAST_AS_POSSIBLE, restampData = True)
+		replayEngine.setDataMessageListener(self.listener)
+		replayEngine.addJsonFile(self.SIM_TEST_DATA_FILE)
+
+		stats = replayEngine.replay(maxMessages = 100)
+
+		self.assertEqual(stats['messageCount'], 100)
+		self.assertEqual(len(self.listener.sensorDataList), 100)
+		self.assertNotEqual(self.listener.sensorDataList[0].getTimeStamp()[0:4], '2022')
+
+	def testReplayCsvFile(self):
+		tempDir = tempfile.mkdtemp()
+
+		try:
+			fileName = os.path.join(tempDir, 'sensor_log.csv')
+
+			with open(fileName, 'w') as csvFile:
+				csvFile.write('ts,sensor,value\n')
+				csvFile.write('2025-01-01T00:00:00+00:00,Temperature,21.5\n')
+				csvFile.write('2025-01-01T00:00:01.5+00:00,Humidity,40.25\n')
+
+			replayEngine = TelemetryReplayEngine(speedFactor = 100.0)
+			replayEngine.setDataMessageListener(self.listener)
+			replayEngine.addCsvFile(fileName)
+			replayEngine.replay()
+		finally:
+			shutil.rmtree(tempDir, ignore_errors = True)
+
+		self.assertEqual([sd.getName() for sd in self.listener.sensorDataList], ['Temperature', 'Humidity'])
+		self.assertEqual(self.listener.sensorDataList[1].getValue(), 40.25)
+		self.assertEqual(self.listener.sensorDataList[1].getTimeStamp(), '2025-01-01T00:00:01.5+00:00')
+
+	def testNoListener(self):
+		replayEngine = TelemetryReplayEngine()
+		replayEngine.addSource(self._createSource('a', (0.0,)))
+
+		self.assertRaises(ValueError, replayEngine.replay)
+
+	def _createSource(self, name: str, timeOffsets: tuple):
+		for timeOffset in timeOffsets:
+			yield timeOffset, SensorData(name = name)
+
+class ReplayTestListener(IDataMessageListener):
+	"""
+	Collects the replayed SensorData instances.
+
+	"""
+
+	def __init__(self):
+		self.sensorDataList = []
+
+	def handleSensorMessage(self, data: SensorData) -> bool:
+		self.sensorDataList.append(data)
+
+		return True
+
+if __name__ == "__main__":
+	unittest.main()
@@ -12,6 +12,7 @@ import unittest
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
 from programmingtheiot.cda.sim.TemperatureSensorSimTask import TemperatureSensorSimTask
 
 class TemperatureSensorSimTaskTest(unittest.TestCase):
@@ -45,6 +46,42 @@ class TemperatureSensorSimTaskTest(unittest.TestCase):
 			self.assertGreaterEqual(sd.getValue(), ConfigConst.DEFAULT_VAL)
 			logging.info("Temperature SensorData: %s", str(sd))
 			
+	def testReuseSensorData(self):
+		simTask = TemperatureSensorSimTask(reuseSensorData = True)
+		
+		sd1 = simTask.generateTelemetry()
+		sd2 = simTask.generateTelemetry()
+		
+		# double buffered - the previous reading remains valid for one call
+		self.assertIsNot(sd1, sd2)
+		
+		snapshot = sd1.copy()
+		
+		sd3 = simTask.generateTelemetry()
+		
+		self.assertIs(sd1, sd3)
+		self.assertIsNot(snapshot, sd3)
+		self.assertEqual(snapshot.getName(), ConfigConst.TEMP_SENSOR_NAME)
+		self.assertGreater(snapshot.getValue(), ConfigConst.DEFAULT_VAL)
+		
+	def testSeededTelemetry(self):
+		simTask1 = TemperatureSensorSimTask(seed = 42)
+		simTask2 = TemperatureSensorSimTask(seed = 42)
+		
+		vals1 = [simTask1.generateTelemetry().getValue() for i in range(0, 2000)]
+		vals2 = [simTask2.generateTelemetry().getValue() for i in range(0, 2000)]
+		
+		self.assertEqual(vals1, vals2)
+		self.assertNotEqual(vals1, [TemperatureSensorSimTask(seed = 43).generateTelemetry().getValue() for i in range(0, 2000)])
+		
+	def testTimeIndexedTelemetry(self):
+		dataSet = SensorDataGenerator().generateDailyIndoorTemperatureDataSet(noiseLevel = SensorDataGenerator.NO_NOISE)
+		simTask = TemperatureSensorSimTask(dataSet = dataSet, useTimeIndex = True)
+		
+		# only microseconds since the data set's start time, so close to the first entry
+		for i in range(0, 3):
+			self.assertAlmostEqual(simTask.generateTelemetry().getValue(), dataSet.getDataEntry(0), delta = 0.01)
+		
 	def testGetTelemetryValue(self):
 		val = self.tSimTask.getTelemetryValue()
 		
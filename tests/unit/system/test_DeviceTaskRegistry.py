@@ -0,0 +1,120 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import logging
+import unittest
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.cda.sim.BaseSensorSimTask import BaseSensorSimTask
+from programmingtheiot.cda.sim.HvacActuatorSimTask import HvacActuatorSimTask
+from programmingtheiot.cda.system.DeviceTaskRegistry import DeviceTaskRegistry
+
+class DeviceTaskRegistryTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	DeviceTaskRegistry. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing DeviceTaskRegistry class...")
+
+	def setUp(self):
+		self.taskRegistry = DeviceTaskRegistry()
+
+	def tearDown(self):
+		pass
+
+	def testCreateSensorTask(self):
+		# as read from a plugin section - lower-cased keys, string values
+		sensorTask = self.taskRegistry.createTask( \
+			{'class': 'BaseSensorSimTask', 'name': 'TempSensor01', 'typeid': '1013', 'minval': '18.0', 'maxval': '24.0', \
+			 'pollcyclesecs': '1.0', 'pollphasesecs': '0.5'})
+
+		self.assertIsInstance(sensorTask, BaseSensorSimTask)
+		self.assertEqual(sensorTask.getName(), 'TempSensor01')
+		self.assertEqual(sensorTask.getTypeID(), ConfigConst.TEMP_SENSOR_TYPE)
+		self.assertEqual(sensorTask.getPollCycleSecs(), 1.0)
+		self.assertEqual(sensorTask.getPhaseOffsetSecs(), 0.5)
+
+		sensorData = sensorTask.generateTelemetry()
+
+		self.assertEqual(sensorData.getName(), 'TempSensor01')
+		self.assertGreaterEqual(sensorData.getValue(), 18.0)
+		self.assertLess(sensorData.getValue(), 24.0)
+
+	def testCreateActuatorTask(self):
+		actuatorTask = self.taskRegistry.createTask( \
+			{'class': 'programmingtheiot.cda.sim.HvacActuatorSimTask.HvacActuatorSimTask', 'name': 'Hvac01'})
+
+		# the class has a fixed name and type ID, so the name is set after construction
+		self.assertIsInstance(actuatorTask, HvacActuatorSimTask)
+		self.assertEqual(actuatorTask.getName(), 'Hvac01')
+		self.assertEqual(actuatorTask.getTypeID(), ConfigConst.HVAC_ACTUATOR_TYPE)
+
+	def testFixedNameSensorTasks(self):
+		sensorTask = self.taskRegistry.createTask({'class': 'TemperatureSensorSimTask', 'name': 'TempSensor02', 'reusesensordata': 'True'})
+
+		self.assertEqual(sensorTask.getName(), 'TempSensor02')
+		self.assertEqual(sensorTask.getTypeID(), ConfigConst.TEMP_SENSOR_TYPE)
+
+		for _ in range(0, 3):
+			self.assertEqual(sensorTask.generateTelemetry().getName(), 'TempSensor02')
+
+	def testDuplicateTaskNames(self):
+		pluginConfig = PluginTestConfig({ \
+			'Sensor.Temp01': {'class': 'TemperatureSensorSimTask', 'name': 'TempSensor01'}, \
+			'Sensor.Temp02': {'class': 'TemperatureSensorSimTask', 'name': 'TempSensor02'}, \
+			'Sensor.Temp03': {'class': 'TemperatureSensorSimTask', 'name': 'TempSensor01'}, \
+			'Sensor.Temp04': {'class': 'TemperatureSensorSimTask'}})
+
+		sensorTasks = DeviceTaskRegistry(pluginConfig).createTasks(ConfigConst.SENSOR_PLUGINS_KEY)
+
+		self.assertEqual([sensorTask.getName() for sensorTask in sensorTasks], ['TempSensor01', 'TempSensor02', ConfigConst.TEMP_SENSOR_NAME])
+
+	def testLazyLoading(self):
+		# registering a class doesn't import its module
+		self.taskRegistry.registerClass('MissingTask', 'programmingtheiot.cda.missing.MissingTask.MissingTask')
+
+		self.assertRaises(ImportError, self.taskRegistry.createTask, {'class': 'MissingTask'})
+
+	def testInvalidPlugin(self):
+		self.assertRaises(ValueError, self.taskRegistry.createTask, {'name': 'TempSensor01'})
+		self.assertRaises(ValueError, self.taskRegistry.createTask, {'class': 'UnknownTask'})
+		self.assertRaises(ValueError, self.taskRegistry.createTask, {'class': 'BaseSensorSimTask', 'unknownparam': '1'})
+
+	def testNoPlugins(self):
+		self.assertFalse(self.taskRegistry.hasPlugins('unknownPlugins'))
+		self.assertEqual(self.taskRegistry.createTasks('unknownPlugins'), [])
+
+class PluginTestConfig():
+	"""
+	Minimal config listing the given plugin sections as sensor plugins.
+
+	"""
+
+	def __init__(self, pluginSections: dict):
+		self.pluginSections = pluginSections
+
+	def getProperty(self, section: str, key: str, defaultVal: str = None):
+		if section == ConfigConst.CONSTRAINED_DEVICE and key == ConfigConst.SENSOR_PLUGINS_KEY:
+			return ','.join(self.pluginSections)
+
+		return defaultVal
+
+	def getSectionProperties(self, section: str) -> dict:
+		return self.pluginSections.get(section, {})
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,109 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import logging
+import time
+import unittest
+
+from programmingtheiot.cda.system.SensorTaskScheduler import SensorTaskScheduler
+
+class SensorTaskSchedulerTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SensorTaskScheduler. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SensorTaskScheduler class...")
+
+	def setUp(self):
+		self.scheduler = SensorTaskScheduler()
+		self.runTimes = {}
+
+	def tearDown(self):
+		self.scheduler.stop()
+
+	def testMultiRateTasks(self):
+		self.scheduler.addTask(self._recordRun, periodSecs = 0.02, args = ('fast',))
+		self.scheduler.addTask(self._recordRun, periodSecs = 0.1, phaseOffsetSecs = 0.05, args = ('slow',))
+
+		startTime = time.monotonic()
+
+		self.assertTrue(self.scheduler.start())
+		self.assertFalse(self.scheduler.start())
+
+		time.sleep(0.5)
+
+		self.assertTrue(self.scheduler.stop())
+		self.assertFalse(self.scheduler.isRunning())
+
+		fastRuns = self.runTimes['fast']
+		slowRuns = self.runTimes['slow']
+
+		# loose bounds, as the timer thread competes with the test runner
+		self.assertGreaterEqual(len(fastRuns), 15)
+		self.assertLessEqual(len(fastRuns), 26)
+		self.assertGreaterEqual(len(slowRuns), 3)
+		self.assertLessEqual(len(slowRuns), 5)
+
+		self.assertLess(fastRuns[0] - startTime, 0.05)
+		self.assertGreaterEqual(slowRuns[0] - startTime, 0.05)
+
+	def testAddTaskWhileRunning(self):
+		self.scheduler.start()
+		self.scheduler.addTask(self._recordRun, periodSecs = 0.05, args = ('added',))
+
+		time.sleep(0.2)
+
+		self.scheduler.stop()
+
+		self.assertGreaterEqual(len(self.runTimes['added']), 2)
+		self.assertEqual(self.scheduler.getTaskCount(), 1)
+
+	def testFailingTask(self):
+		self.scheduler.addTask(self._failRun, periodSecs = 0.02)
+		self.scheduler.addTask(self._recordRun, periodSecs = 0.02, args = ('ok',))
+		self.scheduler.start()
+
+		time.sleep(0.1)
+
+		self.assertTrue(self.scheduler.isRunning())
+		self.assertGreaterEqual(len(self.runTimes['ok']), 2)
+
+	def testCoalesceMissedRuns(self):
+		self.scheduler.addTask(self._slowRun, periodSecs = 0.01, args = ('slow',))
+		self.scheduler.start()
+
+		time.sleep(0.3)
+
+		self.scheduler.stop()
+
+		# each run takes 5 periods, so most runs are coalesced
+		self.assertLessEqual(len(self.runTimes['slow']), 7)
+
+	def testInvalidPeriod(self):
+		self.assertRaises(ValueError, self.scheduler.addTask, self._recordRun, 0.0)
+
+	def _recordRun(self, taskName: str = None):
+		self.runTimes.setdefault(taskName, []).append(time.monotonic())
+
+	def _failRun(self):
+		raise RuntimeError("Failing task.")
+
+	def _slowRun(self, taskName: str = None):
+		self._recordRun(taskName)
+		time.sleep(0.05)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,109 @@
+#####
+#
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+#
+# Copyright (c) 2020 - 2025 by Andrew D. King
+#
+
+import logging
+import unittest
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.cda.system.TelemetryDeadbandFilter import TelemetryDeadbandFilter
+from programmingtheiot.data.SensorData import SensorData
+
+class TelemetryDeadbandFilterTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	TelemetryDeadbandFilter. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	NS_IN_SECS = 1000000000
+	START_TIME_NS = 1700000000 * NS_IN_SECS
+
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing TelemetryDeadbandFilter class...")
+
+	def setUp(self):
+		self.deadbandFilter = TelemetryDeadbandFilter()
+
+	def tearDown(self):
+		pass
+
+	def testAbsoluteDeadband(self):
+		self.deadbandFilter.setDeadband('temp', deadbandAbs = 0.5)
+
+		# compared against the last forwarded value, so slow drift is still forwarded
+		forwarded = [self.deadbandFilter.isForwarded(self._createSensorData('temp', val)) for val in (20.0, 20.2, 20.4, 20.6, 20.0)]
+
+		self.assertEqual(forwarded, [True, False, False, True, True])
+		self.assertEqual(self.deadbandFilter.getStats(), {'received': 5, 'forwarded': 3})
+
+	def testRelativeDeadband(self):
+		self.deadbandFilter.setDeadband('pressure', deadbandPct = 1.0)
+
+		forwarded = [self.deadbandFilter.isForwarded(self._createSensorData('pressure', val)) for val in (1000.0, 1009.0, 1011.0, 1000.0)]
+
+		self.assertEqual(forwarded, [True, False, True, True])
+
+	def testChangeOfValue(self):
+		self.deadbandFilter.setDeadband('humidity')
+
+		forwarded = [self.deadbandFilter.isForwarded(self._createSensorData('humidity', val)) for val in (40.0, 40.0, 40.1, 40.1)]
+
+		self.assertEqual(forwarded, [True, False, True, False])
+
+	def testMaxSilence(self):
+		self.deadbandFilter.setDeadband('temp', deadbandAbs = 0.5, maxSilenceSecs = 60.0)
+
+		forwarded = [ \
+			self.deadbandFilter.isForwarded(self._createSensorData('temp', 20.0, offsetSecs)) \
+			for offsetSecs in (0, 30, 59, 60, 90, 120)]
+
+		self.assertEqual(forwarded, [True, False, False, True, False, True])
+
+	def testErrorReadings(self):
+		self.deadbandFilter.setDeadband('temp', deadbandAbs = 0.5)
+
+		errorData = self._createSensorData('temp', 20.0)
+		errorData.setStatusCode(ConfigConst.SENSOR_READ_TIMEOUT_STATUS)
+
+		self.assertTrue(self.deadbandFilter.isForwarded(self._createSensorData('temp', 20.0)))
+		self.assertTrue(self.deadbandFilter.isForwarded(errorData))
+		self.assertTrue(self.deadbandFilter.isForwarded(errorData))
+
+		# the recovered reading has a changed status code
+		self.assertTrue(self.deadbandFilter.isForwarded(self._createSensorData('temp', 20.0)))
+
+	def testFilterSensorData(self):
+		self.deadbandFilter.setDeadband('temp', deadbandAbs = 0.5)
+		self.deadbandFilter.setDeadband('pressure', deadbandAbs = 0.5)
+
+		self.deadbandFilter.filterSensorData([self._createSensorData('temp', 20.0), self._createSensorData('pressure', 1000.0)])
+
+		dataList = self.deadbandFilter.filterSensorData( \
+			[self._createSensorData('temp', 20.1), self._createSensorData('pressure', 1001.0)])
+
+		self.assertEqual([data.getName() for data in dataList], ['pressure'])
+
+		self.deadbandFilter.reset()
+
+		self.assertEqual(self.deadbandFilter.getStats(), {'received': 0, 'forwarded': 0})
+		self.assertTrue(self.deadbandFilter.isForwarded(self._createSensorData('temp', 20.1)))
+
+	def _createSensorData(self, name: str, value: float, offsetSecs: float = 0) -> SensorData:
+		sensorData = SensorData(name = name)
+		sensorData.setValue(value)
+		sensorData.setTimeStampNs(self.START_TIME_NS + int(offsetSecs * self.NS_IN_SECS))
+
+		return sensorData
+
+if __name__ == "__main__":
+	unittest.main()